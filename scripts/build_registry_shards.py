@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Build Registry Shards Script
+
+Publish a skills registry in the sharded layout read by remote sources with
+"layout": "sharded": a small manifest plus one shard file per category or
+skill ID prefix.
+"""
+
+import sys
+import io
+import json
+from pathlib import Path
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# Add parent directory to path to import utils
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.remote_registry import write_sharded_registry
+
+
+def main():
+    """Main entry point"""
+    if len(sys.argv) < 3 or sys.argv[1] in ['--help', '-h']:
+        print("Usage: python build_registry_shards.py <registry.json> <manifest.json> [--by category|prefix]")
+        print("")
+        print("Split a registry into a shard manifest and shard files.")
+        print("")
+        print("Options:")
+        print("  --by category    One shard per skill category (default)")
+        print("  --by prefix      One shard per first character of the skill ID")
+        print("")
+        print("Example:")
+        print("  python build_registry_shards.py skills/skills-registry.json skills/registry-manifest.json")
+        print("")
+        print("Shards are written to shards/ next to the manifest.")
+        sys.exit(0 if len(sys.argv) > 1 else 1)
+
+    registry_path = Path(sys.argv[1])
+    manifest_path = Path(sys.argv[2])
+    by = "category"
+
+    i = 3
+    while i < len(sys.argv):
+        if sys.argv[i] == '--by' and i + 1 < len(sys.argv):
+            by = sys.argv[i + 1]
+            i += 2
+        else:
+            print(f"Unknown option: {sys.argv[i]}", file=sys.stderr)
+            sys.exit(1)
+
+    try:
+        with open(registry_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        manifest = write_sharded_registry(data, manifest_path, by=by)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"✅ Wrote {manifest_path} with {len(manifest['shards'])} shard(s)")
+    for name, shard in manifest['shards'].items():
+        print(f"   {shard['path']}: {shard['count']} skills")
+
+
+if __name__ == "__main__":
+    main()
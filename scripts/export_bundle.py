@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Export Bundle Script
+
+Pack the skills registry and installed skills into a single offline bundle
+for machines that can't reach GitHub. Install it there with import_bundle.py.
+"""
+
+import sys
+import io
+from pathlib import Path
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# Add parent directory to path to import utils
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.registry import SkillsRegistry, InstalledSkillsRegistry
+from utils.installer import PlanCache
+from utils.bundle import write_bundle
+from utils.catalog import format_size
+
+
+def main():
+    """Main entry point"""
+    if len(sys.argv) < 2 or sys.argv[1] in ['--help', '-h']:
+        print("Usage: python export_bundle.py <bundle.tar.gz> [skill_name ...] [--all]")
+        print("")
+        print("Write the skills registry and installed skills to an offline bundle.")
+        print("")
+        print("Options:")
+        print("  --all    Include every installed skill")
+        print("")
+        print("Without skill names or --all, only the registry is exported.")
+        print("")
+        print("Examples:")
+        print("  python export_bundle.py skills-bundle.tar.gz --all")
+        print("  python export_bundle.py skills-bundle.tar.gz pdf docx")
+        sys.exit(0 if len(sys.argv) >= 2 else 1)
+
+    output_path = Path(sys.argv[1])
+    export_all = False
+    skill_names = []
+
+    i = 2
+    while i < len(sys.argv):
+        if sys.argv[i] == '--all':
+            export_all = True
+        elif sys.argv[i].startswith('--'):
+            print(f"Unknown option: {sys.argv[i]}", file=sys.stderr)
+            sys.exit(1)
+        else:
+            skill_names.append(sys.argv[i])
+        i += 1
+
+    installed_registry = InstalledSkillsRegistry()
+    installed_registry.load()
+
+    if export_all:
+        skill_names = [skill['name'] for skill in installed_registry.list_all()]
+
+    plan_cache = PlanCache()
+    skills = {}
+    for name in skill_names:
+        installed = installed_registry.get(name)
+        if not installed:
+            print(f"❌ Skill '{name}' is not installed.")
+            sys.exit(1)
+
+        install_path = installed_registry.get_absolute_path(installed.get('install_path', ''))
+        if not install_path.is_dir():
+            print(f"❌ Installation directory of '{name}' is missing: {install_path}")
+            sys.exit(1)
+
+        skills[name] = {
+            "path": install_path,
+            "source": installed.get('source', {}),
+            "plan": plan_cache.load(name),
+        }
+
+    print(f"📦 Exporting {len(skills)} skill(s) to {output_path}...")
+
+    try:
+        manifest = write_bundle(output_path, SkillsRegistry().load(), skills)
+    except OSError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    files = sum(len(skill['files']) for skill in manifest['skills'].values())
+    print(f"✅ Bundle written: {output_path}")
+    print(f"   Skills: {len(manifest['skills'])}")
+    print(f"   Files: {files} ({manifest['blobs']} unique, {format_size(manifest['size'])})")
+    print(f"   Bundle size: {format_size(output_path.stat().st_size)}")
+    print("")
+    print("Install it on another machine with:")
+    print(f"  python import_bundle.py {output_path.name}")
+
+
+if __name__ == "__main__":
+    main()
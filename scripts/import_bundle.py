@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Import Bundle Script
+
+Install skills from an offline bundle written by export_bundle.py. The
+bundle is read in one streaming pass: its registry is merged into the local
+registry, file contents go straight into the blob store, and the skills are
+then installed from there together, with a single installed-registry write.
+"""
+
+import sys
+import io
+import shutil
+from pathlib import Path
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# Add parent directory to path to import utils
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.registry import SkillsRegistry, InstalledSkillsRegistry
+from utils.blob_store import BlobStore
+from utils.bundle import BundleReader, BundleError, is_safe_skill_name
+from utils.skill_validator import SkillValidator
+from utils.installer import (
+    PlanCache, cleanup_stale_dirs, create_staging_dir, create_skill_symlinks,
+    stage_from_blobs, swap_into_place
+)
+from utils.locking import LockManager
+from utils.catalog import InstalledCatalog
+
+
+def merge_registry(bundle_registry: dict) -> dict:
+    """
+    Merge a bundle's registry into the local registry
+
+    Args:
+        bundle_registry: Registry data from the bundle
+
+    Returns:
+        Change record from SkillsRegistry.apply_changes()
+    """
+    skills_registry = SkillsRegistry()
+
+    if not skills_registry.registry_path.exists():
+        # Typical on a fresh offline machine: the bundle's registry becomes the local one
+        skills_registry.save(dict(bundle_registry))
+        return {"added": list(bundle_registry.get('skills', {})), "changed": [], "removed": []}
+
+    local = skills_registry.load()
+
+    categories = dict(local.get('categories') or {})
+    categories.update(bundle_registry.get('categories') or {})
+
+    return skills_registry.apply_changes(
+        bundle_registry.get('skills', {}),
+        [],
+        meta={"categories": categories}
+    )
+
+
+def install_skill(name: str, entry: dict, install_path: Path, blob_store: BlobStore) -> str:
+    """
+    Install one skill from the blob store
+
+    Args:
+        name: Skill name
+        entry: Skill entry of the bundle manifest
+        install_path: Where the skill is installed
+        blob_store: Blob store holding the skill's files
+
+    Returns:
+        Empty string on success, otherwise the reason it failed
+    """
+    cleanup_stale_dirs(install_path)
+    staging_path = create_staging_dir(install_path)
+    try:
+        stage_from_blobs(blob_store, entry.get('files', {}), staging_path)
+
+        is_valid, errors = SkillValidator().validate_skill_directory(staging_path)
+        if not is_valid:
+            shutil.rmtree(staging_path, ignore_errors=True)
+            return "validation failed: " + "; ".join(str(error) for error in errors)
+
+        swap_into_place(staging_path, install_path)
+    except Exception as e:
+        shutil.rmtree(staging_path, ignore_errors=True)
+        return str(e)
+
+    return ""
+
+
+def main():
+    """Main entry point"""
+    if len(sys.argv) < 2 or sys.argv[1] in ['--help', '-h']:
+        print("Usage: python import_bundle.py <bundle.tar.gz> [skill_name ...] [options]")
+        print("")
+        print("Install skills from an offline bundle.")
+        print("")
+        print("Options:")
+        print("  --force          Reinstall skills that are already installed")
+        print("  --no-registry    Don't merge the bundle's registry into the local one")
+        print("  --list           Show the bundle's contents and exit")
+        print("")
+        print("Without skill names, every skill in the bundle is installed.")
+        print("")
+        print("Examples:")
+        print("  python import_bundle.py skills-bundle.tar.gz")
+        print("  python import_bundle.py skills-bundle.tar.gz pdf --force")
+        sys.exit(0 if len(sys.argv) >= 2 else 1)
+
+    bundle_path = Path(sys.argv[1])
+    force = False
+    merge = True
+    list_only = False
+    skill_names = []
+
+    i = 2
+    while i < len(sys.argv):
+        if sys.argv[i] == '--force':
+            force = True
+        elif sys.argv[i] == '--no-registry':
+            merge = False
+        elif sys.argv[i] == '--list':
+            list_only = True
+        elif sys.argv[i].startswith('--'):
+            print(f"Unknown option: {sys.argv[i]}", file=sys.stderr)
+            sys.exit(1)
+        else:
+            skill_names.append(sys.argv[i])
+        i += 1
+
+    if not bundle_path.is_file():
+        print(f"❌ Bundle not found: {bundle_path}")
+        sys.exit(1)
+
+    installed_registry = InstalledSkillsRegistry()
+    installed_registry.load()
+    config = installed_registry.data.get('config', {})
+    skills_base_dir = Path(config.get('local_skills_path', 'skills'))
+
+    blob_store = BlobStore()
+    lock_manager = LockManager()
+    locks = []
+
+    try:
+        with BundleReader(bundle_path) as reader:
+            bundle_skills = reader.manifest.get('skills', {})
+
+            if list_only:
+                print(f"📦 {bundle_path.name} (created {reader.manifest.get('created_at', 'unknown')})")
+                for name, entry in sorted(bundle_skills.items()):
+                    source = entry.get('source', {})
+                    commit = source.get('commit', '')[:7]
+                    print(f"   {name}  {len(entry.get('files', {}))} file(s)  {source.get('type', '')} {commit}")
+                sys.exit(0)
+
+            unknown = [name for name in skill_names if name not in bundle_skills]
+            if unknown:
+                print(f"❌ Not in bundle: {', '.join(unknown)}")
+                sys.exit(1)
+
+            selected = skill_names or sorted(bundle_skills)
+
+            # Take every skill's lock up front; skip skills that are busy or installed
+            to_install = []
+            for name in selected:
+                if installed_registry.is_installed(name) and not force:
+                    print(f"⏭️  {name}: already installed (use --force to reinstall)")
+                    continue
+                lock = lock_manager.skill_lock(name)
+                if not lock.acquire(blocking=False):
+                    print(f"⏭️  {name}: another process is installing this skill")
+                    continue
+                locks.append(lock)
+                to_install.append(name)
+
+            print(f"📦 Importing {len(to_install)} skill(s) from {bundle_path.name}...")
+
+            registry_data = reader.read_registry()
+            wanted = {
+                info['sha']
+                for name in to_install
+                for info in bundle_skills[name].get('files', {}).values()
+            }
+            blob_counts = reader.import_blobs(blob_store, wanted)
+            registry_data = registry_data or reader.registry
+
+        print(f"   Blobs: {blob_counts['stored']} stored, {blob_counts['present']} already cached")
+
+        if merge and registry_data:
+            changes = merge_registry(registry_data)
+            print(f"   Registry: {len(changes['added'])} added, {len(changes['changed'])} changed")
+
+        installed = {}
+        failed = {}
+        for name in to_install:
+            if not is_safe_skill_name(name):
+                failed[name] = "unsafe skill name"
+                continue
+            install_path = skills_base_dir / name
+            error = install_skill(name, bundle_skills[name], install_path, blob_store)
+            if error:
+                failed[name] = error
+            else:
+                installed[name] = install_path
+
+        plan_cache = PlanCache()
+        with installed_registry.batch():
+            for name, install_path in installed.items():
+                source_info = dict(bundle_skills[name].get('source', {}))
+                source_info['bundle'] = bundle_path.name
+                installed_registry.add(name, str(install_path), source_info)
+        InstalledCatalog().update(installed)
+
+        for name in installed:
+            plan = bundle_skills[name].get('plan')
+            if plan:
+                plan_cache.save(name, plan)
+            else:
+                plan_cache.remove(name)
+
+        link_counts = create_skill_symlinks(installed)
+
+    except BundleError as e:
+        print(f"❌ Invalid bundle: {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        for lock in locks:
+            lock.release()
+
+    print("")
+    for name in installed:
+        print(f"✅ {name}")
+    for name, error in failed.items():
+        print(f"❌ {name}: {error}")
+
+    print("")
+    print(f"Installed {len(installed)} skill(s), {len(failed)} failed")
+    if installed:
+        links = ", ".join(f"{count} {link_type}" for link_type, count in sorted(link_counts.items()))
+        print(f"🔗 plugin-skills/ links: {links}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,6 @@ Download and install a skill from GitHub or local directory.
 import sys
 import io
 import shutil
-import subprocess
 from pathlib import Path
 
 # Fix Windows console encoding
@@ -21,7 +20,14 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.registry import SkillsRegistry, InstalledSkillsRegistry
 from utils.github_client import GitHubClient
+from utils.remote_registry import RemoteRegistryFetcher
+from utils.blob_store import BlobStore
 from utils.skill_validator import SkillValidator
+from utils.catalog import InstalledCatalog
+from utils.installer import (
+    PlanCache, cleanup_stale_dirs, create_staging_dir, create_skill_symlink, stage_from_plan, swap_into_place
+)
+from utils.locking import LockManager, LockTimeout
 
 
 def main():
@@ -31,18 +37,21 @@ def main():
         print("")
         print("Options:")
         print("  --force        Reinstall if already installed")
+        print("  --update       Update an installed skill, downloading only changed files")
         print("  --branch <br>  Specify git branch (default: main)")
         print("  --local <path> Install from local directory instead of GitHub")
         print("")
         print("Examples:")
         print("  python install_skill.py pdf")
         print("  python install_skill.py pdf --force")
+        print("  python install_skill.py pdf --update")
         print("  python install_skill.py my-skill --local /path/to/skill")
         sys.exit(0 if len(sys.argv) >= 2 else 1)
 
     # Parse arguments
     skill_name = sys.argv[1]
     force = False
+    update = False
     branch = "main"
     local_path = None
 
@@ -51,6 +60,9 @@ def main():
         if sys.argv[i] == '--force':
             force = True
             i += 1
+        elif sys.argv[i] == '--update':
+            update = True
+            i += 1
         elif sys.argv[i] == '--branch' and i + 1 < len(sys.argv):
             branch = sys.argv[i + 1]
             i += 2
@@ -62,86 +74,91 @@ def main():
             sys.exit(1)
 
     try:
-        # Load registries
-        skills_registry = SkillsRegistry()
-        skills_registry.load()
-
-        installed_registry = InstalledSkillsRegistry()
-        installed_registry.load()
-
-        # Check if already installed
-        if installed_registry.is_installed(skill_name) and not force:
-            installed = installed_registry.get(skill_name)
-            print(f"⚠️  Skill '{skill_name}' is already installed.")
-            print(f"   Location: {installed.get('install_path')}")
-            print("")
-            print("Use --force to reinstall")
-            sys.exit(0)
-
-        # Get configuration
-        config = installed_registry.data.get('config', {})
-        skills_base_dir = Path(config.get('local_skills_path', 'skills'))
-
-        # Install from local or GitHub
-        if local_path:
-            success = install_from_local(
-                skill_name,
-                local_path,
-                skills_base_dir,
-                installed_registry
-            )
-        else:
-            # Look up skill in registry
-            skill_info = skills_registry.get_skill(skill_name)
-            if not skill_info:
-                print(f"❌ Skill '{skill_name}' not found in registry.")
+        # Hold the skill's lock for the whole install; other skills can install in parallel
+        with LockManager().skill_lock(skill_name):
+            # Load registries (skills are read lazily, one record at a time)
+            skills_registry = SkillsRegistry()
+
+            installed_registry = InstalledSkillsRegistry()
+            installed_registry.load()
+
+            # Check if already installed
+            if installed_registry.is_installed(skill_name) and not (force or update):
+                installed = installed_registry.get(skill_name)
+                print(f"⚠️  Skill '{skill_name}' is already installed.")
+                print(f"   Location: {installed.get('install_path')}")
                 print("")
-                print("Search for available skills:")
-                print(f"  python search_skills.py \"{skill_name}\"")
-                print("")
-                print("Or list all skills:")
-                print("  python search_skills.py \"\"")
-                sys.exit(1)
+                print("Use --update to fetch upstream changes, or --force to reinstall")
+                sys.exit(0)
 
-            # Validate skill source
-            source = skill_info.get('source', {})
-            source_type = source.get('type')
-
-            if source_type == 'github':
-                success = install_from_github(
-                    skill_name,
-                    skill_info,
-                    skills_base_dir,
-                    installed_registry,
-                    branch
-                )
-            elif source_type == 'local':
-                # For 'local' type in registry, get the path
-                source_path = source.get('path')
-                if not source_path:
-                    print(f"❌ Skill '{skill_name}' has invalid source configuration (missing path)")
-                    sys.exit(1)
+            # Get configuration
+            config = installed_registry.data.get('config', {})
+            skills_base_dir = Path(config.get('local_skills_path', 'skills'))
 
+            # Install from local or GitHub
+            if local_path:
                 success = install_from_local(
                     skill_name,
-                    source_path,
+                    local_path,
                     skills_base_dir,
                     installed_registry
                 )
             else:
-                print(f"❌ Unsupported source type: {source_type}")
-                sys.exit(1)
+                # Look up skill in registry
+                skill_info = skills_registry.get_skill(skill_name)
+                if not skill_info:
+                    print(f"❌ Skill '{skill_name}' not found in registry.")
+                    print("")
+                    print("Search for available skills:")
+                    print(f"  python search_skills.py \"{skill_name}\"")
+                    print("")
+                    print("Or list all skills:")
+                    print("  python search_skills.py \"\"")
+                    sys.exit(1)
 
-        if success:
-            print(f"✅ Successfully installed '{skill_name}'")
-            install_path = skills_base_dir / skill_name
-            print(f"   Location: {install_path}")
-            print("")
-            print("You can now use this skill in Claude!")
-        else:
-            print(f"❌ Failed to install '{skill_name}'")
-            sys.exit(1)
+                # Validate skill source
+                source = skill_info.get('source', {})
+                source_type = source.get('type')
+
+                if source_type == 'github':
+                    success = install_from_github(
+                        skill_name,
+                        skill_info,
+                        skills_base_dir,
+                        installed_registry,
+                        branch,
+                        update
+                    )
+                elif source_type == 'local':
+                    # For 'local' type in registry, get the path
+                    source_path = source.get('path')
+                    if not source_path:
+                        print(f"❌ Skill '{skill_name}' has invalid source configuration (missing path)")
+                        sys.exit(1)
+
+                    success = install_from_local(
+                        skill_name,
+                        source_path,
+                        skills_base_dir,
+                        installed_registry
+                    )
+                else:
+                    print(f"❌ Unsupported source type: {source_type}")
+                    sys.exit(1)
 
+            if success:
+                print(f"✅ Successfully installed '{skill_name}'")
+                install_path = skills_base_dir / skill_name
+                print(f"   Location: {install_path}")
+                print("")
+                print("You can now use this skill in Claude!")
+            else:
+                print(f"❌ Failed to install '{skill_name}'")
+                sys.exit(1)
+
+    except LockTimeout as e:
+        print(f"❌ Error: another process is still installing '{skill_name}' ({e})", file=sys.stderr)
+        sys.exit(1)
     except FileNotFoundError as e:
         print(f"❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -157,17 +174,24 @@ def install_from_github(
     skill_info: dict,
     skills_base_dir: Path,
     installed_registry: InstalledSkillsRegistry,
-    branch: str
+    branch: str,
+    update: bool = False
 ) -> bool:
     """
     Install a skill from GitHub
 
+    The new version is assembled in a staging directory and only swapped
+    into place once it has been validated. With update=True, an install
+    made from the same tree is left alone, and otherwise only the files
+    that changed since the installed commit are downloaded.
+
     Args:
         skill_name: Name of the skill
         skill_info: Skill information from registry
         skills_base_dir: Base directory for installed skills
         installed_registry: Installed skills registry
         branch: Git branch
+        update: Reuse unchanged files from the current installation
 
     Returns:
         True if successful, False otherwise
@@ -181,41 +205,77 @@ def install_from_github(
         return False
 
     install_path = skills_base_dir / skill_name
+    plan_cache = PlanCache()
+
+    installed = installed_registry.get(skill_name) if update else None
+    old_plan = plan_cache.load(skill_name) if installed and install_path.is_dir() else None
 
     print(f"📥 Downloading '{skill_name}' from GitHub...")
     print(f"   Repo: {repo}")
     print(f"   Path: {path_in_repo}")
     print(f"   Branch: {branch}")
+    bases = RemoteRegistryFetcher().github_bases()
+    if bases:
+        print(f"   Mirror: {bases['api_base'].rsplit('/github/', 1)[0]}")
     print("")
 
-    # Remove existing installation if force reinstall
-    if install_path.exists():
-        print(f"🗑️  Removing existing installation...")
-        shutil.rmtree(install_path)
+    cleanup_stale_dirs(install_path)
 
-    # Download from GitHub
-    client = GitHubClient()
-    success = client.download_directory(repo, path_in_repo, str(install_path), branch)
+    with GitHubClient(blob_store=BlobStore(), **bases) as client:
+        try:
+            plan = client.get_download_plan(repo, path_in_repo, branch)
+        except Exception as e:
+            print(f"❌ Failed to fetch repository tree: {e}")
+            return False
 
-    if not success:
-        print(f"❌ Failed to download from GitHub")
-        return False
+        installed_tree = (installed or {}).get('source', {}).get('tree_sha')
+        if plan is not None and old_plan and installed_tree == plan['tree_sha']:
+            print(f"✅ '{skill_name}' is already up to date ({plan['commit'][:7]})")
+            return True
 
-    # Validate the downloaded skill
-    print(f"🔍 Validating downloaded skill...")
-    validator = SkillValidator()
-    is_valid, errors = validator.validate_skill_directory(install_path)
+        staging_path = create_staging_dir(install_path)
+        try:
+            if plan is None:
+                print("⚠️  Repository tree is truncated, falling back to directory listing")
+                success = client.download_directory(repo, path_in_repo, str(staging_path), branch)
+                counts = None
+            else:
+                counts = stage_from_plan(client, plan, staging_path, install_path, old_plan)
+                success = counts is not None
+
+            if not success:
+                print(f"❌ Failed to download from GitHub")
+                shutil.rmtree(staging_path, ignore_errors=True)
+                return False
+
+            if counts and old_plan:
+                print(f"🔄 {counts['fetched']} file(s) changed, {counts['reused']} unchanged, "
+                      f"{counts['removed']} removed")
+            if client.stats["cached"]:
+                print(f"♻️  Reused {client.stats['cached']} unchanged file(s) from the local cache")
+
+            # Validate the staged skill before it replaces anything
+            print(f"🔍 Validating downloaded skill...")
+            validator = SkillValidator()
+            is_valid, errors = validator.validate_skill_directory(staging_path)
+
+            if not is_valid:
+                print(f"❌ Validation failed:")
+                for error in errors:
+                    print(f"   {error}")
+                print("")
+                print("Cleaning up...")
+                shutil.rmtree(staging_path, ignore_errors=True)
+                if install_path.exists():
+                    print("   Existing installation left unchanged")
+                return False
 
-    if not is_valid:
-        print(f"❌ Validation failed:")
-        for error in errors:
-            print(f"   {error}")
-        print("")
-        print("Cleaning up...")
-        shutil.rmtree(install_path)
-        return False
+            print(f"✅ Validation passed")
 
-    print(f"✅ Validation passed")
+            swap_into_place(staging_path, install_path)
+        except BaseException:
+            shutil.rmtree(staging_path, ignore_errors=True)
+            raise
 
     # Register in installed skills
     source_info = {
@@ -225,7 +285,15 @@ def install_from_github(
         "branch": branch
     }
 
+    if plan is not None:
+        source_info["commit"] = plan['commit']
+        source_info["tree_sha"] = plan['tree_sha']
+        plan_cache.save(skill_name, plan)
+    else:
+        plan_cache.remove(skill_name)
+
     installed_registry.add(skill_name, str(install_path), source_info)
+    InstalledCatalog().update({skill_name: install_path})
 
     # Create symlink for Claude Code auto-discovery
     create_skill_symlink(install_path, skill_name)
@@ -278,15 +346,21 @@ def install_from_local(
 
     print(f"✅ Validation passed")
 
-    # Copy to installation directory
+    # Copy into a staging directory, then swap it into place
     install_path = skills_base_dir / skill_name
-
-    if install_path.exists():
-        print(f"🗑️  Removing existing installation...")
-        shutil.rmtree(install_path)
+    cleanup_stale_dirs(install_path)
 
     print(f"📋 Copying files...")
-    shutil.copytree(source_dir, install_path)
+    staging_path = create_staging_dir(install_path)
+    try:
+        staging_path.rmdir()
+        shutil.copytree(source_dir, staging_path)
+        swap_into_place(staging_path, install_path)
+    except BaseException:
+        shutil.rmtree(staging_path, ignore_errors=True)
+        raise
+
+    PlanCache().remove(skill_name)
 
     # Register in installed skills
     source_info = {
@@ -295,6 +369,7 @@ def install_from_local(
     }
 
     installed_registry.add(skill_name, str(install_path), source_info)
+    InstalledCatalog().update({skill_name: install_path})
 
     # Create symlink for Claude Code auto-discovery
     create_skill_symlink(install_path, skill_name)
@@ -302,79 +377,5 @@ def install_from_local(
     return True
 
 
-def create_skill_symlink(skill_path: Path, skill_name: str) -> str:
-    """
-    Create a symlink from plugin-skills/ to the installed skill for Claude Code auto-discovery.
-
-    Implements a three-tier fallback strategy:
-    1. Symbolic link (Unix or Windows with Developer Mode)
-    2. Directory junction (Windows, no special permissions needed)
-    3. Copy (last resort, works everywhere)
-
-    Args:
-        skill_path: Path to the installed skill directory
-        skill_name: Name of the skill
-
-    Returns:
-        Type of link created: "symlink", "junction", or "copy"
-    """
-    # Get plugin-skills directory
-    script_dir = Path(__file__).parent
-    plugin_skills_dir = script_dir.parent / "plugin-skills"
-    plugin_skills_dir.mkdir(exist_ok=True)
-
-    symlink_path = plugin_skills_dir / skill_name
-
-    # Remove existing symlink or directory
-    if symlink_path.exists() or symlink_path.is_symlink():
-        if symlink_path.is_symlink():
-            symlink_path.unlink()
-        else:
-            shutil.rmtree(symlink_path)
-
-    # Try different linking methods
-    link_type = None
-
-    if sys.platform != 'win32':
-        # Unix/Linux/macOS: Use standard symbolic links
-        try:
-            symlink_path.symlink_to(skill_path.absolute())
-            link_type = "symlink"
-            print(f"✅ Created symbolic link in plugin-skills/ for Claude Code discovery")
-        except OSError as e:
-            print(f"⚠️  Could not create symlink: {e}", file=sys.stderr)
-            # Fallback to copy
-            shutil.copytree(skill_path, symlink_path)
-            link_type = "copy"
-            print(f"✅ Copied skill to plugin-skills/ for Claude Code discovery")
-    else:
-        # Windows: Try symlink → junction → copy
-        try:
-            # Try symbolic link first (requires Developer Mode or Admin)
-            symlink_path.symlink_to(skill_path.absolute())
-            link_type = "symlink"
-            print(f"✅ Created symbolic link in plugin-skills/ for Claude Code discovery")
-        except OSError:
-            try:
-                # Try directory junction (works without Developer Mode)
-                result = subprocess.run(
-                    ['mklink', '/J', str(symlink_path), str(skill_path.absolute())],
-                    shell=True,
-                    check=True,
-                    capture_output=True
-                )
-                link_type = "junction"
-                print(f"✅ Created directory junction in plugin-skills/ for Claude Code discovery")
-            except subprocess.CalledProcessError:
-                # Final fallback: copy the directory
-                shutil.copytree(skill_path, symlink_path)
-                link_type = "copy"
-                print(f"⚠️  Could not create symlink or junction on Windows")
-                print(f"✅ Copied skill to plugin-skills/ for Claude Code discovery")
-                print(f"   Note: Enable Developer Mode for symbolic links")
-
-    return link_type
-
-
 if __name__ == "__main__":
     main()
@@ -51,11 +51,35 @@ def format_skill_summary(skill: dict) -> str:
     return '\n'.join(lines)
 
 
+def format_facet(label: str, counts: dict, limit: int = 8) -> str:
+    """Format one facet's counts, e.g. 'document (12), development (30)'"""
+    values = [f"{value} ({count})" for value, count in list(counts.items())[:limit]]
+    if len(counts) > limit:
+        values.append(f"+{len(counts) - limit} more")
+    return f"{label}: {', '.join(values)}"
+
+
+def parse_count(option: str, value: str, minimum: int) -> int:
+    """Parse a numeric option, exiting on invalid values"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = minimum - 1
+    if number < minimum:
+        print(f"Invalid {option}: {value}", file=sys.stderr)
+        sys.exit(1)
+    return number
+
+
 def main():
     """Main entry point"""
     # Parse arguments
     category = None
     source_type = None
+    tag = None
+    author = None
+    offset = 0
+    limit = None
     output_json = False
     no_sync = False
 
@@ -67,6 +91,18 @@ def main():
         elif sys.argv[i] == '--source' and i + 1 < len(sys.argv):
             source_type = sys.argv[i + 1]
             i += 2
+        elif sys.argv[i] == '--tag' and i + 1 < len(sys.argv):
+            tag = sys.argv[i + 1]
+            i += 2
+        elif sys.argv[i] == '--author' and i + 1 < len(sys.argv):
+            author = sys.argv[i + 1]
+            i += 2
+        elif sys.argv[i] == '--offset' and i + 1 < len(sys.argv):
+            offset = parse_count('--offset', sys.argv[i + 1], 0)
+            i += 2
+        elif sys.argv[i] == '--limit' and i + 1 < len(sys.argv):
+            limit = parse_count('--limit', sys.argv[i + 1], 1)
+            i += 2
         elif sys.argv[i] == '--json':
             output_json = True
             i += 1
@@ -81,17 +117,15 @@ def main():
     if not no_sync:
         try:
             fetcher = RemoteRegistryFetcher()
-            if fetcher.config.get('auto_sync', {}).get('on_list_all', True):
-                remote_data = fetcher.fetch()
-                if remote_data:
-                    # Update local registry
-                    registry_obj = SkillsRegistry()
-                    local_data = registry_obj.load()
-
-                    # Merge with local
-                    merged_data = fetcher.merge_with_local(local_data, remote_data)
-                    registry_obj.save(merged_data)
-                    print()
+            auto_sync = fetcher.config.get('auto_sync', {})
+            if auto_sync.get('enabled', True) and auto_sync.get('on_list_all', True):
+                if auto_sync.get('background', True):
+                    # Answer from the local registry now; a detached refresher updates it
+                    fetcher.refresh_in_background()
+                else:
+                    changes = fetcher.sync(SkillsRegistry())
+                    if changes and changes.get('seq'):
+                        print()
         except Exception as e:
             # Don't fail if remote sync fails
             pass
@@ -99,32 +133,61 @@ def main():
     # Load registry and get all skills
     try:
         registry = SkillsRegistry()
-        # Search with empty string to get all skills, then filter
-        results = registry.search("", category=category, source_type=source_type)
+        # One pass over the index resolves the filters, the page and the facet counts
+        page = registry.browse(
+            category=category, source_type=source_type, tag=tag, author=author,
+            offset=offset, limit=limit
+        )
+        results = page['skills']
 
         if output_json:
-            # Output as JSON
-            print(json.dumps(results, indent=2, ensure_ascii=False))
+            # Output as JSON, with what a caller needs to page and filter further
+            output = {
+                'total': page['total'],
+                'offset': offset,
+                'skills': results,
+                'facets': page['facets'],
+            }
+            print(json.dumps(output, indent=2, ensure_ascii=False))
         else:
             # Output as formatted text
-            if not results:
+            if not page['total']:
                 print("❌ No skills found")
                 if category:
                     print(f"   in category '{category}'")
                 if source_type:
                     print(f"   from source '{source_type}'")
+                if tag:
+                    print(f"   with tag '{tag}'")
+                if author:
+                    print(f"   by author '{author}'")
                 print("")
                 print("Try:")
                 print("  - Running '/skills list-all' without filters")
                 print("  - Checking the registry file")
             else:
-                print(f"📦 All Available Skills ({len(results)}):")
+                print(f"📦 All Available Skills ({page['total']}):")
+                facets = page['facets']
+                print(f"   {format_facet('📁 Categories', facets['category'])}")
+                print(f"   {format_facet('🔗 Sources', facets['source'])}")
+                if facets['author']:
+                    print(f"   {format_facet('👤 Authors', facets['author'])}")
+                if facets['tag']:
+                    print(f"   {format_facet('🏷️  Tags', facets['tag'])}")
+                if len(results) < page['total']:
+                    if results:
+                        print(f"   Showing {offset + 1}-{offset + len(results)} of {page['total']}")
+                    else:
+                        print(f"   No skills past --offset {offset} (of {page['total']})")
                 print("")
 
-                for i, skill in enumerate(results, 1):
+                for i, skill in enumerate(results, offset + 1):
                     print(f"{i}. {format_skill_summary(skill)}")
                     print("")
 
+                if offset + len(results) < page['total']:
+                    print(f"💡 Tip: Use '--offset {offset + len(results)}' to see the next page")
+
                 print(f"💡 Tip: Use '/skills install <name>' to install a skill")
                 print(f"💡 Tip: Use '/skills list' to see installed skills")
 
@@ -19,11 +19,12 @@ if sys.platform == 'win32':
 sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.registry import InstalledSkillsRegistry
-from utils.skill_validator import SkillValidator
+from utils.skill_validator import validate_all
+from utils.catalog import InstalledCatalog, format_size
 
 
-def format_installed_skill(skill: dict, index: int, registry: InstalledSkillsRegistry) -> str:
-    """Format an installed skill for display"""
+def format_installed_skill(skill: dict, index: int, registry: InstalledSkillsRegistry, entry: dict = None) -> str:
+    """Format an installed skill for display, with its catalog entry if there is one"""
     name = skill.get('name', 'Unknown')
     install_path = skill.get('install_path', 'Unknown')
 
@@ -53,14 +54,29 @@ def format_installed_skill(skill: dict, index: int, registry: InstalledSkillsReg
     # Status indicator
     status = "✅ Valid" if is_valid else "❌ Invalid"
 
-    lines = [
-        f"{index}. 📦 {name}",
+    lines = [f"{index}. 📦 {name}"]
+
+    if entry:
+        description = str(entry.get('metadata', {}).get('description') or '')
+        if len(description) > 80:
+            description = description[:77] + "..."
+        if description:
+            lines.append(f"   {description}")
+
+    lines += [
         f"   📁 Path: {absolute_path}",
         f"   📅 Installed: {installed_str}",
         f"   🔗 Source: {source_type} ({source_info})",
-        f"   {status}",
     ]
 
+    if entry:
+        lines.append(
+            f"   📊 Size: {entry.get('file_count', 0)} files, {format_size(entry.get('size', 0))}, "
+            f"~{entry.get('body_tokens', 0)} tokens"
+        )
+
+    lines.append(f"   {status}")
+
     return '\n'.join(lines)
 
 
@@ -71,22 +87,39 @@ def main():
         print("")
         print("Options:")
         print("  --validate    Validate all installed skills and show details")
+        print("  --no-cache    With --validate, re-check skills that haven't changed")
+        print("  --jobs <n>    With --validate, validate n skills at once in worker processes (default: 1)")
         print("  --json        Output as JSON")
         print("")
         print("Examples:")
         print("  python list_skills.py")
         print("  python list_skills.py --validate")
+        print("  python list_skills.py --validate --no-cache --jobs 8")
         sys.exit(0)
 
     # Parse arguments
     validate = False
+    use_cache = True
+    jobs = 1
     output_json = False
 
-    for arg in sys.argv[1:]:
+    i = 1
+    while i < len(sys.argv):
+        arg = sys.argv[i]
         if arg == '--validate':
             validate = True
+        elif arg == '--no-cache':
+            use_cache = False
+        elif arg == '--jobs' and i + 1 < len(sys.argv):
+            try:
+                jobs = max(1, int(sys.argv[i + 1]))
+            except ValueError:
+                print(f"Invalid --jobs value: {sys.argv[i + 1]}", file=sys.stderr)
+                sys.exit(1)
+            i += 1
         elif arg == '--json':
             output_json = True
+        i += 1
 
     try:
         # Load installed skills registry
@@ -95,10 +128,17 @@ def main():
 
         skills = installed_registry.list_all()
 
+        # Metadata comes from the catalog, not from each skill's SKILL.md
+        catalog = InstalledCatalog().sync({
+            skill['name']: installed_registry.get_absolute_path(skill['install_path'])
+            for skill in skills if skill.get('install_path')
+        })
+
         if output_json:
             # Output as JSON
             import json
-            print(json.dumps(skills, indent=2, ensure_ascii=False))
+            output = [dict(skill, catalog=catalog.get(skill['name'])) for skill in skills]
+            print(json.dumps(output, indent=2, ensure_ascii=False))
         else:
             # Output as formatted text
             if not skills:
@@ -115,29 +155,42 @@ def main():
 
                 # Validate if requested
                 if validate:
-                    validator = SkillValidator()
                     print("🔍 Validating installed skills...")
                     print("")
 
-                for i, skill in enumerate(skills, 1):
-                    # Re-validate if requested
-                    if validate:
+                    paths = {}
+                    for skill in skills:
                         install_path_relative = skill.get('install_path')
                         if install_path_relative:
                             # Convert to absolute path for validation
-                            install_path = installed_registry.get_absolute_path(install_path_relative)
-                            is_valid, errors = validator.validate_skill_directory(str(install_path))
+                            install_path = str(installed_registry.get_absolute_path(install_path_relative))
+                            paths[install_path] = skill
+
+                    cache = {}
+                    if use_cache:
+                        cache = {
+                            path: skill['validation_cache']
+                            for path, skill in paths.items() if skill.get('validation_cache')
+                        }
+
+                    # Validity updates are committed with a single write
+                    with installed_registry.batch():
+                        for path, is_valid, errors, cache_entry in validate_all(paths, jobs, cache, processes=True):
+                            skill = paths[path]
                             skill['is_valid'] = is_valid
                             skill['validation_errors'] = [str(e) for e in errors]
 
-                            # Update in registry
-                            installed_registry.update_validity(
-                                skill['name'],
-                                is_valid,
-                                ', '.join([str(e) for e in errors]) if errors else None
-                            )
+                            # Unchanged skills keep their cached verdict; only fresh results are written
+                            if cache_entry != cache.get(path):
+                                installed_registry.update_validity(
+                                    skill['name'],
+                                    is_valid,
+                                    ', '.join([str(e) for e in errors]) if errors else None,
+                                    cache=cache_entry
+                                )
 
-                    print(format_installed_skill(skill, i, installed_registry))
+                for i, skill in enumerate(skills, 1):
+                    print(format_installed_skill(skill, i, installed_registry, catalog.get(skill['name'])))
                     print("")
 
                     # Show validation errors if any
@@ -59,21 +59,28 @@ def main():
         print("Options:")
         print("  --category <category>  Filter by category")
         print("  --source <type>        Filter by source type (github, local)")
-        print("  --json                 Output as JSON")
+        print("  --tag <tag>            Filter by tag")
+        print("  --author <name>        Filter by author")
+        print("  --limit <n>            Show only the n best matches")
+        print("  --json                 Output as JSON (with relevance scores)")
         print("  --no-sync              Skip remote registry sync")
         print("")
         print("Examples:")
         print('  python search_skills.py "pdf"')
         print('  python search_skills.py "document" --category document')
         print('  python search_skills.py "art" --source github --json')
+        print('  python search_skills.py "pptx presentation" --limit 5')
         sys.exit(1)
 
     # Parse arguments
     query = sys.argv[1]
     category = None
     source_type = None
+    tag = None
+    author = None
     output_json = False
     no_sync = False
+    limit = None
 
     i = 2
     while i < len(sys.argv):
@@ -83,6 +90,21 @@ def main():
         elif sys.argv[i] == '--source' and i + 1 < len(sys.argv):
             source_type = sys.argv[i + 1]
             i += 2
+        elif sys.argv[i] == '--tag' and i + 1 < len(sys.argv):
+            tag = sys.argv[i + 1]
+            i += 2
+        elif sys.argv[i] == '--author' and i + 1 < len(sys.argv):
+            author = sys.argv[i + 1]
+            i += 2
+        elif sys.argv[i] == '--limit' and i + 1 < len(sys.argv):
+            try:
+                limit = int(sys.argv[i + 1])
+            except ValueError:
+                limit = -1
+            if limit < 1:
+                print(f"Invalid --limit: {sys.argv[i + 1]}", file=sys.stderr)
+                sys.exit(1)
+            i += 2
         elif sys.argv[i] == '--json':
             output_json = True
             i += 1
@@ -97,17 +119,15 @@ def main():
     if not no_sync:
         try:
             fetcher = RemoteRegistryFetcher()
-            if fetcher.config.get('auto_sync', {}).get('on_search', True):
-                remote_data = fetcher.fetch()
-                if remote_data:
-                    # Update local registry
-                    registry_obj = SkillsRegistry()
-                    local_data = registry_obj.load()
-
-                    # Merge with local
-                    merged_data = fetcher.merge_with_local(local_data, remote_data)
-                    registry_obj.save(merged_data)
-                    print()
+            auto_sync = fetcher.config.get('auto_sync', {})
+            if auto_sync.get('enabled', True) and auto_sync.get('on_search', True):
+                if auto_sync.get('background', True):
+                    # Answer from the local registry now; a detached refresher updates it
+                    fetcher.refresh_in_background()
+                else:
+                    changes = fetcher.sync(SkillsRegistry())
+                    if changes and changes.get('seq'):
+                        print()
         except Exception as e:
             # Don't fail if remote sync fails
             pass
@@ -115,11 +135,18 @@ def main():
     # Load registry and search
     try:
         registry = SkillsRegistry()
-        results = registry.search(query, category=category, source_type=source_type)
+        scored = registry.search_scored(
+            query, category=category, source_type=source_type, limit=limit, tag=tag, author=author
+        )
+        results = [skill for skill, _ in scored]
 
         if output_json:
-            # Output as JSON
-            print(json.dumps(results, indent=2, ensure_ascii=False))
+            # Output as JSON, with each skill's relevance score
+            output = [
+                dict(skill, score=round(score, 4) if score is not None else None)
+                for skill, score in scored
+            ]
+            print(json.dumps(output, indent=2, ensure_ascii=False))
         else:
             # Output as formatted text
             if not results:
@@ -128,10 +155,14 @@ def main():
                     print(f"   in category '{category}'")
                 if source_type:
                     print(f"   from source '{source_type}'")
+                if tag:
+                    print(f"   with tag '{tag}'")
+                if author:
+                    print(f"   by author '{author}'")
                 print("")
                 print("Try:")
                 print("  - Using a more general search term")
-                print("  - Removing --category or --source filters")
+                print("  - Removing --category, --source, --tag or --author filters")
                 print("  - Running 'python list_skills.py' to see all available skills")
             else:
                 print(f"✅ Found {len(results)} skill(s) matching '{query}':")
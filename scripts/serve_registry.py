@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Serve Registry Script
+
+Run a caching HTTP mirror of the remote registry and of GitHub, so a fleet
+of machines talks to one local process instead of each hitting GitHub.
+Clients add a source with "type": "mirror" to remote-registry-config.json;
+installs and updates then fetch skill trees and files through it as well.
+"""
+
+import sys
+import io
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# Add parent directory to path to import utils
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.mirror import UpstreamCache
+from utils.remote_registry import RemoteRegistryFetcher
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8780
+
+# Seconds between upstream registry syncs
+DEFAULT_REFRESH = 300
+
+UPSTREAMS = {
+    "/github/api/": "https://api.github.com/",
+    "/github/raw/": "https://raw.githubusercontent.com/",
+}
+
+# Upstream paths proxied when requests carry the operator's GITHUB_TOKEN:
+# only what installs and updates fetch, so the mirror can't be used to make
+# arbitrary API calls on the token's behalf
+TOKEN_PATHS = {
+    "/github/api/": re.compile(r"repos/[^/]+/[^/]+/(commits|git/trees|git/blobs|contents|zipball)(/.*)?"),
+    "/github/raw/": re.compile(r"[^/]+/[^/]+/[^/]+/.+"),
+}
+
+
+def token_allows(prefix: str, path: str) -> bool:
+    """
+    Check whether an upstream path may be fetched with the operator's token
+
+    Args:
+        prefix: Proxy prefix the request matched (a key of UPSTREAMS)
+        path: Request path after the prefix, without the query string
+
+    Returns:
+        True if the path is on the allowlist
+    """
+    path = unquote(path)
+    if any(segment in ('.', '..') for segment in path.split('/')):
+        return False
+    return TOKEN_PATHS[prefix].fullmatch(path) is not None
+
+
+def mirror_fetcher(config_path: str, state_dir: Path) -> RemoteRegistryFetcher:
+    """
+    Create the fetcher that keeps the mirror's registry current
+
+    The upstream sources are taken from `config_path`, but everything a
+    fetch writes (merged and per-source caches, last check, source status)
+    lives under `state_dir`. A local sync() in the same checkout diffs
+    against the shared files, so the mirror must never update them.
+
+    Args:
+        config_path: Upstream remote registry config (None for the default)
+        state_dir: Directory for the mirror's own config and caches
+
+    Returns:
+        RemoteRegistryFetcher working in `state_dir`
+    """
+    upstream = RemoteRegistryFetcher(config_path)
+    fetcher = RemoteRegistryFetcher(Path(state_dir) / "remote-registry-config.json")
+    fetcher.config['sources'] = upstream.config.get('sources', [])
+    fetcher.save_config()
+    return fetcher
+
+
+class RegistryMirror:
+    """Keeps the merged remote registry current and describes it for serving"""
+
+    def __init__(self, fetcher: RemoteRegistryFetcher, refresh: float):
+        self.fetcher = fetcher
+        self.refresh = refresh
+        self._stop = threading.Event()
+        self._etag = None
+        self._fingerprint = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Sync now and then every `refresh` seconds in a daemon thread"""
+        thread = threading.Thread(target=self._run, daemon=True)
+        thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                data = self.fetcher.fetch(force=True)
+                if data:
+                    self.fetcher.persist(data)
+            except Exception as e:
+                print(f"⚠️  Registry sync failed: {e}", file=sys.stderr)
+            if self._stop.wait(self.refresh):
+                return
+
+    def current(self):
+        """
+        Get the registry file and its ETag
+
+        Returns:
+            (path, etag), or (None, None) before the first successful sync
+        """
+        path = self.fetcher.cache_path
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None, None
+
+        with self._lock:
+            fingerprint = (stat.st_mtime_ns, stat.st_size)
+            if fingerprint != self._fingerprint:
+                with open(path, 'rb') as f:
+                    self._etag = f'"{hashlib.sha256(f.read()).hexdigest()}"'
+                self._fingerprint = fingerprint
+            return path, self._etag
+
+
+class MirrorHandler(BaseHTTPRequestHandler):
+    """Serves /registry.json, /github/api/*, /github/raw/* and /stats"""
+
+    server_version = "skills-store-mirror"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+
+        if parts.path == "/registry.json":
+            path, etag = self.server.registry.current()
+            if path is None:
+                self._send_status(503, "Registry not synced yet")
+            else:
+                self._send_file(path, etag, "application/json")
+            return
+
+        if parts.path == "/stats":
+            body = json.dumps(self.server.upstream.stats).encode('utf-8')
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        for prefix, upstream in UPSTREAMS.items():
+            if parts.path.startswith(prefix):
+                if self.server.restricted and not token_allows(prefix, parts.path[len(prefix):]):
+                    self._send_status(403, "Path not allowed through this mirror")
+                    return
+                url = upstream + self.path[len(prefix):]
+                accept = self.headers.get("Accept") or "application/vnd.github.v3+json"
+                entry = self.server.upstream.get(url, accept)
+                if entry['status'] != 200:
+                    self._send_status(entry['status'], "Upstream error")
+                else:
+                    self._send_file(entry['body_path'], entry['etag'], entry['content_type'])
+                return
+
+        self._send_status(404, "Not found")
+
+    def _send_file(self, path: Path, etag: str, content_type: str) -> None:
+        if etag in [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            self._send_status(503, "Cache entry unavailable")
+            return
+
+        with f:
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(os.fstat(f.fileno()).st_size))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            shutil.copyfileobj(f, self.wfile)
+
+    def _send_status(self, status: int, message: str) -> None:
+        body = message.encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def main():
+    """Main entry point"""
+    if len(sys.argv) > 1 and sys.argv[1] in ['--help', '-h']:
+        print("Usage: python serve_registry.py [options]")
+        print("")
+        print("Serve a caching mirror of the remote registry and of GitHub.")
+        print("")
+        print("Options:")
+        print(f"  --host <addr>      Address to listen on (default: {DEFAULT_HOST}; 0.0.0.0 for all)")
+        print(f"  --port <port>      Port to listen on (default: {DEFAULT_PORT})")
+        print(f"  --refresh <secs>   Seconds between registry syncs (default: {DEFAULT_REFRESH})")
+        print(f"  --ttl <secs>       Seconds before branch lookups are revalidated (default: {UpstreamCache.DEFAULT_TTL})")
+        print("  --config <path>    Upstream remote registry config (default: data/remote-registry-config.json)")
+        print("  --cache-dir <dir>  Response cache and registry state (default: data/mirror-cache)")
+        print("  --verbose          Log every request")
+        print("")
+        print("Endpoints:")
+        print("  /registry.json     Merged registry of the upstream sources")
+        print("  /github/api/...    Cached api.github.com")
+        print("  /github/raw/...    Cached raw.githubusercontent.com")
+        print("  /stats             Cache hit/fetch counters")
+        print("")
+        print("Set GITHUB_TOKEN to use a token for upstream requests. With a token set,")
+        print("only repository commit, tree, blob, contents and zipball lookups and raw")
+        print("file downloads are proxied.")
+        sys.exit(0)
+
+    host = DEFAULT_HOST
+    port = DEFAULT_PORT
+    refresh = DEFAULT_REFRESH
+    ttl = UpstreamCache.DEFAULT_TTL
+    config_path = None
+    cache_dir = None
+    verbose = False
+
+    i = 1
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        if arg in ('--host', '--port', '--refresh', '--ttl', '--config', '--cache-dir') and i + 1 < len(sys.argv):
+            value = sys.argv[i + 1]
+            try:
+                if arg == '--host':
+                    host = value
+                elif arg == '--port':
+                    port = int(value)
+                elif arg == '--refresh':
+                    refresh = float(value)
+                elif arg == '--ttl':
+                    ttl = float(value)
+                elif arg == '--config':
+                    config_path = value
+                else:
+                    cache_dir = value
+            except ValueError:
+                print(f"Invalid value for {arg}: {value}", file=sys.stderr)
+                sys.exit(1)
+            i += 2
+        elif arg == '--verbose':
+            verbose = True
+            i += 1
+        else:
+            print(f"Unknown option: {arg}", file=sys.stderr)
+            sys.exit(1)
+
+    token = os.environ.get('GITHUB_TOKEN')
+    upstream = UpstreamCache(cache_dir, ttl=ttl, token=token)
+    fetcher = mirror_fetcher(config_path, upstream.cache_dir / "registry")
+    if any(s.get('type') == 'mirror' and s.get('enabled', True) for s in fetcher.config.get('sources', [])):
+        print("⚠️  The upstream config contains mirror sources; make sure none of them is this server")
+
+    registry = RegistryMirror(fetcher, refresh)
+    server = ThreadingHTTPServer((host, port), MirrorHandler)
+    server.daemon_threads = True
+    server.registry = registry
+    server.upstream = upstream
+    server.restricted = bool(token)
+    server.verbose = verbose
+
+    print(f"🪞 Serving registry mirror on http://{host}:{port}")
+    print(f"   Registry refresh: every {refresh:g}s, branch TTL: {ttl:g}s")
+    print("")
+
+    registry.start()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("")
+        print("👋 Stopping mirror")
+    finally:
+        registry.stop()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
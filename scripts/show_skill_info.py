@@ -7,6 +7,7 @@ Display detailed information about a skill from the registry or an installed ski
 
 import sys
 import io
+from itertools import islice
 from pathlib import Path
 
 # Fix Windows console encoding
@@ -19,13 +20,12 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.registry import SkillsRegistry, InstalledSkillsRegistry
 from utils.skill_validator import SkillValidator
+from utils.catalog import InstalledCatalog, format_size
 
 
 def show_registry_skill(skill_name: str):
     """Show information about a skill from the registry"""
     registry = SkillsRegistry()
-    registry.load()
-
     skill = registry.get_skill(skill_name)
 
     if not skill:
@@ -112,10 +112,28 @@ def show_installed_skill(skill_name: str):
     print("=" * 60)
     print("")
 
+    # Metadata comes from the catalog; skills installed before it existed are added now
+    catalog = InstalledCatalog()
+    entry = catalog.get(skill_name)
+    if entry is None and install_path.is_dir():
+        catalog.update({skill_name: install_path})
+        entry = catalog.get(skill_name)
+    entry = entry or {}
+    metadata = entry.get('metadata', {})
+
+    if metadata.get('description'):
+        print(f"📝 {metadata['description']}")
+        print("")
+
     print("📁 Installation:")
     print(f"   Path: {install_path}")
     print(f"   Installed: {skill.get('installed_at', 'Unknown')}")
     print(f"   Valid: {'✅ Yes' if skill.get('is_valid', True) else '❌ No'}")
+    if entry:
+        print(f"   Contents: {entry.get('file_count', 0)} files, {format_size(entry.get('size', 0))}")
+        print(f"   SKILL.md body: ~{entry.get('body_tokens', 0)} tokens")
+    if metadata.get('license'):
+        print(f"   License: {metadata['license']}")
     print("")
 
     # Source information
@@ -137,13 +155,14 @@ def show_installed_skill(skill_name: str):
         print("")
 
         try:
+            # Read one line past the preview to know whether it was truncated
             with open(skill_md_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()[:30]
+                lines = list(islice(f, 31))
 
-            for i, line in enumerate(lines, 1):
+            for i, line in enumerate(lines[:30], 1):
                 print(f"{i:3d} | {line.rstrip()}")
 
-            if len(skill_md_path.read_text(encoding='utf-8').splitlines()) > 30:
+            if len(lines) > 30:
                 print("")
                 print("... (truncated)")
 
@@ -20,6 +20,9 @@ if sys.platform == 'win32':
 sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.registry import InstalledSkillsRegistry
+from utils.installer import PlanCache
+from utils.locking import LockManager, LockTimeout
+from utils.catalog import InstalledCatalog
 
 
 def main():
@@ -41,53 +44,60 @@ def main():
     skill_name = sys.argv[1]
 
     try:
-        # Load registry
-        installed_registry = InstalledSkillsRegistry()
-        installed_registry.load()
-
-        # Check if skill is installed
-        if not installed_registry.is_installed(skill_name):
-            print(f"⚠️  Skill '{skill_name}' is not installed.")
+        # Hold the skill's lock so an install of the same skill can't interleave
+        with LockManager().skill_lock(skill_name):
+            # Load registry
+            installed_registry = InstalledSkillsRegistry()
+            installed_registry.load()
+
+            # Check if skill is installed
+            if not installed_registry.is_installed(skill_name):
+                print(f"⚠️  Skill '{skill_name}' is not installed.")
+                print("")
+                print("Installed skills:")
+                installed = installed_registry.list_all()
+                if installed:
+                    for skill in installed:
+                        print(f"  - {skill['name']}")
+                else:
+                    print("  (none)")
+                sys.exit(0)
+
+            # Get configuration
+            config = installed_registry.data.get('config', {})
+            skills_base_dir = Path(config.get('local_skills_path', 'skills'))
+
+            # Remove symlink from plugin-skills/
+            print(f"🗑️  Uninstalling '{skill_name}'...")
             print("")
-            print("Installed skills:")
-            installed = installed_registry.list_all()
-            if installed:
-                for skill in installed:
-                    print(f"  - {skill['name']}")
-            else:
-                print("  (none)")
-            sys.exit(0)
-
-        # Get configuration
-        config = installed_registry.data.get('config', {})
-        skills_base_dir = Path(config.get('local_skills_path', 'skills'))
 
-        # Remove symlink from plugin-skills/
-        print(f"🗑️  Uninstalling '{skill_name}'...")
-        print("")
-
-        remove_skill_symlink(skill_name)
+            remove_skill_symlink(skill_name)
 
-        # Remove skill files from skills/
-        skill_path = skills_base_dir / skill_name
+            # Remove skill files from skills/
+            skill_path = skills_base_dir / skill_name
 
-        if skill_path.exists():
-            print(f"🗑️  Removing skill files from skills/...")
-            shutil.rmtree(skill_path)
-            print(f"✅ Removed {skill_path}")
-        else:
-            print(f"⚠️  Skill directory not found: {skill_path}")
-            print("   (This is okay if the files were already removed manually)")
+            if skill_path.exists():
+                print(f"🗑️  Removing skill files from skills/...")
+                shutil.rmtree(skill_path)
+                print(f"✅ Removed {skill_path}")
+            else:
+                print(f"⚠️  Skill directory not found: {skill_path}")
+                print("   (This is okay if the files were already removed manually)")
 
-        # Update registry
-        print("")
-        print(f"📝 Updating installed skills registry...")
-        installed_registry.remove(skill_name)
-        print(f"✅ Removed '{skill_name}' from registry")
+            # Update registry
+            print("")
+            print(f"📝 Updating installed skills registry...")
+            installed_registry.remove(skill_name)
+            PlanCache().remove(skill_name)
+            InstalledCatalog().remove([skill_name])
+            print(f"✅ Removed '{skill_name}' from registry")
 
-        print("")
-        print(f"✅ Successfully uninstalled '{skill_name}'")
+            print("")
+            print(f"✅ Successfully uninstalled '{skill_name}'")
 
+    except LockTimeout as e:
+        print(f"❌ Error: another process is still working on '{skill_name}' ({e})", file=sys.stderr)
+        sys.exit(1)
     except Exception as e:
         print(f"❌ Error: {e}", file=sys.stderr)
         import traceback
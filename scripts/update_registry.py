@@ -2,57 +2,102 @@
 """
 Update Skills Registry
 
-Fetches latest registry from GitHub or rebuilds from awesome lists.
+Fetches the latest registry from the configured remote sources and merges it
+into the local registry. search_skills.py and list_all_skills.py start this
+script detached when the cache is stale, so they never wait for the network.
 """
 
 import sys
 import io
-import json
 from pathlib import Path
-from urllib.request import urlopen
-from urllib.error import URLError
 
 # Fix Windows console encoding
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+# Add parent directory to path to import utils
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.registry import SkillsRegistry
+from utils.remote_registry import RemoteRegistryFetcher
+
 
 def main():
     """Main entry point"""
     if len(sys.argv) > 1 and sys.argv[1] in ['--help', '-h']:
-        print("Usage: python update_registry.py")
+        print("Usage: python update_registry.py [options]")
         print("")
         print("Update the skills registry from remote sources.")
         print("")
+        print("Options:")
+        print("  --force          Fetch even if the cache TTL hasn't expired")
+        print("  --background     Start the update detached and return immediately")
+        print("  --config <path>  Remote registry config (default: data/remote-registry-config.json)")
+        print("")
         print("This script will:")
-        print("  - Fetch the latest skills-registry.json from GitHub")
-        print("  - Validate the registry format")
-        print("  - Save to data/skills-registry.json")
+        print("  - Fetch the registry from every enabled source in data/remote-registry-config.json")
+        print("  - Merge the sources by priority")
+        print("  - Apply only the added/changed/removed skills to data/skills-registry.json")
+        print("  - Record the change in data/registry-changes.jsonl")
         print("")
-        print("Note: This is a placeholder for future functionality.")
-        print("For now, manually update data/skills-registry.json")
+        print("Only one update runs at a time; a second one exits immediately.")
+        sys.exit(0)
+
+    force = False
+    background = False
+    config_path = None
+
+    i = 1
+    while i < len(sys.argv):
+        if sys.argv[i] == '--force':
+            force = True
+            i += 1
+        elif sys.argv[i] == '--background':
+            background = True
+            i += 1
+        elif sys.argv[i] == '--config' and i + 1 < len(sys.argv):
+            config_path = sys.argv[i + 1]
+            i += 2
+        else:
+            print(f"Unknown option: {sys.argv[i]}", file=sys.stderr)
+            sys.exit(1)
+
+    fetcher = RemoteRegistryFetcher(config_path)
+
+    if background:
+        if fetcher.refresh_in_background():
+            print("🚀 Started registry update in the background")
+        else:
+            print("ℹ️  Registry is fresh or an update is already running")
         sys.exit(0)
 
+    # Keep the registry next to its config (data/ by default)
+    registry = SkillsRegistry(fetcher.config_path.parent / "skills-registry.json")
+
     print("🔄 Updating skills registry...")
     print("")
 
-    # TODO: Implement actual update logic
-    # Options:
-    # 1. Fetch from GitHub repository
-    # 2. Parse awesome lists
-    # 3. Merge and validate
-    # 4. Save to data/skills-registry.json
+    try:
+        changes = fetcher.sync(registry, force=force)
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
-    print("⚠️  Registry update not yet implemented")
-    print("")
-    print("For now, manually update data/skills-registry.json:")
-    print("  1. Edit data/skills-registry.json")
-    print("  2. Add new skill entries")
-    print("  3. Validate with: python scripts/validate_registry.py")
     print("")
-    print("Or submit a PR to:")
-    print("  https://github.com/your-username/skills-store")
+    if changes is None:
+        print("⏳ Another registry update is already running")
+    elif changes.get('seq'):
+        print(f"✅ Local registry updated ({len(registry.data.get('skills', {}))} skills)")
+        print(f"   Added: {len(changes['added'])}, changed: {len(changes['changed'])}, "
+              f"removed: {len(changes['removed'])}")
+        for label, key in (("+", 'added'), ("~", 'changed'), ("-", 'removed')):
+            for skill_id in changes[key]:
+                print(f"   {label} {skill_id}")
+    else:
+        print("ℹ️  Local registry is already up to date")
+        if not force:
+            print("   Use --force to check remote sources before the cache TTL expires")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Update Skills Script
+
+Check installed GitHub skills against their remotes and update the ones that
+changed. Each repository is checked once with a conditional request, changed
+skills are downloaded concurrently (only the files that differ), validated in
+a worker pool, and all registry changes are committed together.
+"""
+
+import sys
+import io
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# Add parent directory to path to import utils
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.registry import SkillsRegistry, InstalledSkillsRegistry
+from utils.github_client import GitHubClient
+from utils.remote_registry import RemoteRegistryFetcher
+from utils.blob_store import BlobStore
+from utils.skill_validator import SkillValidator
+from utils.catalog import InstalledCatalog
+from utils.installer import (
+    PlanCache, cleanup_stale_dirs, create_staging_dir, create_skill_symlink, stage_from_plan, swap_into_place
+)
+from utils.locking import LockManager
+
+
+DEFAULT_JOBS = 4
+
+STATUS_LABELS = {
+    "updated": "✅ updated",
+    "outdated": "⬆️  outdated",
+    "current": "✔️  current",
+    "skipped": "⏭️  skipped",
+    "failed": "❌ failed",
+}
+
+
+def new_result(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Create the progress record of one installed skill"""
+    return {
+        "name": entry['name'],
+        "entry": entry,
+        "status": "current",
+        "message": "",
+        "plan": None,
+        "old_plan": None,
+        "counts": None,
+        "timings": {"check": 0.0, "download": 0.0, "validate": 0.0},
+        "install_path": None,
+        "staging_path": None,
+        "lock": None,
+    }
+
+
+def check_repository(
+    client: GitHubClient,
+    repo: str,
+    branch: str,
+    results: List[Dict[str, Any]],
+    plan_cache: PlanCache,
+    skills_registry: SkillsRegistry
+) -> None:
+    """
+    Check all installed skills of one repository branch
+
+    The branch is resolved with a conditional request; when it moved, the
+    repository tree is listed once and each skill's tree SHA compared with
+    the installed one.
+
+    Args:
+        client: GitHub client
+        repo: Repository in format "owner/repo"
+        branch: Git branch
+        results: Progress records of the skills installed from repo@branch
+        plan_cache: Cached download plans
+        skills_registry: Skills registry, for skills installed without a plan
+    """
+    start = time.monotonic()
+
+    try:
+        for result in results:
+            result['old_plan'] = plan_cache.load(result['name'])
+
+        # The ETag is only meaningful if every skill is at the commit it was issued for
+        commits = {result['entry'].get('source', {}).get('commit') for result in results}
+        etags = {(result['old_plan'] or {}).get('etag') for result in results}
+        etag = None
+        if len(commits) == 1 and None not in commits and len(etags) == 1:
+            etag = etags.pop()
+
+        commit, etag = client.resolve_commit(repo, branch, etag)
+
+        tree = None
+        for result in results:
+            source = result['entry'].get('source', {})
+            old_plan = result['old_plan']
+
+            if commit is None or (old_plan and source.get('commit') == commit):
+                result['status'] = "current"
+                continue
+
+            skill_path = (old_plan or {}).get('path')
+            if not skill_path:
+                skill_info = skills_registry.get_skill(result['name']) or {}
+                skill_path = skill_info.get('source', {}).get('path')
+            if not skill_path:
+                result['status'] = "failed"
+                result['message'] = "skill path unknown; reinstall with install_skill.py --force"
+                continue
+
+            if tree is None:
+                tree = client.get_tree(repo, commit)
+
+            try:
+                plan = client.plan_from_tree(tree, repo, skill_path, branch, commit)
+            except FileNotFoundError as e:
+                result['status'] = "failed"
+                result['message'] = str(e)
+                continue
+
+            if plan is None:
+                result['status'] = "failed"
+                result['message'] = "repository tree is truncated; update with install_skill.py --force"
+                continue
+
+            plan['etag'] = etag
+            result['plan'] = plan
+
+            if old_plan and source.get('tree_sha') == plan['tree_sha']:
+                # The branch moved but this skill didn't: only record the new commit
+                result['status'] = "current"
+            else:
+                result['status'] = "outdated"
+
+    except Exception as e:
+        for result in results:
+            result['status'] = "failed"
+            result['message'] = f"check failed: {e}"
+
+    elapsed = time.monotonic() - start
+    for result in results:
+        result['timings']['check'] = elapsed
+
+
+def stage_update(client: GitHubClient, result: Dict[str, Any], lock_manager: LockManager) -> None:
+    """
+    Download a changed skill into a staging directory
+
+    The skill's lock is taken without waiting and stays held (in
+    result['lock']) until the registry has been updated.
+
+    Args:
+        client: GitHub client
+        result: Progress record of an outdated skill
+        lock_manager: Lock manager
+    """
+    lock = lock_manager.skill_lock(result['name'])
+    if not lock.acquire(blocking=False):
+        result['status'] = "skipped"
+        result['message'] = "another process is installing this skill"
+        return
+    result['lock'] = lock
+
+    start = time.monotonic()
+    install_path = result['install_path']
+    staging_path = None
+    try:
+        cleanup_stale_dirs(install_path)
+        staging_path = create_staging_dir(install_path)
+        reuse_from = install_path if install_path.is_dir() else None
+        counts = stage_from_plan(client, result['plan'], staging_path, reuse_from, result['old_plan'])
+    except Exception as e:
+        print(f"Error downloading '{result['name']}': {e}")
+        counts = None
+
+    result['timings']['download'] = time.monotonic() - start
+
+    if counts is None:
+        if staging_path is not None:
+            shutil.rmtree(staging_path, ignore_errors=True)
+        result['status'] = "failed"
+        result['message'] = "download failed"
+        return
+
+    result['counts'] = counts
+    result['staging_path'] = staging_path
+
+
+def validate_and_swap(result: Dict[str, Any]) -> None:
+    """
+    Validate a staged skill and swap it into place
+
+    Args:
+        result: Progress record of a staged skill
+    """
+    start = time.monotonic()
+    staging_path = result['staging_path']
+
+    try:
+        is_valid, errors = SkillValidator().validate_skill_directory(staging_path)
+        if not is_valid:
+            result['status'] = "failed"
+            result['message'] = "validation failed: " + "; ".join(str(error) for error in errors)
+            return
+
+        swap_into_place(staging_path, result['install_path'])
+        result['status'] = "updated"
+    except Exception as e:
+        result['status'] = "failed"
+        result['message'] = str(e)
+    finally:
+        if result['status'] != "updated":
+            shutil.rmtree(staging_path, ignore_errors=True)
+        result['timings']['validate'] = time.monotonic() - start
+
+
+def format_changes(result: Dict[str, Any]) -> str:
+    """Format a skill's file counts for the report"""
+    counts = result['counts']
+    if not counts:
+        return "-"
+    return f"{counts['fetched']}↓ {counts['reused']}= {counts['removed']}✗"
+
+
+def print_report(results: List[Dict[str, Any]], elapsed: float) -> None:
+    """Print the per-skill timing report"""
+    width = max([len(result['name']) for result in results] + [5])
+
+    print(f"{'Skill':<{width}}  {'Status':<13} {'Files':<13} {'Check':>7} {'Download':>9} {'Validate':>9}")
+    print("-" * (width + 57))
+
+    for result in results:
+        timings = result['timings']
+        print(
+            f"{result['name']:<{width}}  {STATUS_LABELS[result['status']]:<13} {format_changes(result):<13} "
+            f"{timings['check']:>6.2f}s {timings['download']:>8.2f}s {timings['validate']:>8.2f}s"
+        )
+        if result['message']:
+            print(f"{'':<{width}}  {result['message']}")
+
+    counts = {}
+    for result in results:
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+
+    print("")
+    summary = ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+    print(f"📊 {summary} ({elapsed:.2f}s)")
+
+
+def main():
+    """Main entry point"""
+    if len(sys.argv) < 2 or sys.argv[1] in ['--help', '-h']:
+        print("Usage: python update_skills.py (--all | <skill_name>...) [options]")
+        print("")
+        print("Options:")
+        print("  --all          Update every installed skill")
+        print("  --check        Only report which skills have updates")
+        print(f"  --jobs <n>     Skills downloaded/validated concurrently (default: {DEFAULT_JOBS})")
+        print("")
+        print("Examples:")
+        print("  python update_skills.py --all")
+        print("  python update_skills.py --all --check")
+        print("  python update_skills.py pdf docx")
+        sys.exit(0 if len(sys.argv) >= 2 else 1)
+
+    update_all = False
+    check_only = False
+    jobs = DEFAULT_JOBS
+    names = []
+
+    i = 1
+    while i < len(sys.argv):
+        if sys.argv[i] == '--all':
+            update_all = True
+            i += 1
+        elif sys.argv[i] == '--check':
+            check_only = True
+            i += 1
+        elif sys.argv[i] == '--jobs' and i + 1 < len(sys.argv):
+            try:
+                jobs = max(1, int(sys.argv[i + 1]))
+            except ValueError:
+                print(f"Invalid --jobs value: {sys.argv[i + 1]}", file=sys.stderr)
+                sys.exit(1)
+            i += 2
+        elif sys.argv[i].startswith('--'):
+            print(f"Unknown option: {sys.argv[i]}", file=sys.stderr)
+            sys.exit(1)
+        else:
+            names.append(sys.argv[i])
+            i += 1
+
+    if not update_all and not names:
+        print("❌ Specify --all or at least one skill name", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        installed_registry = InstalledSkillsRegistry()
+        installed_registry.load()
+
+        if update_all:
+            entries = installed_registry.list_all()
+        else:
+            entries = []
+            for name in names:
+                entry = installed_registry.get(name)
+                if entry is None:
+                    print(f"❌ Skill '{name}' is not installed.", file=sys.stderr)
+                    sys.exit(1)
+                entries.append(entry)
+
+        if not entries:
+            print("📦 No skills installed.")
+            sys.exit(0)
+
+        config = installed_registry.data.get('config', {})
+        skills_base_dir = Path(config.get('local_skills_path', 'skills'))
+
+        plan_cache = PlanCache()
+        skills_registry = SkillsRegistry()
+        lock_manager = LockManager()
+
+        results = [new_result(entry) for entry in sorted(entries, key=lambda e: e['name'])]
+        for result in results:
+            install_path = result['entry'].get('install_path')
+            result['install_path'] = (
+                installed_registry.get_absolute_path(install_path) if install_path
+                else skills_base_dir / result['name']
+            )
+
+        # Group GitHub skills by repository branch: one conditional request each
+        groups = {}
+        for result in results:
+            source = result['entry'].get('source', {})
+            if source.get('type') != 'github' or not source.get('repo'):
+                result['status'] = "skipped"
+                result['message'] = f"{source.get('type', 'unknown')} source"
+                continue
+            key = (source['repo'], source.get('branch') or 'main')
+            groups.setdefault(key, []).append(result)
+
+        print(f"🔄 Checking {len(results)} installed skill(s) for updates...")
+        print("")
+
+        start = time.monotonic()
+
+        try:
+            with GitHubClient(blob_store=BlobStore(), **RemoteRegistryFetcher().github_bases()) as client:
+                with ThreadPoolExecutor(max_workers=jobs) as executor:
+                    futures = [
+                        executor.submit(
+                            check_repository, client, repo, branch, group, plan_cache, skills_registry
+                        )
+                        for (repo, branch), group in groups.items()
+                    ]
+                    for future in futures:
+                        future.result()
+
+                outdated = [result for result in results if result['status'] == "outdated"]
+
+                if not check_only and outdated:
+                    # Downloads feed a separate validation pool as they finish
+                    with ThreadPoolExecutor(max_workers=jobs) as downloads, \
+                            ThreadPoolExecutor(max_workers=jobs) as validations:
+                        staged = {
+                            downloads.submit(stage_update, client, result, lock_manager): result
+                            for result in outdated
+                        }
+                        checks = []
+                        for future in as_completed(staged):
+                            future.result()
+                            result = staged[future]
+                            if result['staging_path'] is not None:
+                                checks.append(validations.submit(validate_and_swap, result))
+                        for future in checks:
+                            future.result()
+
+            # Commit every registry change at once
+            to_record = [
+                result for result in results
+                if result['plan'] is not None and result['status'] in ("updated", "current")
+            ]
+            if not check_only and to_record:
+                with installed_registry.batch():
+                    for result in to_record:
+                        source_info = dict(result['entry'].get('source', {}))
+                        source_info["commit"] = result['plan']['commit']
+                        source_info["tree_sha"] = result['plan']['tree_sha']
+                        installed_registry.add(result['name'], str(result['install_path']), source_info)
+                for result in to_record:
+                    plan_cache.save(result['name'], result['plan'])
+                InstalledCatalog().update({
+                    result['name']: result['install_path']
+                    for result in to_record if result['status'] == "updated"
+                })
+
+            for result in results:
+                if result['status'] != "updated":
+                    continue
+                # Symlinks follow the swapped directory; copies and junctions need refreshing
+                link_path = Path(__file__).parent.parent / "plugin-skills" / result['name']
+                if not link_path.is_symlink():
+                    create_skill_symlink(result['install_path'], result['name'])
+        finally:
+            for result in results:
+                if result['lock'] is not None:
+                    result['lock'].release()
+
+        print_report(results, time.monotonic() - start)
+
+        if any(result['status'] == "failed" for result in results):
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""
+Blob Store Module
+
+This module implements a local content-addressed cache of skill files,
+keyed by git blob SHA. Reinstalling or updating a skill only downloads
+blobs that changed, and identical files shared by several skills are
+downloaded once. Installed files are reflink clones of the cached objects
+where the filesystem supports it (Btrfs, XFS, ...), so they share storage
+with the cache until one side is modified; elsewhere they are plain copies.
+Either way, editing an installed skill never changes what the cache serves.
+"""
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from .github_client import git_blob_sha, git_blob_sha_file
+
+
+# Linux ioctl that makes a file share another file's data blocks copy-on-write
+FICLONE = 0x40049409
+
+
+def clone_file(source: Path, dest: Path) -> bool:
+    """
+    Create `dest` as a reflink clone of `source`
+
+    Args:
+        source: Existing file
+        dest: New file path (must not exist)
+
+    Returns:
+        True if the clone was made, False if the platform or filesystem
+        doesn't support it (nothing is left at `dest`)
+    """
+    if fcntl is None or not sys.platform.startswith('linux'):
+        return False
+
+    try:
+        with open(source, 'rb') as src, open(dest, 'xb') as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                return True
+            except OSError:
+                pass
+    except OSError:
+        return False
+
+    try:
+        os.unlink(dest)
+    except OSError:
+        pass
+    return False
+
+
+class BlobStore:
+    """Content-addressed store of file blobs keyed by git blob SHA"""
+
+    def __init__(self, root: str = None):
+        """
+        Initialize the blob store
+
+        Args:
+            root: Store directory (default: data/blob-cache)
+        """
+        if root is None:
+            project_root = Path(__file__).parent.parent.parent
+            root = project_root / "data" / "blob-cache"
+
+        self.root = Path(root)
+
+    def object_path(self, sha: str) -> Path:
+        """
+        Get the path a blob is stored at
+
+        Args:
+            sha: Git blob SHA
+
+        Returns:
+            Path of the object file
+        """
+        return self.root / "objects" / sha[:2] / sha[2:]
+
+    def has(self, sha: str, size: Optional[int] = None, verify: bool = False) -> bool:
+        """
+        Check whether a blob is cached
+
+        Objects that don't match are discarded. The size check is free;
+        `verify` also re-hashes the content, which catches same-size edits
+        (e.g. through installs that older versions hardlinked to the cache).
+
+        Args:
+            sha: Git blob SHA
+            size: Expected size in bytes, if known
+            verify: Check the content against the SHA
+
+        Returns:
+            True if the blob is available
+        """
+        path = self.object_path(sha)
+        try:
+            actual_size = path.stat().st_size
+        except OSError:
+            return False
+
+        if (size is not None and actual_size != size) or (verify and git_blob_sha_file(path) != sha):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return False
+
+        return True
+
+    def put(self, data: bytes, sha: str = None) -> str:
+        """
+        Add a blob to the store
+
+        Args:
+            data: File content
+            sha: Expected git blob SHA, verified if given
+
+        Returns:
+            Git blob SHA of the content
+
+        Raises:
+            ValueError: If the content doesn't match the expected SHA
+        """
+        actual_sha = git_blob_sha(data)
+        if sha is not None and actual_sha != sha:
+            raise ValueError(f"Blob content doesn't match SHA {sha}")
+
+        path = self.object_path(actual_sha)
+        if path.exists():
+            return actual_sha
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+        return actual_sha
+
+    def put_stream(self, stream: BinaryIO, size: int, sha: str = None) -> str:
+        """
+        Add a blob from a file object without holding it in memory
+
+        Args:
+            stream: Readable binary file object positioned at the content
+            size: Content length in bytes
+            sha: Expected git blob SHA, verified if given
+
+        Returns:
+            Git blob SHA of the content
+
+        Raises:
+            ValueError: If the content doesn't match the expected SHA or size
+        """
+        if sha is not None and self.has(sha, size):
+            return sha
+
+        digest = hashlib.sha1(f"blob {size}\0".encode('ascii'))
+        written = 0
+
+        temp_dir = self.root / "objects"
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=temp_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                while True:
+                    chunk = stream.read(65536)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    written += len(chunk)
+                    f.write(chunk)
+
+            actual_sha = digest.hexdigest()
+            if written != size:
+                raise ValueError(f"Blob is {written} bytes, expected {size}")
+            if sha is not None and actual_sha != sha:
+                raise ValueError(f"Blob content doesn't match SHA {sha}")
+
+            path = self.object_path(actual_sha)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+        return actual_sha
+
+    def read(self, sha: str) -> bytes:
+        """
+        Read a blob's content
+
+        Args:
+            sha: Git blob SHA
+
+        Returns:
+            File content
+        """
+        return self.object_path(sha).read_bytes()
+
+    def materialize(self, sha: str, dest_path: Path, executable: bool = False) -> None:
+        """
+        Place a copy of a cached blob at a destination path
+
+        The file is a reflink clone when the filesystem supports it, which
+        shares the cached object's storage without sharing later edits, and a
+        full copy otherwise. It is never hardlinked: installed files are
+        writable, and an edit through a link would change the cached object
+        for every other skill using it.
+
+        Args:
+            sha: Git blob SHA
+            dest_path: Where the file should appear
+            executable: Whether the file should be executable
+        """
+        source = self.object_path(sha)
+        dest_path = Path(dest_path)
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if dest_path.exists() or dest_path.is_symlink():
+            dest_path.unlink()
+
+        if not clone_file(source, dest_path):
+            shutil.copyfile(source, dest_path)
+        if executable:
+            dest_path.chmod(dest_path.stat().st_mode | 0o111)
@@ -0,0 +1,305 @@
+"""
+Skill Bundle Module
+
+This module reads and writes offline bundles: gzipped tar archives that
+carry a registry and the files of selected skills to machines without
+network access. A bundle holds, in this order:
+
+    manifest.json    format, skills and the files of each skill
+    registry.json    the skills registry of the exporting machine
+    blobs/<sha>      file contents, keyed by git blob SHA, stored once
+
+Because the manifest comes first, a bundle can be imported in a single
+streaming pass.
+"""
+
+import io
+import json
+import os
+import re
+import tarfile
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from .github_client import git_blob_sha_file
+from .zip_stream import _safe_relative_path
+
+
+BUNDLE_FORMAT = "skills-bundle-v1"
+
+MANIFEST_NAME = "manifest.json"
+REGISTRY_NAME = "registry.json"
+BLOB_PREFIX = "blobs/"
+
+_BLOB_SHA = re.compile(r'[0-9a-f]{40}')
+
+
+class BundleError(Exception):
+    """Raised when a bundle is malformed or doesn't match its manifest"""
+
+
+def scan_skill_files(skill_path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    List the files of a skill directory in download-plan form
+
+    Args:
+        skill_path: Skill directory
+
+    Returns:
+        Map of relative POSIX path -> {'sha', 'size', 'mode'}
+    """
+    files = {}
+    for root, dirs, names in os.walk(skill_path):
+        dirs.sort()
+        for name in sorted(names):
+            path = Path(root) / name
+            if path.is_symlink() or not path.is_file():
+                continue
+            stat = path.stat()
+            files[path.relative_to(skill_path).as_posix()] = {
+                "sha": git_blob_sha_file(path),
+                "size": stat.st_size,
+                "mode": "100755" if stat.st_mode & 0o111 else "100644",
+            }
+    return files
+
+
+def _safe_path(path: Any):
+    """Parse a relative POSIX path from a manifest, or None if it could escape"""
+    if not isinstance(path, str) or '\\' in path:
+        return None
+    relative = _safe_relative_path(path)
+    return relative if relative is not None and relative.parts else None
+
+
+def is_safe_skill_name(name: str) -> bool:
+    """Check that a skill name is a single plain path component"""
+    relative = _safe_path(name)
+    return relative is not None and relative.parts == (name,)
+
+
+def _check_files(owner: str, files: Any) -> None:
+    """Reject file maps whose paths would leave the skill directory"""
+    if not isinstance(files, dict):
+        raise BundleError(f"Invalid file list for '{owner}'")
+    for path, info in files.items():
+        if _safe_path(path) is None:
+            raise BundleError(f"Unsafe file path in '{owner}': {path!r}")
+        if not isinstance(info, dict) or not _BLOB_SHA.fullmatch(str(info.get('sha', ''))):
+            raise BundleError(f"Invalid blob SHA for '{owner}/{path}'")
+
+
+def check_manifest(manifest: Dict[str, Any]) -> None:
+    """
+    Validate the names and paths in a bundle manifest
+
+    Skill names become install directories and file paths are joined onto
+    them, so a crafted bundle could otherwise write outside the skills
+    directory.
+
+    Args:
+        manifest: Parsed manifest.json
+
+    Raises:
+        BundleError: If a skill name, file path or blob SHA is unsafe
+    """
+    skills = manifest.get('skills', {})
+    if not isinstance(skills, dict):
+        raise BundleError("Invalid skill list")
+
+    for name, entry in skills.items():
+        if not is_safe_skill_name(name):
+            raise BundleError(f"Unsafe skill name: {name!r}")
+        if not isinstance(entry, dict):
+            raise BundleError(f"Invalid entry for '{name}'")
+        _check_files(name, entry.get('files', {}))
+        if entry.get('plan'):
+            _check_files(name, entry['plan'].get('files', {}))
+
+
+def _add_json(tar: tarfile.TarFile, name: str, data: Any) -> None:
+    """Add a JSON document to a tar archive"""
+    payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    info = tarfile.TarInfo(name)
+    info.size = len(payload)
+    info.mtime = int(time.time())
+    info.mode = 0o644
+    tar.addfile(info, io.BytesIO(payload))
+
+
+def write_bundle(
+    output_path: Path,
+    registry_data: Dict[str, Any],
+    skills: Dict[str, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Write a bundle
+
+    Args:
+        output_path: Destination .tar.gz file (written atomically)
+        registry_data: Registry to ship
+        skills: Map of skill name -> {'path': Path, 'source': dict,
+            'plan': optional cached download plan}
+
+    Returns:
+        The bundle's manifest
+    """
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "created_at": datetime.now().isoformat(),
+        "skills": {},
+        "blobs": 0,
+        "size": 0,
+    }
+
+    # First pass: hash every file so the manifest can lead the archive
+    blob_sources = {}
+    for name, skill in sorted(skills.items()):
+        files = scan_skill_files(skill['path'])
+        entry = {"source": skill.get('source', {}), "files": files}
+
+        plan = skill.get('plan')
+        if plan and {p: (f['sha'], f['size']) for p, f in plan.get('files', {}).items()} == \
+                {p: (f['sha'], f['size']) for p, f in files.items()}:
+            # The install is unmodified, so the plan stays valid for delta updates
+            entry['plan'] = plan
+        manifest['skills'][name] = entry
+
+        for rel_path, info in files.items():
+            if info['sha'] not in blob_sources:
+                blob_sources[info['sha']] = (skill['path'] / rel_path, info['size'])
+
+    manifest['blobs'] = len(blob_sources)
+    manifest['size'] = sum(size for _, size in blob_sources.values())
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        with tarfile.open(temp_path, 'w:gz', compresslevel=6) as tar:
+            _add_json(tar, MANIFEST_NAME, manifest)
+            _add_json(tar, REGISTRY_NAME, registry_data)
+
+            for sha, (path, size) in sorted(blob_sources.items()):
+                info = tarfile.TarInfo(f"{BLOB_PREFIX}{sha}")
+                info.size = size
+                info.mtime = int(time.time())
+                info.mode = 0o644
+                with open(path, 'rb') as f:
+                    tar.addfile(info, f)
+
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+    return manifest
+
+
+class BundleReader:
+    """Reads a bundle front to back in one streaming pass"""
+
+    def __init__(self, bundle_path: Path):
+        """
+        Open a bundle and read its manifest
+
+        Args:
+            bundle_path: Path of the .tar.gz bundle
+
+        Raises:
+            BundleError: If the bundle doesn't start with a valid manifest
+        """
+        self.bundle_path = Path(bundle_path)
+        self._tar = tarfile.open(self.bundle_path, 'r|gz')
+        self._pending = None
+        self.registry = None
+
+        member = self._tar.next()
+        if member is None or member.name != MANIFEST_NAME:
+            self.close()
+            raise BundleError("Bundle doesn't start with a manifest")
+
+        self.manifest = self._read_json(member)
+        if self.manifest.get('format') != BUNDLE_FORMAT:
+            self.close()
+            raise BundleError(f"Unsupported bundle format: {self.manifest.get('format')}")
+
+        try:
+            check_manifest(self.manifest)
+        except BundleError:
+            self.close()
+            raise
+
+    def _read_json(self, member: tarfile.TarInfo) -> Any:
+        try:
+            return json.load(self._tar.extractfile(member))
+        except ValueError as e:
+            raise BundleError(f"Invalid {member.name}: {e}")
+
+    def read_registry(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the registry that follows the manifest
+
+        Returns:
+            Registry data, or None if the bundle carries no registry
+        """
+        member = self._tar.next()
+        if member is not None and member.name == REGISTRY_NAME:
+            self.registry = self._read_json(member)
+        else:
+            self._pending = member
+        return self.registry
+
+    def import_blobs(self, blob_store, wanted: Iterable[str] = None) -> Dict[str, int]:
+        """
+        Stream the remaining blobs into a blob store
+
+        Each blob is verified against its SHA as it is written.
+
+        Args:
+            blob_store: BlobStore to fill
+            wanted: Blob SHAs to keep (default: all); others are skipped
+
+        Returns:
+            Dictionary with 'stored', 'present' and 'skipped' blob counts
+        """
+        wanted = set(wanted) if wanted is not None else None
+        counts = {"stored": 0, "present": 0, "skipped": 0}
+
+        member = self._pending if self._pending is not None else self._tar.next()
+        self._pending = None
+        while member is not None:
+            if member.name == REGISTRY_NAME and self.registry is None:
+                self.registry = self._read_json(member)
+            elif member.name.startswith(BLOB_PREFIX) and member.isfile():
+                sha = member.name[len(BLOB_PREFIX):]
+                if not _BLOB_SHA.fullmatch(sha) or (wanted is not None and sha not in wanted):
+                    counts['skipped'] += 1
+                elif blob_store.has(sha, member.size, verify=True):
+                    counts['present'] += 1
+                else:
+                    try:
+                        blob_store.put_stream(self._tar.extractfile(member), member.size, sha)
+                    except ValueError as e:
+                        raise BundleError(f"Corrupt blob {sha}: {e}")
+                    counts['stored'] += 1
+            member = self._tar.next()
+
+        return counts
+
+    def close(self) -> None:
+        self._tar.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,240 @@
+"""
+Installed Skills Catalog Module
+
+This module keeps the metadata of installed skills (SKILL.md frontmatter,
+size, file count and an estimate of the body's token count) in a single
+JSON file. It is updated whenever skills are installed, updated or
+uninstalled, so listing installed skills is one file read with no YAML
+parsing.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import yaml
+
+from .fileio import atomic_write_json
+from .frontmatter import parse_frontmatter, read_frontmatter_text
+from .locking import LockManager
+from .skill_validator import scan_skill_directory
+
+
+# Rough size of a token in bytes of English markdown
+BYTES_PER_TOKEN = 4
+
+
+def format_size(size: int) -> str:
+    """
+    Format a byte count for display
+
+    Args:
+        size: Size in bytes
+
+    Returns:
+        Size with a unit, e.g. "512 B" or "1.5 MB"
+    """
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def describe_skill(skill_path: Path) -> Dict[str, Any]:
+    """
+    Collect the catalog entry of an installed skill
+
+    Args:
+        skill_path: Skill directory
+
+    Returns:
+        Dictionary with 'metadata' (frontmatter), 'size', 'file_count',
+        'body_tokens' and 'cataloged_at'
+    """
+    skill_path = Path(skill_path)
+    manifest = scan_skill_directory(skill_path)
+
+    metadata = {}
+    body_size = 0
+    skill_md = manifest['files'].get('SKILL.md')
+    if skill_md is not None:
+        try:
+            with open(skill_path / "SKILL.md", 'rb') as f:
+                frontmatter = read_frontmatter_text(f)
+                # The body is whatever follows the closing delimiter line
+                body_offset = f.tell() if frontmatter is not None else 0
+            body_size = max(0, skill_md['size'] - body_offset)
+            if frontmatter is not None:
+                parsed = parse_frontmatter(frontmatter)
+                metadata = parsed if isinstance(parsed, dict) else {}
+        except (OSError, UnicodeDecodeError, yaml.YAMLError):
+            body_size = skill_md['size']
+
+    return {
+        "metadata": metadata,
+        "size": manifest['total_size'],
+        "file_count": len(manifest['files']),
+        "body_tokens": (body_size + BYTES_PER_TOKEN - 1) // BYTES_PER_TOKEN,
+        "cataloged_at": datetime.now().isoformat(),
+    }
+
+
+class InstalledCatalog:
+    """Metadata of installed skills, kept in one JSON file"""
+
+    # Bump when the entry layout changes; older catalogs are rebuilt
+    CATALOG_VERSION = 1
+
+    def __init__(self, catalog_path: str = None):
+        """
+        Initialize the catalog
+
+        Args:
+            catalog_path: Path to the catalog file (default: data/installed-catalog.json)
+        """
+        if catalog_path is None:
+            project_root = Path(__file__).parent.parent.parent
+            catalog_path = project_root / "data" / "installed-catalog.json"
+
+        self.catalog_path = Path(catalog_path)
+        self.lock_manager = LockManager(self.catalog_path.parent / "locks")
+        self.skills: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the catalog from disk
+
+        Returns:
+            Map of skill name -> catalog entry (empty if the file is missing,
+            unreadable or from an older version)
+        """
+        try:
+            with open(self.catalog_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+
+        if not isinstance(data, dict) or data.get('version') != self.CATALOG_VERSION:
+            data = {}
+
+        self.skills = data.get('skills', {})
+        return self.skills
+
+    def _lock(self):
+        """Get the lock guarding the catalog file"""
+        return self.lock_manager.registry_lock(self.catalog_path.stem)
+
+    def _save(self) -> None:
+        """Write the catalog; must be called while holding the lock"""
+        atomic_write_json(self.catalog_path, {
+            "version": self.CATALOG_VERSION,
+            "last_updated": datetime.now().isoformat(),
+            "skills": self.skills,
+        })
+
+    def get(self, skill_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the catalog entry of a skill
+
+        Args:
+            skill_name: Name of the skill
+
+        Returns:
+            Catalog entry or None if the skill isn't cataloged
+        """
+        if self.skills is None:
+            self.load()
+
+        return self.skills.get(skill_name)
+
+    def list_all(self) -> List[Dict[str, Any]]:
+        """
+        List all catalog entries
+
+        Returns:
+            List of catalog entries, each with its skill's 'name'
+        """
+        if self.skills is None:
+            self.load()
+
+        return [dict(entry, name=name) for name, entry in self.skills.items()]
+
+    def update(self, skills: Dict[str, Path]) -> None:
+        """
+        Catalog (or re-catalog) installed skills
+
+        Args:
+            skills: Map of skill name -> install directory
+        """
+        if not skills:
+            return
+
+        # Read the skills before taking the lock; only the merge is serialized
+        entries = {name: describe_skill(path) for name, path in skills.items()}
+
+        with self._lock():
+            self.load()
+            self.skills.update(entries)
+            self._save()
+
+    def remove(self, skill_names: Iterable[str]) -> None:
+        """
+        Drop skills from the catalog
+
+        Args:
+            skill_names: Names of the uninstalled skills
+        """
+        skill_names = list(skill_names)
+        if not skill_names:
+            return
+
+        with self._lock():
+            self.load()
+            if any(name in self.skills for name in skill_names):
+                for name in skill_names:
+                    self.skills.pop(name, None)
+                self._save()
+
+    def sync(self, installed: Dict[str, Path]) -> Dict[str, Dict[str, Any]]:
+        """
+        Bring the catalog in line with the installed skills
+
+        Skills installed before the catalog existed (or by an older version)
+        are cataloged, and entries of skills that are no longer installed are
+        dropped. Nothing is written when the catalog is already complete.
+
+        Args:
+            installed: Map of installed skill name -> install directory
+
+        Returns:
+            Map of skill name -> catalog entry
+        """
+        if self.skills is None:
+            self.load()
+
+        missing = {
+            name: path for name, path in installed.items()
+            if name not in self.skills and Path(path).is_dir()
+        }
+        extra = [name for name in self.skills if name not in installed]
+        if not (missing or extra):
+            return self.skills
+
+        entries = {name: describe_skill(path) for name, path in missing.items()}
+
+        try:
+            with self._lock():
+                self.load()
+                self.skills.update(entries)
+                for name in extra:
+                    self.skills.pop(name, None)
+                self._save()
+        except OSError:
+            # Read-only data directory: use the entries without persisting them
+            self.skills.update(entries)
+            for name in extra:
+                self.skills.pop(name, None)
+
+        return self.skills
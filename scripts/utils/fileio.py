@@ -0,0 +1,127 @@
+"""
+File I/O Helpers Module
+
+This module provides small helpers for writing data files safely.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, List, Tuple
+
+
+def atomic_write_json(path: Path, data: Any, indent: int = 2, fsync: bool = False) -> None:
+    """
+    Write JSON to a file atomically
+
+    The data is written to a temporary file in the same directory and then
+    renamed over the target, so readers never observe a partially written file.
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable data
+        indent: JSON indentation (None for compact output)
+        fsync: Flush the file and its directory to stable storage
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # mkstemp creates files as 0600; keep the existing file's mode instead
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode = 0o644
+
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+    if fsync:
+        _fsync_directory(path.parent)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush a directory entry update (a no-op where directories can't be opened)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def append_json_line(path: Path, record: Any) -> None:
+    """
+    Append a JSON record as one line and flush it to stable storage
+
+    Args:
+        path: Journal file path
+        record: JSON-serializable record
+    """
+    line = json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_json_lines(path: Path) -> List[Any]:
+    """
+    Read records written by append_json_line
+
+    A torn final line (from a crash mid-append) is ignored.
+
+    Args:
+        path: Journal file path
+
+    Returns:
+        List of decoded records
+    """
+    records = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def file_fingerprint(path: Path) -> Tuple[int, int]:
+    """
+    Get a cheap fingerprint of a file
+
+    Args:
+        path: File path
+
+    Returns:
+        Tuple of (mtime_ns, size), or (0, 0) if the file doesn't exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,146 @@
+"""
+SKILL.md Frontmatter Module
+
+This module reads the YAML frontmatter at the top of SKILL.md files:
+
+    ---
+    name: pdf
+    description: ...
+    ---
+    (markdown body)
+
+Files are read line by line and only up to the closing delimiter, so the
+body is never loaded just to get at the metadata. A `---` line inside the
+body (a markdown horizontal rule) doesn't confuse the reader either.
+"""
+
+import copy
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Any, Dict, Optional, TextIO
+
+import yaml
+
+# The libyaml-backed loader is several times faster when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as FrontmatterLoader
+except ImportError:
+    from yaml import SafeLoader as FrontmatterLoader
+
+
+DELIMITER = '---'
+
+# Parsed metadata of this many SKILL.md files is kept in memory
+CACHE_SIZE = 512
+
+
+def _text(line) -> str:
+    """Decode a line read from a binary file"""
+    return line.decode('utf-8') if isinstance(line, bytes) else line
+
+
+def read_frontmatter_text(f: IO) -> Optional[str]:
+    """
+    Read the frontmatter block from an open SKILL.md file
+
+    Reading stops right after the closing delimiter, leaving `f` positioned
+    at the start of the body. On a binary file, f.tell() then gives the
+    body's byte offset.
+
+    Args:
+        f: SKILL.md opened in text mode, or in binary mode (lines are
+            decoded as UTF-8)
+
+    Returns:
+        The YAML between the delimiters, or None if the file doesn't start
+        with a complete frontmatter block
+    """
+    first_line = _text(f.readline())
+    if first_line.lstrip('\ufeff').rstrip() != DELIMITER:
+        return None
+
+    lines = []
+    for line in f:
+        line = _text(line)
+        if line.rstrip() == DELIMITER:
+            return ''.join(lines)
+        lines.append(line)
+
+    return None
+
+
+def has_content(f: TextIO, chunk_size: int = 4096) -> bool:
+    """
+    Check whether the rest of an open file contains anything but whitespace
+
+    Reads only until the first non-whitespace character.
+
+    Args:
+        f: File opened in text mode
+        chunk_size: Characters read at a time
+
+    Returns:
+        True if non-whitespace text follows the current position
+    """
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return False
+        if not chunk.isspace():
+            return True
+
+
+def parse_frontmatter(text: str) -> Any:
+    """
+    Parse frontmatter YAML
+
+    Args:
+        text: YAML text from read_frontmatter_text()
+
+    Returns:
+        The parsed document (a dict for well-formed frontmatter)
+
+    Raises:
+        yaml.YAMLError: If the YAML is invalid
+    """
+    return yaml.load(text, Loader=FrontmatterLoader)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _load_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse one SKILL.md version; the stat fields are only part of the cache key"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = read_frontmatter_text(f)
+        if text is None:
+            return {}
+        metadata = parse_frontmatter(text)
+    except (OSError, UnicodeDecodeError, yaml.YAMLError):
+        return {}
+
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def load_frontmatter(skill_md_path: Path) -> Dict[str, Any]:
+    """
+    Get the parsed frontmatter of a SKILL.md file
+
+    Results are cached per (path, mtime, size), so asking again for an
+    unchanged file costs one stat() call.
+
+    Args:
+        skill_md_path: Path to SKILL.md
+
+    Returns:
+        Frontmatter dictionary, or {} if the file is missing or has no
+        valid frontmatter
+    """
+    try:
+        stat = os.stat(skill_md_path)
+    except OSError:
+        return {}
+
+    metadata = _load_cached(os.path.abspath(skill_md_path), stat.st_mtime_ns, stat.st_size)
+    # Callers get their own copy so the cached entry can't be modified
+    return copy.deepcopy(metadata)
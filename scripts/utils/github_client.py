@@ -4,28 +4,179 @@ GitHub API Client Module
 This module handles downloading skills from GitHub repositories.
 """
 
+import hashlib
 import os
 import requests
-import shutil
-import zipfile
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from urllib.parse import urljoin
 
+from requests.adapters import HTTPAdapter
+
+from .zip_stream import ZipStreamError, extract_zip_file, extract_zip_stream
+
+
+def git_blob_sha(data: bytes) -> str:
+    """
+    Compute the git blob SHA-1 of some content
+
+    Args:
+        data: File content
+
+    Returns:
+        Hex SHA-1, as used in git trees
+    """
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def git_blob_sha_file(path: Path) -> str:
+    """
+    Compute the git blob SHA-1 of a file without reading it into memory
+
+    Args:
+        path: File path
+
+    Returns:
+        Hex SHA-1, as used in git trees
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        digest = hashlib.sha1(b"blob %d\0" % size)
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def diff_download_plans(old_plan: Optional[Dict[str, Any]], new_plan: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    Compare two download plans
+
+    Args:
+        old_plan: Previously cached plan (None means nothing installed)
+        new_plan: Newly fetched plan
+
+    Returns:
+        Dictionary with sorted 'added', 'changed' and 'removed' relative paths
+    """
+    old_files = old_plan.get('files', {}) if old_plan else {}
+    new_files = new_plan.get('files', {})
+
+    added = sorted(path for path in new_files if path not in old_files)
+    removed = sorted(path for path in old_files if path not in new_files)
+    changed = sorted(
+        path for path, entry in new_files.items()
+        if path in old_files and (
+            old_files[path].get('sha') != entry.get('sha')
+            or old_files[path].get('mode') != entry.get('mode')
+        )
+    )
+
+    return {'added': added, 'changed': changed, 'removed': removed}
+
 
 class GitHubClient:
     """Client for interacting with GitHub API"""
 
-    def __init__(self, token: str = None):
+    # Default number of concurrent listing/download workers
+    DEFAULT_MAX_WORKERS = 8
+
+    # Seconds to wait for a server response
+    DEFAULT_TIMEOUT = 30
+
+    def __init__(
+        self,
+        token: str = None,
+        api_base: str = "https://api.github.com",
+        raw_base: str = "https://raw.githubusercontent.com",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+        blob_store=None
+    ):
         """
         Initialize GitHub client
 
         Args:
             token: Optional GitHub personal access token for authenticated requests
+            api_base: Base URL of the GitHub REST API (overridable for mirrors and tests)
+            raw_base: Base URL for raw file downloads
+            max_workers: Maximum number of concurrent requests
+            timeout: Per-request timeout in seconds
+            blob_store: Optional BlobStore consulted before downloading a file
+                whose blob SHA is known
         """
         self.token = token
-        self.api_base = "https://api.github.com"
-        self.raw_base = "https://raw.githubusercontent.com"
+        self.api_base = api_base.rstrip('/')
+        self.raw_base = raw_base.rstrip('/')
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.blob_store = blob_store
+
+        # Files served from the blob store vs. fetched over the network
+        self.stats = {"cached": 0, "downloaded": 0}
+        self._stats_lock = threading.Lock()
+
+        # One pooled session keeps TLS connections alive across requests and threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(self._get_headers())
+
+    def _count(self, key: str) -> None:
+        """Increment a download statistic (called from worker threads)"""
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _from_cache(self, sha: Optional[str], size: Optional[int], dest_path: Path, executable: bool = False) -> bool:
+        """
+        Try to place a file from the blob store instead of downloading it
+
+        Returns:
+            True if the file was served from the cache
+        """
+        if self.blob_store is None or not sha or not self.blob_store.has(sha, size, verify=True):
+            return False
+
+        self.blob_store.materialize(sha, dest_path, executable)
+        self._count("cached")
+        return True
+
+    def _store_content(self, content: bytes, sha: Optional[str], dest_path: Path, executable: bool = False) -> None:
+        """
+        Write downloaded content, through the blob store when one is configured
+
+        Raises:
+            ValueError: If the content doesn't match the expected blob SHA
+        """
+        if sha and git_blob_sha(content) != sha:
+            raise ValueError(f"Checksum mismatch for {dest_path.name}")
+
+        self._count("downloaded")
+
+        if self.blob_store is not None:
+            sha = self.blob_store.put(content, sha)
+            self.blob_store.materialize(sha, dest_path, executable)
+            return
+
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(dest_path, 'wb') as f:
+            f.write(content)
+
+        if executable:
+            dest_path.chmod(dest_path.stat().st_mode | 0o111)
+
+    def close(self) -> None:
+        """Close pooled connections"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers with optional authentication"""
@@ -49,6 +200,10 @@ class GitHubClient:
         """
         Download a directory from a GitHub repository
 
+        Directory listings and file downloads run concurrently on a bounded
+        worker pool that shares one pooled session. Subdirectories are fed
+        back into the same work queue rather than recursed into.
+
         Args:
             repo: Repository in format "owner/repo"
             directory_path: Path to directory in repo
@@ -58,34 +213,45 @@ class GitHubClient:
         Returns:
             True if successful, False otherwise
         """
+        dest_path = Path(dest_dir)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        # future -> local directory for listings, None for file downloads
+        pending = {}
+
         try:
-            dest_path = Path(dest_dir)
             dest_path.mkdir(parents=True, exist_ok=True)
 
-            # Get directory contents
-            contents = self._get_directory_contents(repo, directory_path, branch)
-
-            if not contents:
-                print(f"Warning: Directory {directory_path} appears to be empty")
-                return True
-
-            # Download each file
-            for item in contents:
-                if item['type'] == 'file':
-                    self._download_file(
-                        repo,
-                        item['path'],
-                        dest_path / item['name'],
-                        branch
-                    )
-                elif item['type'] == 'dir':
-                    # Recursively download subdirectory
-                    self.download_directory(
-                        repo,
-                        item['path'],
-                        dest_path / item['name'],
-                        branch
-                    )
+            pending[executor.submit(self._get_directory_contents, repo, directory_path, branch)] = dest_path
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    local_dir = pending.pop(future)
+                    result = future.result()
+
+                    if local_dir is None:
+                        continue
+
+                    if not result and local_dir == dest_path:
+                        print(f"Warning: Directory {directory_path} appears to be empty")
+
+                    for item in result:
+                        if item['type'] == 'file':
+                            submitted = executor.submit(
+                                self._download_file,
+                                repo,
+                                item['path'],
+                                local_dir / item['name'],
+                                branch,
+                                item.get('sha'),
+                                item.get('size')
+                            )
+                            pending[submitted] = None
+                        elif item['type'] == 'dir':
+                            subdir = local_dir / item['name']
+                            subdir.mkdir(parents=True, exist_ok=True)
+                            submitted = executor.submit(self._get_directory_contents, repo, item['path'], branch)
+                            pending[submitted] = subdir
 
             return True
 
@@ -93,6 +259,12 @@ class GitHubClient:
             print(f"Error downloading directory: {e}")
             return False
 
+        finally:
+            # Drop queued downloads after a failure (shutdown's cancel_futures needs Python 3.9)
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
     def _get_directory_contents(
         self,
         repo: str,
@@ -113,7 +285,7 @@ class GitHubClient:
         url = f"{self.api_base}/repos/{repo}/contents/{path}"
         params = {"ref": branch}
 
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self.session.get(url, params=params, timeout=self.timeout)
         response.raise_for_status()
 
         return response.json()
@@ -123,7 +295,9 @@ class GitHubClient:
         repo: str,
         file_path: str,
         dest_path: Path,
-        branch: str = "main"
+        branch: str = "main",
+        sha: str = None,
+        size: int = None
     ) -> None:
         """
         Download a single file from GitHub
@@ -133,19 +307,300 @@ class GitHubClient:
             file_path: Path to file in repo
             dest_path: Local destination path
             branch: Git branch
+            sha: Git blob SHA, if known (enables the blob store)
+            size: File size, if known
         """
+        if self._from_cache(sha, size, dest_path):
+            return
+
         # Use raw.githubusercontent.com for direct file download
         url = f"{self.raw_base}/{repo}/{branch}/{file_path}"
 
-        response = requests.get(url, headers=self._get_headers())
+        if self.blob_store is not None and sha:
+            with self.session.get(url, timeout=self.timeout) as response:
+                response.raise_for_status()
+                self._store_content(response.content, sha, dest_path)
+            return
+
+        self._count("downloaded")
+        with self.session.get(url, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+
+            # Create parent directories if needed
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Stream to disk so large files aren't held in memory
+            with open(dest_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    f.write(chunk)
+
+    def resolve_commit(
+        self,
+        repo: str,
+        branch: str = "main",
+        etag: str = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Resolve a branch to its head commit SHA
+
+        With an ETag from an earlier call the request is conditional: an
+        unchanged branch costs a 304 response (which GitHub doesn't count
+        against the rate limit) and no body.
+
+        Args:
+            repo: Repository in format "owner/repo"
+            branch: Git branch
+            etag: ETag returned by a previous call, if any
+
+        Returns:
+            Tuple of (commit SHA or None if unchanged since etag, ETag)
+
+        Raises:
+            requests.HTTPError: If the branch can't be resolved
+        """
+        headers = {"Accept": "application/vnd.github.sha"}
+        if etag:
+            headers["If-None-Match"] = etag
+
+        response = self.session.get(
+            f"{self.api_base}/repos/{repo}/commits/{branch}",
+            headers=headers,
+            timeout=self.timeout
+        )
+        if etag and response.status_code == 304:
+            return None, etag
         response.raise_for_status()
+        return response.text.strip(), response.headers.get('ETag')
 
-        # Create parent directories if needed
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
+    def get_tree(self, repo: str, commit: str) -> Dict[str, Any]:
+        """
+        List a commit's whole repository tree in one recursive call
 
-        # Write file
-        with open(dest_path, 'wb') as f:
-            f.write(response.content)
+        Args:
+            repo: Repository in format "owner/repo"
+            commit: Commit SHA
+
+        Returns:
+            Git Trees API response
+
+        Raises:
+            requests.HTTPError: If the tree can't be fetched
+        """
+        response = self.session.get(
+            f"{self.api_base}/repos/{repo}/git/trees/{commit}",
+            params={"recursive": "1"},
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def plan_from_tree(
+        tree: Dict[str, Any],
+        repo: str,
+        skill_path: str,
+        branch: str,
+        commit: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build a skill's download plan from a recursive tree listing
+
+        Several skills of one repository can be planned from a single
+        get_tree() call.
+
+        Args:
+            tree: Response of get_tree()
+            repo: Repository in format "owner/repo"
+            skill_path: Path to skill in repo
+            branch: Git branch the commit was resolved from
+            commit: Commit SHA the tree belongs to
+
+        Returns:
+            Plan dictionary, or None if GitHub truncated the tree listing
+
+        Raises:
+            FileNotFoundError: If the skill path doesn't exist in the tree
+        """
+        if tree.get('truncated'):
+            return None
+
+        skill_path = skill_path.strip('/')
+        prefix = f"{skill_path}/"
+        tree_sha = None
+        files = {}
+
+        for entry in tree.get('tree', []):
+            path = entry.get('path', '')
+            if path == skill_path and entry.get('type') == 'tree':
+                tree_sha = entry.get('sha')
+            elif path.startswith(prefix) and entry.get('type') == 'blob':
+                files[path[len(prefix):]] = {
+                    "sha": entry.get('sha'),
+                    "size": entry.get('size', 0),
+                    "mode": entry.get('mode', '100644')
+                }
+
+        if tree_sha is None:
+            raise FileNotFoundError(f"Path '{skill_path}' not found in {repo}@{branch}")
+
+        return {
+            "repo": repo,
+            "branch": branch,
+            "path": skill_path,
+            "commit": commit,
+            "tree_sha": tree_sha,
+            "files": files
+        }
+
+    def get_download_plan(
+        self,
+        repo: str,
+        skill_path: str,
+        branch: str = "main"
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build a download plan for a skill using the Git Trees API
+
+        The branch is resolved to a commit, and the whole repository tree for
+        that commit is listed in a single recursive call, then filtered to
+        the skill path. The plan is plain JSON data, so it can be cached and
+        compared with diff_download_plans(). Its 'etag' entry allows a later
+        conditional resolve_commit().
+
+        Args:
+            repo: Repository in format "owner/repo"
+            skill_path: Path to skill in repo
+            branch: Git branch
+
+        Returns:
+            Plan dictionary, or None if GitHub truncated the tree listing
+
+        Raises:
+            requests.HTTPError: If the commit or tree can't be fetched
+            FileNotFoundError: If the skill path doesn't exist in the tree
+        """
+        # Pin the branch to a commit so every blob comes from the same snapshot
+        commit, etag = self.resolve_commit(repo, branch)
+
+        plan = self.plan_from_tree(self.get_tree(repo, commit), repo, skill_path, branch, commit)
+        if plan is not None:
+            plan["etag"] = etag
+        return plan
+
+    def download_plan(
+        self,
+        plan: Dict[str, Any],
+        dest_dir: str,
+        paths: List[str] = None
+    ) -> bool:
+        """
+        Download the blobs listed in a plan
+
+        Files are fetched concurrently from the plan's commit and verified
+        against their git blob SHA. Blobs already in the blob store are
+        linked from it instead of downloaded.
+
+        Args:
+            plan: Plan from get_download_plan()
+            dest_dir: Local destination directory
+            paths: Optional subset of plan paths to fetch (default: all)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        dest_path = Path(dest_dir)
+        files = plan.get('files', {})
+        if paths is None:
+            paths = list(files)
+
+        try:
+            dest_path.mkdir(parents=True, exist_ok=True)
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(self._download_blob, plan, path, dest_path / path)
+                    for path in paths
+                ]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+            return True
+
+        except Exception as e:
+            print(f"Error downloading files: {e}")
+            return False
+
+    def _download_blob(self, plan: Dict[str, Any], path: str, dest_path: Path) -> None:
+        """
+        Download one file of a plan and verify its blob SHA
+
+        Args:
+            plan: Download plan
+            path: File path relative to the skill directory
+            dest_path: Local destination path
+        """
+        entry = plan['files'][path]
+        executable = entry.get('mode') == '100755'
+
+        if self._from_cache(entry.get('sha'), entry.get('size'), dest_path, executable):
+            return
+
+        url = f"{self.raw_base}/{plan['repo']}/{plan['commit']}/{plan['path']}/{path}"
+
+        with self.session.get(url, timeout=self.timeout) as response:
+            response.raise_for_status()
+            self._store_content(response.content, entry.get('sha'), dest_path, executable)
+
+    def download_tree(
+        self,
+        repo: str,
+        skill_path: str,
+        dest_dir: str,
+        branch: str = "main"
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Download a skill using a single tree listing plus blob fetches
+
+        Falls back to download_directory() when the tree is too large for
+        GitHub to list in one response.
+
+        Args:
+            repo: Repository in format "owner/repo"
+            skill_path: Path to skill in repo
+            dest_dir: Local destination directory
+            branch: Git branch
+
+        Returns:
+            The download plan used (an empty plan after a fallback), or None on failure
+        """
+        try:
+            plan = self.get_download_plan(repo, skill_path, branch)
+        except Exception as e:
+            print(f"Error fetching repository tree: {e}")
+            return None
+
+        if plan is None:
+            print("Warning: Repository tree is truncated, falling back to directory listing")
+            if not self.download_directory(repo, skill_path, dest_dir, branch):
+                return None
+            return {
+                "repo": repo,
+                "branch": branch,
+                "path": skill_path,
+                "commit": None,
+                "tree_sha": None,
+                "files": {}
+            }
+
+        if not self.download_plan(plan, dest_dir):
+            return None
+
+        return plan
 
     def download_skill_zip(
         self,
@@ -155,7 +610,11 @@ class GitHubClient:
         branch: str = "main"
     ) -> bool:
         """
-        Download a skill directory as a ZIP archive and extract it
+        Download a skill directory from the repository ZIP archive
+
+        The archive is extracted while it streams in: only members under
+        "<root>/<skill_path>/" are written, directly to their final location.
+        Archives that can't be streamed are spooled to a temporary file first.
 
         Args:
             repo: Repository in format "owner/repo"
@@ -166,57 +625,23 @@ class GitHubClient:
         Returns:
             True if successful, False otherwise
         """
+        dest_path = Path(dest_dir)
+        zip_url = f"{self.api_base}/repos/{repo}/zipball/{branch}"
+
         try:
-            dest_path = Path(dest_dir)
             dest_path.mkdir(parents=True, exist_ok=True)
 
-            # Download ZIP archive
-            zip_url = f"{self.api_base}/repos/{repo}/zipball/{branch}"
-            response = requests.get(zip_url, headers=self._get_headers(), stream=True)
-            response.raise_for_status()
-
-            # Save to temporary file
-            temp_zip = dest_path / "temp_skill.zip"
-            with open(temp_zip, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            try:
+                with self.session.get(zip_url, timeout=self.timeout, stream=True) as response:
+                    response.raise_for_status()
+                    written = extract_zip_stream(response.iter_content(chunk_size=65536), skill_path, dest_path)
+            except ZipStreamError as e:
+                print(f"Warning: Can't stream archive ({e}), downloading it first")
+                written = self._download_and_extract_zip(zip_url, skill_path, dest_path)
 
-            # Extract ZIP
-            with zipfile.ZipFile(temp_zip, 'r') as zip_ref:
-                # Find the skill directory in the archive
-                skill_dir_name = None
-                for name in zip_ref.namelist():
-                    # The top-level directory is named like {repo}-{commit_hash}
-                    parts = name.split('/')
-                    if len(parts) > 1 and skill_path in parts:
-                        skill_dir_name = parts[0]
-                        break
-
-                if skill_dir_name:
-                    # Extract only the skill directory contents
-                    for name in zip_ref.namelist():
-                        if name.startswith(f"{skill_dir_name}/{skill_path}/"):
-                            # Remove the repo prefix from paths
-                            arcname = name[len(f"{skill_dir_name}/{skill_path}/"):]
-                            if arcname:  # Skip empty path
-                                zip_ref.extract(name, dest_path)
-                                # Move to correct location
-                                extracted_path = dest_path / name
-                                target_path = dest_path / arcname
-                                if extracted_path != target_path:
-                                    target_path.parent.mkdir(parents=True, exist_ok=True)
-                                    if extracted_path.is_file():
-                                        shutil.move(str(extracted_path), str(target_path))
-                                    elif extracted_path.is_dir() and extracted_path != dest_path / skill_dir_name:
-                                        shutil.move(str(extracted_path), str(target_path))
-
-                    # Clean up the extracted repo directory
-                    repo_dir = dest_path / skill_dir_name
-                    if repo_dir.exists():
-                        shutil.rmtree(repo_dir)
-
-            # Clean up temp file
-            temp_zip.unlink()
+            if written == 0:
+                print(f"Error downloading skill ZIP: '{skill_path}' not found in archive")
+                return False
 
             return True
 
@@ -224,6 +649,27 @@ class GitHubClient:
             print(f"Error downloading skill ZIP: {e}")
             return False
 
+    def _download_and_extract_zip(self, zip_url: str, skill_path: str, dest_path: Path) -> int:
+        """
+        Spool an archive to a temporary file, then extract the skill from it
+
+        Args:
+            zip_url: Archive URL
+            skill_path: Path to skill in repo
+            dest_path: Local destination directory
+
+        Returns:
+            Number of files written
+        """
+        with tempfile.TemporaryFile(suffix=".zip") as temp_zip:
+            with self.session.get(zip_url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=65536):
+                    temp_zip.write(chunk)
+
+            temp_zip.seek(0)
+            return extract_zip_file(temp_zip, skill_path, dest_path)
+
     def get_file_contents(
         self,
         repo: str,
@@ -243,7 +689,7 @@ class GitHubClient:
         """
         try:
             url = f"{self.raw_base}/{repo}/{branch}/{file_path}"
-            response = requests.get(url, headers=self._get_headers())
+            response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
             return response.text
 
@@ -288,7 +734,7 @@ class GitHubClient:
         """
         try:
             url = f"{self.api_base}/repos/{repo}"
-            response = requests.get(url, headers=self._get_headers())
+            response = self.session.get(url, timeout=self.timeout)
             return response.status_code == 200
 
         except Exception:
@@ -310,17 +756,18 @@ def download_skill(
         skill_path: Path to skill in repo
         dest_dir: Local destination directory
         branch: Git branch
-        method: Download method ('directory' or 'zip')
+        method: Download method ('directory', 'tree' or 'zip')
 
     Returns:
         True if successful, False otherwise
     """
-    client = GitHubClient()
-
-    if method == "zip":
-        return client.download_skill_zip(repo, skill_path, dest_dir, branch)
-    else:
-        return client.download_directory(repo, skill_path, dest_dir, branch)
+    with GitHubClient() as client:
+        if method == "zip":
+            return client.download_skill_zip(repo, skill_path, dest_dir, branch)
+        elif method == "tree":
+            return client.download_tree(repo, skill_path, dest_dir, branch) is not None
+        else:
+            return client.download_directory(repo, skill_path, dest_dir, branch)
 
 
 if __name__ == "__main__":
@@ -338,7 +785,7 @@ if __name__ == "__main__":
     branch = sys.argv[4] if len(sys.argv) > 4 else "main"
 
     print(f"Downloading {skill_path} from {repo}...")
-    success = download_skill(repo, skill_path, dest_dir, branch, method="directory")
+    success = download_skill(repo, skill_path, dest_dir, branch, method="tree")
 
     if success:
         print(f"✅ Successfully downloaded to {dest_dir}")
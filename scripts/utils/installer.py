@@ -0,0 +1,355 @@
+"""
+Skill Installer Module
+
+This module builds new versions of installed skills in a staging directory
+next to the live one and swaps them into place with renames, so a skill is
+never seen half-written. The download plan of every GitHub install is
+cached, which lets an update fetch only the files whose blob SHA changed
+and reuse the rest from the current install.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .fileio import atomic_write_json
+from .github_client import diff_download_plans, git_blob_sha_file
+from .zip_stream import _safe_relative_path
+
+
+STAGING_MARKER = ".staging-"
+BACKUP_MARKER = ".old-"
+
+
+class PlanCache:
+    """Download plans of installed skills, one JSON file per skill"""
+
+    def __init__(self, cache_dir: str = None):
+        """
+        Initialize the plan cache
+
+        Args:
+            cache_dir: Cache directory (default: data/install-plans)
+        """
+        if cache_dir is None:
+            project_root = Path(__file__).parent.parent.parent
+            cache_dir = project_root / "data" / "install-plans"
+
+        self.cache_dir = Path(cache_dir)
+
+    def path(self, skill_name: str) -> Path:
+        """Get the cache file of a skill"""
+        return self.cache_dir / f"{skill_name}.json"
+
+    def load(self, skill_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a skill's cached plan
+
+        Args:
+            skill_name: Name of the skill
+
+        Returns:
+            Plan dictionary, or None if missing or unreadable
+        """
+        try:
+            with open(self.path(skill_name), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, skill_name: str, plan: Dict[str, Any]) -> None:
+        """
+        Cache a skill's plan
+
+        Args:
+            skill_name: Name of the skill
+            plan: Plan from GitHubClient.get_download_plan()
+        """
+        atomic_write_json(self.path(skill_name), plan)
+
+    def remove(self, skill_name: str) -> None:
+        """Forget a skill's plan"""
+        try:
+            self.path(skill_name).unlink()
+        except FileNotFoundError:
+            pass
+
+
+def cleanup_stale_dirs(install_path: Path) -> None:
+    """
+    Remove staging and backup directories left behind by an interrupted install
+
+    Must be called while holding the skill's lock.
+
+    Args:
+        install_path: Live install directory of the skill
+    """
+    parent = install_path.parent
+    if not parent.is_dir():
+        return
+
+    for marker in (STAGING_MARKER, BACKUP_MARKER):
+        for path in parent.glob(f".{install_path.name}{marker}*"):
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def create_staging_dir(install_path: Path) -> Path:
+    """
+    Create an empty staging directory beside the install directory
+
+    Staying on the same filesystem keeps the final swap a pair of renames.
+
+    Args:
+        install_path: Live install directory of the skill
+
+    Returns:
+        Path of the staging directory
+    """
+    install_path.parent.mkdir(parents=True, exist_ok=True)
+    staging_path = Path(tempfile.mkdtemp(
+        prefix=f".{install_path.name}{STAGING_MARKER}",
+        dir=install_path.parent
+    ))
+    # mkdtemp creates the directory private to the user
+    staging_path.chmod(0o755)
+    return staging_path
+
+
+def _reuse_file(source: Path, dest: Path, entry: Dict[str, Any]) -> bool:
+    """
+    Copy an unchanged file from the current install into staging
+
+    The file is only reused if its content still hashes to the plan's blob
+    SHA, so local edits are replaced by the new version rather than carried
+    over. It is copied, not linked, so later edits to either install stay
+    separate.
+    """
+    try:
+        if not source.is_file() or source.stat().st_size != entry.get('size'):
+            return False
+        if git_blob_sha_file(source) != entry.get('sha'):
+            return False
+    except OSError:
+        return False
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(source, dest)
+    return True
+
+
+def stage_from_plan(
+    client,
+    plan: Dict[str, Any],
+    staging_path: Path,
+    install_path: Path = None,
+    old_plan: Dict[str, Any] = None
+) -> Optional[Dict[str, int]]:
+    """
+    Fill a staging directory with the files of a download plan
+
+    When the plan the current install was made from is given, files whose
+    blob SHA and mode are unchanged are taken from the install directory
+    (after checking their content still has that SHA); only added, changed
+    and locally modified files are fetched. Files dropped upstream are
+    simply not staged.
+
+    Args:
+        client: GitHubClient used for fetching
+        plan: New plan from GitHubClient.get_download_plan()
+        staging_path: Empty staging directory
+        install_path: Current install directory, if any
+        old_plan: Plan the current install was made from, if known
+
+    Returns:
+        Dictionary with 'fetched', 'reused' and 'removed' file counts,
+        or None if a download failed
+    """
+    files = plan.get('files', {})
+
+    if install_path is None or not old_plan:
+        fetch = sorted(files)
+        reused = 0
+        removed = 0
+    else:
+        diff = diff_download_plans(old_plan, plan)
+        modified = set(diff['added']) | set(diff['changed'])
+        fetch = sorted(modified)
+        reused = 0
+        removed = len(diff['removed'])
+
+        for path, entry in files.items():
+            if path in modified:
+                continue
+            if _reuse_file(install_path / path, staging_path / path, entry):
+                reused += 1
+            else:
+                # Missing or locally modified: fetch it again
+                fetch.append(path)
+
+    if fetch and not client.download_plan(plan, str(staging_path), fetch):
+        return None
+
+    return {"fetched": len(fetch), "reused": reused, "removed": removed}
+
+
+def stage_from_blobs(blob_store, files: Dict[str, Dict[str, Any]], staging_path: Path) -> int:
+    """
+    Fill a staging directory from blobs already in the blob store
+
+    Args:
+        blob_store: BlobStore holding every listed blob
+        files: Map of relative path -> {'sha', 'size', 'mode'}
+        staging_path: Empty staging directory
+
+    Returns:
+        Number of files staged
+
+    Raises:
+        FileNotFoundError: If a blob is missing from the store
+        ValueError: If a path would leave the staging directory
+    """
+    for path, entry in files.items():
+        relative = _safe_relative_path(path)
+        if relative is None or not relative.parts or '\\' in path:
+            raise ValueError(f"Unsafe file path: {path!r}")
+        if not blob_store.has(entry['sha'], entry.get('size'), verify=True):
+            raise FileNotFoundError(f"Blob {entry['sha']} for '{path}' is not in the blob store")
+        blob_store.materialize(
+            entry['sha'],
+            staging_path / relative,
+            executable=entry.get('mode') == '100755'
+        )
+    return len(files)
+
+
+def swap_into_place(staging_path: Path, install_path: Path) -> None:
+    """
+    Replace the install directory with a staged one
+
+    The current version is renamed aside, the staged version renamed into
+    place, and the old one deleted. If the second rename fails the old
+    version is put back, so the skill is always either fully old or fully
+    new. Files already opened by readers stay valid until they are closed.
+
+    Args:
+        staging_path: Fully populated and validated staging directory
+        install_path: Live install directory of the skill
+    """
+    backup_path = None
+    if install_path.exists() or install_path.is_symlink():
+        backup_path = install_path.parent / f".{install_path.name}{BACKUP_MARKER}{os.getpid()}"
+        if backup_path.exists():
+            shutil.rmtree(backup_path)
+        os.rename(install_path, backup_path)
+
+    try:
+        os.rename(staging_path, install_path)
+    except OSError:
+        if backup_path is not None:
+            os.rename(backup_path, install_path)
+        raise
+
+    if backup_path is not None:
+        shutil.rmtree(backup_path, ignore_errors=True)
+
+
+def create_skill_symlink(skill_path: Path, skill_name: str, quiet: bool = False) -> str:
+    """
+    Create a symlink from plugin-skills/ to the installed skill for Claude Code auto-discovery.
+
+    Implements a three-tier fallback strategy:
+    1. Symbolic link (Unix or Windows with Developer Mode)
+    2. Directory junction (Windows, no special permissions needed)
+    3. Copy (last resort, works everywhere)
+
+    Args:
+        skill_path: Path to the installed skill directory
+        skill_name: Name of the skill
+        quiet: Don't report the link that was created
+
+    Returns:
+        Type of link created: "symlink", "junction", or "copy"
+    """
+    # Get plugin-skills directory
+    project_root = Path(__file__).parent.parent.parent
+    plugin_skills_dir = project_root / "plugin-skills"
+    plugin_skills_dir.mkdir(exist_ok=True)
+
+    symlink_path = plugin_skills_dir / skill_name
+
+    # Remove existing symlink or directory
+    if symlink_path.exists() or symlink_path.is_symlink():
+        if symlink_path.is_symlink():
+            symlink_path.unlink()
+        else:
+            shutil.rmtree(symlink_path)
+
+    # Try different linking methods
+    link_type = None
+
+    if sys.platform != 'win32':
+        # Unix/Linux/macOS: Use standard symbolic links
+        try:
+            symlink_path.symlink_to(skill_path.absolute())
+            link_type = "symlink"
+            if not quiet:
+                print(f"✅ Created symbolic link in plugin-skills/ for Claude Code discovery")
+        except OSError as e:
+            print(f"⚠️  Could not create symlink: {e}", file=sys.stderr)
+            # Fallback to copy
+            shutil.copytree(skill_path, symlink_path)
+            link_type = "copy"
+            if not quiet:
+                print(f"✅ Copied skill to plugin-skills/ for Claude Code discovery")
+    else:
+        # Windows: Try symlink → junction → copy
+        try:
+            # Try symbolic link first (requires Developer Mode or Admin)
+            symlink_path.symlink_to(skill_path.absolute())
+            link_type = "symlink"
+            if not quiet:
+                print(f"✅ Created symbolic link in plugin-skills/ for Claude Code discovery")
+        except OSError:
+            try:
+                # Try directory junction (works without Developer Mode)
+                result = subprocess.run(
+                    ['mklink', '/J', str(symlink_path), str(skill_path.absolute())],
+                    shell=True,
+                    check=True,
+                    capture_output=True
+                )
+                link_type = "junction"
+                if not quiet:
+                    print(f"✅ Created directory junction in plugin-skills/ for Claude Code discovery")
+            except subprocess.CalledProcessError:
+                # Final fallback: copy the directory
+                shutil.copytree(skill_path, symlink_path)
+                link_type = "copy"
+                if not quiet:
+                    print(f"⚠️  Could not create symlink or junction on Windows")
+                    print(f"✅ Copied skill to plugin-skills/ for Claude Code discovery")
+                    print(f"   Note: Enable Developer Mode for symbolic links")
+
+    return link_type
+
+
+def create_skill_symlinks(skills: Dict[str, Path]) -> Dict[str, int]:
+    """
+    Create plugin-skills/ links for many skills at once
+
+    Args:
+        skills: Map of skill name -> installed skill directory
+
+    Returns:
+        Number of links created per type ("symlink", "junction", "copy")
+    """
+    counts = {}
+    for skill_name, skill_path in skills.items():
+        link_type = create_skill_symlink(Path(skill_path), skill_name, quiet=True)
+        counts[link_type] = counts.get(link_type, 0) + 1
+    return counts
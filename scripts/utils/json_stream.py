@@ -0,0 +1,265 @@
+"""
+Streaming JSON Module
+
+This module parses a JSON object from a stream of byte chunks, yielding its
+members as soon as each one is complete. Selected nested objects (such as a
+registry's "skills" map) are descended into and yielded entry by entry, so
+only one entry is ever held as text at a time.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, Optional, Sequence, Tuple
+
+
+class JsonStreamError(ValueError):
+    """Raised when the stream isn't a well-formed JSON object"""
+
+
+_WHITESPACE = ' \t\n\r'
+
+_STRUCTURE = re.compile(r'["{}\[\]]')
+_STRING_END = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r'[ \t\n\r,:\]}]')
+
+
+class _Buffer:
+    """Decoded text of a byte stream, refilled on demand"""
+
+    # Drop consumed text once this much has accumulated
+    COMPACT_SIZE = 65536
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self.text = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append the next chunk; returns False at the end of the stream"""
+        if self.eof:
+            return False
+
+        if self.pos >= self.COMPACT_SIZE:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+
+        for chunk in self._chunks:
+            if chunk:
+                self.text += self._decoder.decode(chunk)
+                return True
+
+        self.text += self._decoder.decode(b'', final=True)
+        self.eof = True
+        return False
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at the end)"""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        """Consume one expected character"""
+        found = self.peek()
+        if found != char:
+            raise JsonStreamError(f"Expected {char!r} but found {found or 'end of stream'!r}")
+        self.pos += 1
+
+
+class _ValueEnd:
+    """
+    Finds where a buffered JSON value ends, without decoding it
+
+    Scanning picks up where it stopped after each refill, so a value spread
+    over many chunks is scanned once in all. Offsets are kept relative to
+    the value's start, which stays put when the buffer compacts.
+    """
+
+    def __init__(self):
+        self.offset = 0
+        self.depth = 0
+        self.in_string = False
+        self.scalar = None
+
+    def find(self, text: str, start: int) -> Optional[int]:
+        """
+        Scan the text not seen yet
+
+        Args:
+            text: Buffer text
+            start: Position of the value's first character
+
+        Returns:
+            The value's end offset from `start`, or None if it isn't buffered yet
+        """
+        if start >= len(text):
+            return None
+        if self.scalar is None:
+            self.scalar = text[start] not in '"{['
+
+        pos = start + self.offset
+        if self.scalar:
+            match = _SCALAR_END.search(text, pos)
+            if match:
+                return match.start() - start
+            self.offset = len(text) - start
+            return None
+
+        while True:
+            if self.in_string:
+                match = _STRING_END.search(text, pos)
+                if match is None:
+                    pos = len(text)
+                    break
+                if match.group() == '\\':
+                    if match.end() == len(text):
+                        # The escaped character is in the next chunk
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                self.in_string = False
+                pos = match.end()
+                if self.depth == 0:
+                    return pos - start
+            else:
+                match = _STRUCTURE.search(text, pos)
+                if match is None:
+                    pos = len(text)
+                    break
+                pos = match.end()
+                char = match.group()
+                if char == '"':
+                    self.in_string = True
+                elif char in '{[':
+                    self.depth += 1
+                else:
+                    self.depth -= 1
+                    if self.depth <= 0:
+                        return pos - start
+
+        self.offset = pos - start
+        return None
+
+
+def _read_to_value_end(buffer: _Buffer, scan: _ValueEnd) -> bool:
+    """Refill the buffer until the value at its position is complete; False if nothing was read"""
+    filled = False
+    while scan.find(buffer.text, buffer.pos) is None:
+        if not buffer.fill():
+            break
+        filled = True
+    return filled
+
+
+def _decode_value(buffer: _Buffer, decoder: json.JSONDecoder) -> Any:
+    """Decode one complete JSON value at the buffer position"""
+    buffer.peek()
+    scan = _ValueEnd()
+    if buffer.text[buffer.pos:buffer.pos + 1] not in '"{[':
+        # A number or literal may continue in the next chunk ("-2." of
+        # "-2.5" decodes fine), so wait for the delimiter after it
+        _read_to_value_end(buffer, scan)
+
+    while True:
+        try:
+            value, end = decoder.raw_decode(buffer.text, buffer.pos)
+        except json.JSONDecodeError as e:
+            # Most likely the value is cut off at the end of the buffer. Read
+            # on until its end is in, instead of decoding it again from the
+            # start after every chunk.
+            if _read_to_value_end(buffer, scan):
+                continue
+            raise JsonStreamError(f"Invalid JSON: {e}") from e
+
+        buffer.pos = end
+        return value
+
+
+def _iter_members(
+    buffer: _Buffer,
+    decoder: json.JSONDecoder,
+    prefix: Tuple[str, ...],
+    nested: Sequence[str]
+) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+    """Yield the members of the object at the buffer position"""
+    buffer.expect('{')
+    if buffer.peek() == '}':
+        buffer.pos += 1
+        return
+
+    while True:
+        if buffer.peek() != '"':
+            raise JsonStreamError("Expected an object key")
+        key = _decode_value(buffer, decoder)
+        buffer.expect(':')
+
+        path = prefix + (key,)
+        if not prefix and key in nested and buffer.peek() == '{':
+            yield path, {}
+            yield from _iter_members(buffer, decoder, path, ())
+        else:
+            yield path, _decode_value(buffer, decoder)
+
+        separator = buffer.peek()
+        buffer.pos += 1
+        if separator == '}':
+            return
+        if separator != ',':
+            raise JsonStreamError(f"Expected ',' or '}}' but found {separator or 'end of stream'!r}")
+
+
+def iter_json_object(
+    chunks: Iterable[bytes],
+    nested: Sequence[str] = ()
+) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+    """
+    Stream the members of a top-level JSON object
+
+    Args:
+        chunks: Iterable of UTF-8 bytes (e.g. response.iter_content())
+        nested: Top-level keys whose object values are yielded entry by
+            entry instead of as a whole
+
+    Yields:
+        (path, value) pairs: ((key,), value) for ordinary members; for a
+        nested key, ((key,), {}) first, then ((key, entry_key), entry_value)
+        for each of its entries
+
+    Raises:
+        JsonStreamError: If the stream isn't a well-formed JSON object
+    """
+    buffer = _Buffer(chunks)
+    decoder = json.JSONDecoder()
+
+    yield from _iter_members(buffer, decoder, (), tuple(nested))
+
+    if buffer.peek() != '':
+        raise JsonStreamError("Unexpected data after the JSON object")
+
+
+def load_json_object(chunks: Iterable[bytes], nested: Sequence[str] = ()) -> dict:
+    """
+    Parse a streamed JSON object without holding its text in memory
+
+    Args:
+        chunks: Iterable of UTF-8 bytes
+        nested: Large top-level object members to build entry by entry
+
+    Returns:
+        The parsed object
+    """
+    data = {}
+    for path, value in iter_json_object(chunks, nested):
+        if len(path) == 1:
+            data[path[0]] = value
+        else:
+            data[path[0]][path[1]] = value
+    return data
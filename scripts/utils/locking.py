@@ -0,0 +1,177 @@
+"""
+File Locking Module
+
+This module provides advisory inter-process locks so several skills-store
+CLIs can safely run at the same time against the same data directory.
+"""
+
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+if sys.platform == 'win32':
+    import msvcrt
+    fcntl = None
+else:
+    import fcntl
+    msvcrt = None
+
+
+class LockTimeout(TimeoutError):
+    """Raised when a lock can't be acquired within its timeout"""
+
+
+class FileLock:
+    """Advisory lock on a lock file, with shared (reader) and exclusive (writer) modes"""
+
+    def __init__(self, path: str, shared: bool = False, timeout: float = 30.0, poll_interval: float = 0.05):
+        """
+        Initialize a file lock
+
+        Args:
+            path: Path to the lock file (created if missing)
+            shared: Take a shared (reader) lock instead of an exclusive one.
+                Windows has no shared file locks, so readers lock exclusively there.
+            timeout: Seconds to wait for the lock (None waits forever)
+            poll_interval: Seconds between acquisition attempts
+        """
+        self.path = Path(path)
+        self.shared = shared
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd = None
+
+    @property
+    def is_locked(self) -> bool:
+        """Whether this object currently holds the lock"""
+        return self._fd is not None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """
+        Acquire the lock
+
+        Args:
+            blocking: Wait up to the timeout; if False, try once
+
+        Returns:
+            True if acquired, False if blocking is False and the lock is held elsewhere
+
+        Raises:
+            LockTimeout: If the lock couldn't be acquired within the timeout
+        """
+        if self._fd is not None:
+            raise RuntimeError(f"Lock already held: {self.path}")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            if self._try_lock(fd):
+                self._fd = fd
+                return True
+
+            if not blocking:
+                os.close(fd)
+                return False
+
+            if deadline is not None and time.monotonic() >= deadline:
+                os.close(fd)
+                raise LockTimeout(f"Timed out after {self.timeout}s waiting for lock: {self.path}")
+
+            time.sleep(self.poll_interval)
+
+    def _try_lock(self, fd: int) -> bool:
+        """Make one non-blocking lock attempt"""
+        try:
+            if fcntl is not None:
+                mode = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+                fcntl.flock(fd, mode | fcntl.LOCK_NB)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def release(self) -> None:
+        """Release the lock if held"""
+        if self._fd is None:
+            return
+
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+class LockManager:
+    """Hands out the locks that guard the skills-store data files and install directories"""
+
+    # Registry files are held only for a quick read or write
+    REGISTRY_TIMEOUT = 30.0
+
+    # Skill directories are held for a whole download/install
+    SKILL_TIMEOUT = 600.0
+
+    def __init__(self, lock_dir: str = None):
+        """
+        Initialize the lock manager
+
+        Args:
+            lock_dir: Directory for lock files (default: data/locks)
+        """
+        if lock_dir is None:
+            project_root = Path(__file__).parent.parent.parent
+            lock_dir = project_root / "data" / "locks"
+
+        self.lock_dir = Path(lock_dir)
+
+    def registry_lock(self, name: str, shared: bool = False, timeout: float = None) -> FileLock:
+        """
+        Get the lock guarding a registry file
+
+        Args:
+            name: Registry name (e.g. 'installed-skills')
+            shared: Take a reader lock instead of a writer lock
+            timeout: Seconds to wait (default: REGISTRY_TIMEOUT)
+
+        Returns:
+            Unacquired FileLock
+        """
+        if timeout is None:
+            timeout = self.REGISTRY_TIMEOUT
+        return FileLock(self.lock_dir / f"{name}.lock", shared=shared, timeout=timeout)
+
+    def skill_lock(self, skill_name: str, shared: bool = False, timeout: float = None) -> FileLock:
+        """
+        Get the lock guarding a skill's install directory and plugin-skills link
+
+        Installs of different skills use different locks and run concurrently.
+
+        Args:
+            skill_name: Name of the skill
+            shared: Take a reader lock instead of a writer lock
+            timeout: Seconds to wait (default: SKILL_TIMEOUT)
+
+        Returns:
+            Unacquired FileLock
+        """
+        if timeout is None:
+            timeout = self.SKILL_TIMEOUT
+        safe_name = re.sub(r'[^A-Za-z0-9._-]', '_', skill_name)
+        return FileLock(self.lock_dir / f"skill-{safe_name}.lock", shared=shared, timeout=timeout)
@@ -0,0 +1,176 @@
+"""
+Registry Mirror Module
+
+This module provides the disk cache behind serve_registry.py. Upstream
+GitHub responses are stored once and served to any number of clients with
+their own ETags. Responses addressed by a commit or tree SHA never change
+and are kept forever; everything else is revalidated upstream with a
+conditional request once its TTL expires.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+
+from .fileio import atomic_write_json
+
+
+# A full 40-character SHA as a path segment (commit, tree or blob)
+_IMMUTABLE_URL = re.compile(r'/[0-9a-f]{40}(?:/|$|\?)')
+
+
+class UpstreamCache:
+    """Cached GET responses from GitHub, shared by all mirror clients"""
+
+    # Seconds before a mutable response (branch heads, registry files) is revalidated
+    DEFAULT_TTL = 300
+
+    # Seconds to wait for GitHub
+    DEFAULT_TIMEOUT = 30
+
+    # Bytes copied at a time between GitHub and the cache
+    CHUNK_SIZE = 65536
+
+    def __init__(self, cache_dir: str = None, ttl: float = DEFAULT_TTL, token: str = None,
+                 timeout: float = DEFAULT_TIMEOUT):
+        """
+        Initialize the upstream cache
+
+        Args:
+            cache_dir: Cache directory (default: data/mirror-cache)
+            ttl: Seconds before mutable responses are revalidated
+            token: Optional GitHub token used for upstream requests
+            timeout: Upstream request timeout in seconds
+        """
+        if cache_dir is None:
+            project_root = Path(__file__).parent.parent.parent
+            cache_dir = project_root / "data" / "mirror-cache"
+
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = "skills-store-mirror"
+        if token:
+            self.session.headers["Authorization"] = f"token {token}"
+
+        # Requests for the same URL wait for a single upstream fetch
+        self._locks = [threading.Lock() for _ in range(256)]
+
+        self.stats = {"requests": 0, "hits": 0, "revalidated": 0, "fetched": 0, "errors": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _paths(self, url: str, accept: str):
+        """Get the metadata and body files of a cached response"""
+        key = hashlib.sha256(f"{accept}\n{url}".encode('utf-8')).hexdigest()
+        directory = self.cache_dir / key[:2]
+        return key, directory / f"{key}.json", directory / f"{key}.body"
+
+    def _load_meta(self, meta_path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, url: str, accept: str = "application/vnd.github.v3+json") -> Dict[str, Any]:
+        """
+        Get a response from the cache, fetching or revalidating it if needed
+
+        When GitHub can't be reached, a previously cached copy is served
+        even if its TTL has expired.
+
+        Args:
+            url: Upstream URL, including the query string
+            accept: Accept header sent upstream (part of the cache key)
+
+        Returns:
+            Dictionary with 'status' and, for a 200, 'body_path', 'etag',
+            'content_type' and 'size'
+        """
+        self._count("requests")
+        key, meta_path, body_path = self._paths(url, accept)
+
+        with self._locks[int(key[:2], 16)]:
+            meta = self._load_meta(meta_path)
+            if meta is not None and not body_path.exists():
+                meta = None
+
+            if meta is not None:
+                if _IMMUTABLE_URL.search(url) or time.time() - meta['checked_at'] < self.ttl:
+                    self._count("hits")
+                    return dict(meta, body_path=body_path)
+
+            headers = {"Accept": accept}
+            if meta is not None and meta.get('upstream_etag'):
+                headers["If-None-Match"] = meta['upstream_etag']
+
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout, stream=True)
+            except requests.RequestException:
+                self._count("errors")
+                if meta is not None:
+                    return dict(meta, body_path=body_path)
+                return {"status": 502}
+
+            with response:
+                if response.status_code == 304 and meta is not None:
+                    self._count("revalidated")
+                    meta['checked_at'] = time.time()
+                    atomic_write_json(meta_path, meta)
+                    return dict(meta, body_path=body_path)
+
+                if response.status_code != 200:
+                    if meta is not None and response.status_code >= 500:
+                        self._count("errors")
+                        return dict(meta, body_path=body_path)
+                    return {"status": response.status_code}
+
+                self._count("fetched")
+                meta = self._store(response, body_path)
+
+            atomic_write_json(meta_path, meta)
+            return dict(meta, body_path=body_path)
+
+    def _store(self, response, body_path: Path) -> Dict[str, Any]:
+        """Stream a 200 response into the cache and describe it"""
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+
+        fd, temp_path = tempfile.mkstemp(dir=body_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                    digest.update(chunk)
+                    size += len(chunk)
+                    f.write(chunk)
+            os.replace(temp_path, body_path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+        return {
+            "status": 200,
+            "etag": f'"{digest.hexdigest()}"',
+            "upstream_etag": response.headers.get('ETag'),
+            "content_type": response.headers.get('Content-Type', 'application/octet-stream'),
+            "size": size,
+            "checked_at": time.time(),
+        }
@@ -5,20 +5,31 @@ This module handles loading, saving, and querying the skills registry.
 """
 
 import json
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple
 from datetime import datetime
+from itertools import islice
+
+from .fileio import atomic_write_json, append_json_line, read_json_lines, file_fingerprint
+from .locking import LockManager
+from .registry_store import RegistryStore, StoreError
+from .search_index import SearchIndex, skill_hash, tokenize
 
 
 class SkillsRegistry:
     """Manages the skills registry"""
 
-    def __init__(self, registry_path: str = None):
+    # Top-level keys that apply_changes() may replace
+    META_KEYS = ['version', 'categories', 'sources', 'stats']
+
+    def __init__(self, registry_path: str = None, store_path: str = None):
         """
         Initialize the registry manager
 
         Args:
             registry_path: Path to skills-registry.json file
+            store_path: Path to the SQLite registry store (default: next to the registry)
         """
         if registry_path is None:
             # Default to data/skills-registry.json relative to project root
@@ -26,7 +37,13 @@ class SkillsRegistry:
             registry_path = project_root / "data" / "skills-registry.json"
 
         self.registry_path = Path(registry_path)
+        if store_path is None:
+            store_path = self.registry_path.with_suffix('.db')
+        self.store_path = Path(store_path)
+        self.changes_path = self.registry_path.parent / "registry-changes.jsonl"
         self.data = None
+        self._index = None
+        self._store = None
 
     def load(self) -> Dict[str, Any]:
         """
@@ -39,13 +56,20 @@ class SkillsRegistry:
             FileNotFoundError: If registry file doesn't exist
             json.JSONDecodeError: If registry file is invalid JSON
         """
+        self.data = self._read_json()
+
+        # A reload may pick up external edits, so re-check the index lazily
+        self._index = None
+
+        return self.data
+
+    def _read_json(self) -> Dict[str, Any]:
+        """Read and parse the registry JSON file"""
         if not self.registry_path.exists():
             raise FileNotFoundError(f"Registry file not found: {self.registry_path}")
 
         with open(self.registry_path, 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
-
-        return self.data
+            return json.load(f)
 
     def save(self, data: Dict[str, Any] = None) -> None:
         """
@@ -63,46 +87,367 @@ class SkillsRegistry:
         # Update last_updated timestamp
         self.data['last_updated'] = datetime.now().isoformat()
 
-        with open(self.registry_path, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        # Readers never need the lock: the file is replaced atomically
+        with LockManager(self.registry_path.parent / "locks").registry_lock(self.registry_path.stem):
+            atomic_write_json(self.registry_path, self.data, indent=2)
+            self._update_store()
+            self._index = None
 
-    def search(self, query: str, category: str = None, source_type: str = None) -> List[Dict[str, Any]]:
+    def apply_changes(
+        self,
+        upserts: Dict[str, Dict[str, Any]],
+        removed: List[str],
+        meta: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
         """
-        Search for skills by name, description, or tags
+        Apply skill-level changes to the registry
+
+        Only the given skills are written to the SQLite store and re-indexed;
+        the rest of the registry is left alone. The JSON file, which remains
+        the interchange format, is rewritten once, and only if something
+        actually changed. Each effective change is appended to the change
+        log (see changes_since()).
+
+        Args:
+            upserts: Map of skill_id -> skill to add or replace
+            removed: Skill identifiers to delete
+            meta: Optional top-level values to replace (see META_KEYS)
+
+        Returns:
+            Change record with 'seq', 'time', and the 'added', 'changed' and
+            'removed' skill IDs (empty lists and no 'seq' if nothing changed)
+        """
+        record = {"added": [], "changed": [], "removed": []}
+
+        with LockManager(self.registry_path.parent / "locks").registry_lock(self.registry_path.stem):
+            old_fingerprint = file_fingerprint(self.registry_path)
+            data = self._read_json()
+            skills = data.setdefault('skills', {})
+
+            applied = {}
+            for skill_id, skill in upserts.items():
+                if skill_id not in skills:
+                    record['added'].append(skill_id)
+                elif skill_hash(skills[skill_id]) != skill_hash(skill):
+                    record['changed'].append(skill_id)
+                else:
+                    continue
+                skills[skill_id] = skill
+                applied[skill_id] = skill
+
+            for skill_id in removed:
+                if skills.pop(skill_id, None) is not None:
+                    record['removed'].append(skill_id)
+
+            meta = {key: value for key, value in (meta or {}).items() if key in self.META_KEYS}
+            meta_changed = any(
+                data.get(key) != value for key, value in meta.items() if key != 'stats'
+            )
+            if not (applied or record['removed'] or meta_changed):
+                self.data = data
+                return record
+
+            data.update(meta)
+            if isinstance(data.get('stats'), dict):
+                data['stats']['total_skills'] = len(skills)
+            data['last_updated'] = datetime.now().isoformat()
+
+            atomic_write_json(self.registry_path, data, indent=2)
+            fingerprint = file_fingerprint(self.registry_path)
+            self.data = data
+
+            self._apply_to_store(applied, record['removed'], old_fingerprint, fingerprint)
+            self._index = None
+
+            record = self._log_changes(record)
+
+        return record
+
+    def _apply_to_store(
+        self,
+        upserts: Dict[str, Dict[str, Any]],
+        removed: List[str],
+        old_fingerprint: Any,
+        fingerprint: Any
+    ) -> None:
+        """Write a change set to the SQLite store, or resync it if it was already stale"""
+        if not RegistryStore.is_available():
+            return
+
+        store = self._store or RegistryStore(self.store_path)
+        try:
+            if store.is_fresh(old_fingerprint):
+                store.apply_changes(upserts, removed, self.data, fingerprint)
+            else:
+                store.sync(self.data, fingerprint)
+        except (StoreError, OSError):
+            store.close()
+            self._store = None
+            return
+
+        self._store = store
+
+    def _log_changes(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Number a change record and append it to the change log"""
+        last = read_json_lines(self.changes_path)
+        record = {
+            "seq": (last[-1].get('seq', 0) if last else 0) + 1,
+            "time": datetime.now().isoformat(),
+            **record,
+        }
+        append_json_line(self.changes_path, record)
+        return record
+
+    def changes_since(self, seq: int = 0) -> List[Dict[str, Any]]:
+        """
+        Read the change log
+
+        Consumers (search indexes, UIs) remember the last 'seq' they have
+        seen and ask only for newer records.
+
+        Args:
+            seq: Last sequence number already processed
+
+        Returns:
+            Change records with a greater 'seq', oldest first
+        """
+        return [record for record in read_json_lines(self.changes_path) if record.get('seq', 0) > seq]
+
+    def _get_store(self) -> Optional[RegistryStore]:
+        """
+        Get the SQLite store, rebuilding it if the registry changed on disk
+
+        Returns:
+            Registry store, or None if SQLite is unavailable, the registry file
+            doesn't exist or the store can't be used
+        """
+        if self._store is not None:
+            return self._store
+
+        # Don't leave an empty database behind for a registry that isn't there
+        if not RegistryStore.is_available() or not self.registry_path.exists():
+            return None
+
+        fingerprint = file_fingerprint(self.registry_path)
+        store = RegistryStore(self.store_path)
+
+        try:
+            if not store.is_fresh(fingerprint):
+                store.sync(self._read_json(), fingerprint)
+        except (StoreError, OSError):
+            # Fall back to reading the JSON file directly
+            store.close()
+            return None
+
+        self._store = store
+        return store
+
+    def _update_store(self) -> None:
+        """Write only the changed skills of self.data to the SQLite store"""
+        if not RegistryStore.is_available():
+            return
+
+        store = self._store or RegistryStore(self.store_path)
+        try:
+            store.sync(self.data, file_fingerprint(self.registry_path))
+        except (StoreError, OSError):
+            store.close()
+            self._store = None
+            return
+
+        self._store = store
+
+    def _get_index(self) -> SearchIndex:
+        """
+        Get the search index
+
+        The index is kept in the SQLite store alongside the skills, so only
+        the rows of a query's terms are read. Without SQLite it is built in
+        memory from the registry JSON.
+
+        Returns:
+            Search index in sync with the registry file
+        """
+        if self._index is not None:
+            return self._index
+
+        store = self._get_store()
+        if store is not None:
+            index = store.search_index()
+        else:
+            index = SearchIndex()
+            index.build((self.data if self.data is not None else self.load()).get('skills', {}))
+
+        self._index = index
+        return index
+
+    def iter_skills(self, category: str = None, source_type: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream skills in registry order
+
+        Reads from the SQLite store when possible, so the whole registry
+        is never held in memory.
 
         Args:
-            query: Search query string
             category: Optional category filter
             source_type: Optional source type filter (github, local)
 
-        Returns:
-            List of matching skill dictionaries
+        Yields:
+            Skill dictionaries
         """
+        for _, skill in self._iter_items(category, source_type):
+            yield skill
+
+    def _iter_items(self, category: str = None, source_type: str = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream (skill_id, skill) pairs in registry order"""
         if self.data is None:
+            store = self._get_store()
+            if store is not None:
+                yield from store.iter_skills(category, source_type)
+                return
             self.load()
 
-        query_lower = query.lower()
-        results = []
-
         for skill_id, skill in self.data.get('skills', {}).items():
-            # Apply filters
             if category and skill.get('metadata', {}).get('category') != category:
                 continue
-
             if source_type and skill.get('source', {}).get('type') != source_type:
                 continue
+            yield skill_id, skill
+
+    def search(
+        self,
+        query: str,
+        category: str = None,
+        source_type: str = None,
+        limit: int = None,
+        tag: str = None,
+        author: str = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for skills by name, description, or tags
+
+        Query words match whole words, prefixes, substrings or, failing
+        those, words within a typo or two. Skills matching more of the query
+        come first, then by BM25 relevance.
+
+        Args:
+            query: Search query string
+            category: Optional category filter
+            source_type: Optional source type filter (github, local)
+            limit: Return at most this many results
+            tag: Optional tag filter
+            author: Optional author filter
+
+        Returns:
+            List of matching skill dictionaries, best match first
+        """
+        return [skill for skill, _ in self.search_scored(query, category, source_type, limit, tag, author)]
+
+    def search_scored(
+        self,
+        query: str,
+        category: str = None,
+        source_type: str = None,
+        limit: int = None,
+        tag: str = None,
+        author: str = None
+    ) -> List[Tuple[Dict[str, Any], Optional[float]]]:
+        """
+        Search for skills and return their relevance scores
+
+        Args:
+            query: Search query string
+            category: Optional category filter
+            source_type: Optional source type filter (github, local)
+            limit: Return at most this many results
+            tag: Optional tag filter
+            author: Optional author filter
+
+        Returns:
+            List of (skill, score) tuples, best match first. An empty query
+            lists skills in registry order with a score of None.
+        """
+        # An empty query lists everything that passes the filters, in registry order
+        if not tokenize(query):
+            if not (tag or author):
+                return [(skill, None) for skill in islice(self.iter_skills(category, source_type), limit)]
+            index = self._get_index()
+            skill_ids = index.ordered_ids(index.filter_ids(category, source_type, tag, author))[:limit]
+            return [(skill, None) for skill in self._get_many(skill_ids).values()]
+
+        ranked = self._get_index().search(query, category, source_type, limit, tag, author)
+        skills = self._get_many(skill_id for skill_id, _ in ranked)
+        return [(skills[skill_id], score) for skill_id, score in ranked if skill_id in skills]
+
+    def browse(
+        self,
+        query: str = "",
+        category: str = None,
+        source_type: str = None,
+        tag: str = None,
+        author: str = None,
+        offset: int = 0,
+        limit: int = None
+    ) -> Dict[str, Any]:
+        """
+        List one page of skills together with facet counts
+
+        Filters are resolved from the search index's facet tables, so neither
+        the page nor the counts require reading every skill: only the skills
+        on the requested page are loaded. Unfiltered pages are read from the
+        SQLite store by position, with the facet counts it keeps up to date.
+
+        Args:
+            query: Optional search query; empty lists skills in registry order
+            category: Optional category filter
+            source_type: Optional source type filter (github, local)
+            tag: Optional tag filter
+            author: Optional author filter
+            offset: Number of matching skills to skip
+            limit: Return at most this many skills
+
+        Returns:
+            Dictionary with 'total' (number of matching skills), 'skills'
+            (the requested page) and 'facets' (facet -> value -> count over
+            all matching skills)
+        """
+        index = self._get_index()
+        store = self._get_store()
+
+        if store is not None and not (tokenize(query) or category or source_type or tag or author):
+            return {
+                'total': store.count(),
+                'skills': [skill for _, skill in store.iter_skills(offset=offset, limit=limit)],
+                'facets': index.facet_counts(),
+            }
+
+        allowed = index.filter_ids(category, source_type, tag, author)
+
+        if tokenize(query):
+            skill_ids = [skill_id for skill_id, _ in index.search(query, category, source_type, None, tag, author)]
+            matched = set(skill_ids)
+        else:
+            skill_ids = index.ordered_ids(allowed)
+            matched = allowed
+
+        end = offset + limit if limit is not None else None
+        return {
+            'total': len(skill_ids),
+            'skills': list(self._get_many(skill_ids[offset:end]).values()),
+            'facets': index.facet_counts(matched),
+        }
 
-            # Search in name, description, and tags
-            name = skill.get('name', '').lower()
-            description = skill.get('description', '').lower()
-            tags = [tag.lower() for tag in skill.get('metadata', {}).get('tags', [])]
+    def _get_many(self, skill_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Load skills by id into a skill_id -> skill map in the given order, skipping unknown ids"""
+        skill_ids = list(skill_ids)
 
-            if (query_lower in name or
-                query_lower in description or
-                any(query_lower in tag for tag in tags)):
-                results.append(skill)
+        if self.data is not None:
+            skills = self.data.get('skills', {})
+        else:
+            store = self._get_store()
+            skills = store.get_many(skill_ids) if store is not None else self.load().get('skills', {})
 
-        return results
+        return {skill_id: skills[skill_id] for skill_id in skill_ids if skill_id in skills}
 
     def get_skill(self, skill_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -115,6 +460,9 @@ class SkillsRegistry:
             Skill dictionary or None if not found
         """
         if self.data is None:
+            store = self._get_store()
+            if store is not None:
+                return store.get(skill_name)
             self.load()
 
         return self.data.get('skills', {}).get(skill_name)
@@ -129,16 +477,17 @@ class SkillsRegistry:
         Returns:
             List of all skill dictionaries
         """
+        return list(self.iter_skills(category))
+
+    def _get_top_level(self, key: str) -> Any:
+        """Get a top-level registry value without loading every skill"""
         if self.data is None:
+            store = self._get_store()
+            if store is not None:
+                return store.get_meta(key) or {}
             self.load()
 
-        skills = self.data.get('skills', {})
-
-        if category:
-            return [skill for skill in skills.values()
-                    if skill.get('metadata', {}).get('category') == category]
-
-        return list(skills.values())
+        return self.data.get(key, {})
 
     def get_categories(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -147,10 +496,7 @@ class SkillsRegistry:
         Returns:
             Dictionary of categories
         """
-        if self.data is None:
-            self.load()
-
-        return self.data.get('categories', {})
+        return self._get_top_level('categories')
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -159,10 +505,7 @@ class SkillsRegistry:
         Returns:
             Dictionary containing registry stats
         """
-        if self.data is None:
-            self.load()
-
-        return self.data.get('stats', {})
+        return self._get_top_level('stats')
 
 
 class InstalledSkillsRegistry:
@@ -181,15 +524,46 @@ class InstalledSkillsRegistry:
             registry_path = project_root / "data" / "installed-skills.json"
 
         self.registry_path = Path(registry_path)
+        self.journal_path = self.registry_path.with_suffix('.journal')
+        self.lock_manager = LockManager(self.registry_path.parent / "locks")
         self.data = None
 
+        # Mutations recorded since the last commit, and batch nesting depth
+        self._pending: List[Dict[str, Any]] = []
+        self._dirty = False
+        self._batch_depth = 0
+
     def load(self) -> Dict[str, Any]:
         """
         Load the installed skills registry from disk
 
+        Any committed transactions left in the journal by an interrupted
+        write are replayed onto the snapshot.
+
         Returns:
             Dictionary containing the registry data
         """
+        with self._lock(shared=True):
+            needs_write = self._read_state()
+
+        if needs_write:
+            with self._lock():
+                if self._read_state():
+                    self._write_snapshot()
+
+        return self.data
+
+    def _lock(self, shared: bool = False):
+        """Get the lock guarding the registry file and its journal"""
+        return self.lock_manager.registry_lock(self.registry_path.stem, shared=shared)
+
+    def _read_state(self) -> bool:
+        """
+        Read the snapshot and replay the journal into self.data
+
+        Returns:
+            True if the on-disk state needs to be rewritten (missing file or journal replayed)
+        """
         if not self.registry_path.exists():
             # Create default empty registry
             self.data = {
@@ -201,13 +575,93 @@ class InstalledSkillsRegistry:
                     "update_interval_hours": 24
                 }
             }
-            self.save()
-            return self.data
+        else:
+            with open(self.registry_path, 'r', encoding='utf-8') as f:
+                self.data = json.load(f)
 
-        with open(self.registry_path, 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
+        transactions = read_json_lines(self.journal_path)
+        for transaction in transactions:
+            for op in transaction.get('ops', []):
+                self._apply_op(op)
 
-        return self.data
+        return bool(transactions) or not self.registry_path.exists()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several mutations into one transaction
+
+        Mutations inside the block are applied in memory and written with a
+        single journaled, atomic save when the outermost block exits. If the
+        block raises, the in-memory changes are discarded.
+
+        Example:
+            with registry.batch():
+                for name in names:
+                    registry.update_validity(name, True)
+        """
+        if self.data is None:
+            self.load()
+
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._pending = []
+                self._dirty = False
+                self.load()
+            raise
+        else:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._commit()
+
+    def _record(self, op: Dict[str, Any]) -> None:
+        """Apply a mutation in memory and commit it unless a batch is open"""
+        self._apply_op(op)
+        self._pending.append(op)
+        if self._batch_depth == 0:
+            self._commit()
+
+    def _apply_op(self, op: Dict[str, Any]) -> None:
+        """Apply a single journal operation to self.data"""
+        skills = self.data.setdefault('installed_skills', {})
+        if op['op'] == 'put':
+            skills[op['name']] = op['entry']
+        elif op['op'] == 'delete':
+            skills.pop(op['name'], None)
+
+    def _commit(self) -> None:
+        """Journal pending mutations, then write one atomic snapshot"""
+        if not self._pending and not self._dirty:
+            return
+
+        with self._lock():
+            if not self._dirty:
+                # Rebase onto the latest on-disk state so changes made by
+                # concurrent processes to other skills are not lost
+                self._read_state()
+                for op in self._pending:
+                    self._apply_op(op)
+
+            if self._pending:
+                append_json_line(self.journal_path, {
+                    "ops": self._pending,
+                    "committed_at": datetime.now().isoformat()
+                })
+
+            self._write_snapshot()
+
+        self._pending = []
+        self._dirty = False
+
+    def _write_snapshot(self) -> None:
+        """Atomically replace the registry file and clear the journal"""
+        atomic_write_json(self.registry_path, self.data, indent=2, fsync=True)
+        if self.journal_path.exists():
+            self.journal_path.unlink()
 
     def get_project_root(self) -> Path:
         """
@@ -230,17 +684,26 @@ class InstalledSkillsRegistry:
         return self.get_project_root() / relative_path
 
     def save(self) -> None:
-        """Save the installed skills registry to disk"""
+        """
+        Save the whole installed skills registry to disk (deferred inside a batch)
+
+        Unlike add/remove/update_validity, this overwrites the file with
+        self.data as-is rather than merging with concurrent changes.
+        """
         if self.data is None:
             raise ValueError("No data to save")
 
-        with open(self.registry_path, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._commit()
 
     def add(self, skill_name: str, install_path: str, source: Dict[str, Any]) -> None:
         """
         Add a skill to the installed registry
 
+        Re-adding an installed skill (reinstall or update) keeps its
+        original installed_at timestamp.
+
         Args:
             skill_name: Name of the skill
             install_path: Path where skill is installed (can be absolute or relative)
@@ -257,16 +720,21 @@ class InstalledSkillsRegistry:
             # If path is not relative to project root, store as-is
             relative_path = install_path_obj
 
-        self.data['installed_skills'][skill_name] = {
-            "name": skill_name,
-            "install_path": str(relative_path),
-            "source": source,
-            "installed_at": datetime.now().isoformat(),
-            "last_updated": datetime.now().isoformat(),
-            "is_valid": True
-        }
+        now = datetime.now().isoformat()
+        existing = self.data['installed_skills'].get(skill_name) or {}
 
-        self.save()
+        self._record({
+            "op": "put",
+            "name": skill_name,
+            "entry": {
+                "name": skill_name,
+                "install_path": str(relative_path),
+                "source": source,
+                "installed_at": existing.get('installed_at', now),
+                "last_updated": now,
+                "is_valid": True
+            }
+        })
 
     def get_absolute_path(self, relative_path: str) -> Path:
         """
@@ -297,8 +765,7 @@ class InstalledSkillsRegistry:
             self.load()
 
         if skill_name in self.data['installed_skills']:
-            del self.data['installed_skills'][skill_name]
-            self.save()
+            self._record({"op": "delete", "name": skill_name})
             return True
 
         return False
@@ -345,7 +812,13 @@ class InstalledSkillsRegistry:
 
         return skill_name in self.data.get('installed_skills', {})
 
-    def update_validity(self, skill_name: str, is_valid: bool, error: str = None) -> None:
+    def update_validity(
+        self,
+        skill_name: str,
+        is_valid: bool,
+        error: str = None,
+        cache: Dict[str, Any] = None
+    ) -> None:
         """
         Update the validity status of an installed skill
 
@@ -353,12 +826,18 @@ class InstalledSkillsRegistry:
             skill_name: Name of the skill
             is_valid: Whether the skill is valid
             error: Optional error message if invalid
+            cache: Optional validation cache entry (see SkillValidator.validate_cached())
         """
         if self.data is None:
             self.load()
 
         if skill_name in self.data['installed_skills']:
-            self.data['installed_skills'][skill_name]['is_valid'] = is_valid
-            self.data['installed_skills'][skill_name]['validation_errors'] = error
-            self.data['installed_skills'][skill_name]['last_updated'] = datetime.now().isoformat()
-            self.save()
+            entry = dict(self.data['installed_skills'][skill_name])
+            entry['is_valid'] = is_valid
+            entry['validation_errors'] = error
+            if cache:
+                entry['validation_cache'] = cache
+            else:
+                entry.pop('validation_cache', None)
+            entry['last_updated'] = datetime.now().isoformat()
+            self._record({"op": "put", "name": skill_name, "entry": entry})
@@ -0,0 +1,556 @@
+"""
+Registry Store Module
+
+This module keeps a SQLite copy of skills-registry.json so single skills can
+be read, and lists streamed, without parsing the whole JSON file. The search
+index lives in the same database as posting, vocabulary, n-gram and facet
+tables, so a search only reads the rows of its query terms.
+
+The JSON file remains the interchange/export format; the store is derived
+from it and is rebuilt whenever the JSON changes on disk.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Set, Tuple
+
+try:
+    import sqlite3
+    StoreError = sqlite3.Error
+except ImportError:  # Some minimal Python builds ship without sqlite3
+    sqlite3 = None
+    StoreError = OSError
+
+from .search_index import SearchIndex, skill_hash, sort_facet_values
+
+
+class RegistryStore:
+    """SQLite-backed, per-skill store for the skills registry"""
+
+    # Bump when the table layout changes
+    SCHEMA_VERSION = 2
+
+    # Top-level registry keys kept in the meta table
+    META_KEYS = ['version', 'last_updated', 'categories', 'stats']
+
+    TABLES = ['skills', 'meta', 'postings', 'terms', 'ngrams', 'facets']
+
+    # Stay well below SQLite's bound-parameter limit
+    CHUNK_SIZE = 500
+
+    def __init__(self, db_path: str):
+        """
+        Initialize the registry store
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._conn = None
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check whether SQLite support is available"""
+        return sqlite3 is not None
+
+    def connect(self):
+        """
+        Open the database, creating the schema if needed
+
+        Returns:
+            SQLite connection
+        """
+        if self._conn is not None:
+            return self._conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            with conn:
+                for table in self.TABLES:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.execute(
+                    "CREATE TABLE skills ("
+                    " id TEXT PRIMARY KEY,"
+                    " position INTEGER NOT NULL,"
+                    " category TEXT,"
+                    " source_type TEXT,"
+                    " hash TEXT NOT NULL,"
+                    " data TEXT NOT NULL,"
+                    " name_length INTEGER NOT NULL DEFAULT 0,"
+                    " description_length INTEGER NOT NULL DEFAULT 0,"
+                    " tags_length INTEGER NOT NULL DEFAULT 0)"
+                )
+                conn.execute("CREATE INDEX skills_position ON skills (position)")
+                conn.execute("CREATE INDEX skills_category ON skills (category)")
+                conn.execute("CREATE INDEX skills_source_type ON skills (source_type)")
+                conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+                # Term frequency per field of every term in every skill
+                conn.execute(
+                    "CREATE TABLE postings ("
+                    " term TEXT NOT NULL,"
+                    " skill_id TEXT NOT NULL,"
+                    " name_count INTEGER NOT NULL,"
+                    " description_count INTEGER NOT NULL,"
+                    " tags_count INTEGER NOT NULL,"
+                    " PRIMARY KEY (term, skill_id)) WITHOUT ROWID"
+                )
+                # Vocabulary, for prefix and short substring lookups
+                conn.execute(
+                    "CREATE TABLE terms (term TEXT PRIMARY KEY, length INTEGER NOT NULL) WITHOUT ROWID"
+                )
+                conn.execute("CREATE INDEX terms_length ON terms (length)")
+                # Character n-grams of the vocabulary, for substring and fuzzy lookups
+                conn.execute(
+                    "CREATE TABLE ngrams ("
+                    " gram TEXT NOT NULL,"
+                    " term TEXT NOT NULL,"
+                    " PRIMARY KEY (gram, term)) WITHOUT ROWID"
+                )
+                conn.execute(
+                    "CREATE TABLE facets ("
+                    " facet TEXT NOT NULL,"
+                    " value TEXT NOT NULL,"
+                    " skill_id TEXT NOT NULL,"
+                    " PRIMARY KEY (facet, value, skill_id)) WITHOUT ROWID"
+                )
+                conn.execute("CREATE INDEX facets_skill ON facets (skill_id)")
+                conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+        self._conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close the database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        """
+        Get a top-level registry value
+
+        Args:
+            key: Meta key (e.g. 'categories', 'stats')
+            default: Value returned if the key is missing
+
+        Returns:
+            Decoded JSON value
+        """
+        row = self.connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def is_fresh(self, fingerprint: Any) -> bool:
+        """
+        Check whether the store was built from the given registry state
+
+        Args:
+            fingerprint: Fingerprint of the registry JSON file
+
+        Returns:
+            True if the store matches the fingerprint
+        """
+        stored = self.get_meta('source_fingerprint')
+        return stored is not None and list(stored) == list(fingerprint)
+
+    def sync(self, data: Dict[str, Any], fingerprint: Any) -> Tuple[int, int]:
+        """
+        Bring the store in line with full registry data
+
+        Only rows whose content hash or position changed are written, and
+        only skills whose content changed are re-indexed.
+
+        Args:
+            data: Registry data dictionary
+            fingerprint: Fingerprint of the registry JSON file
+
+        Returns:
+            Tuple of (rows_written, rows_deleted)
+        """
+        conn = self.connect()
+        skills = data.get('skills', {})
+
+        existing = {
+            row[0]: (row[1], row[2])
+            for row in conn.execute("SELECT id, hash, position FROM skills")
+        }
+
+        rows = []
+        moved = []
+        entries = {}
+        for position, (skill_id, skill) in enumerate(skills.items()):
+            digest = skill_hash(skill)
+            stored = existing.get(skill_id)
+            if stored == (digest, position):
+                continue
+            if stored is not None and stored[0] == digest:
+                moved.append((position, skill_id))
+                continue
+            entries[skill_id] = SearchIndex.analyze(skill)
+            rows.append(self._skill_row(skill_id, position, skill, digest, entries[skill_id]))
+
+        removed = [skill_id for skill_id in existing if skill_id not in skills]
+
+        with conn:
+            terms = self._unindex(conn, removed + list(entries))
+            conn.executemany("DELETE FROM skills WHERE id = ?", [(skill_id,) for skill_id in removed])
+            conn.executemany("UPDATE skills SET position = ? WHERE id = ?", moved)
+            conn.executemany(
+                "INSERT OR REPLACE INTO skills (id, position, category, source_type, hash, data,"
+                " name_length, description_length, tags_length)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            terms |= self._index(conn, entries)
+            self._update_vocabulary(conn, terms)
+            self._write_meta(conn, data, fingerprint)
+
+        return len(rows) + len(moved), len(removed)
+
+    def apply_changes(
+        self,
+        upserts: Dict[str, Dict[str, Any]],
+        removed: List[str],
+        meta: Dict[str, Any],
+        fingerprint: Any
+    ) -> None:
+        """
+        Write a known set of changes without scanning the other rows
+
+        Changed skills keep their position; new skills are appended after
+        the last one, matching where they land in the registry JSON.
+
+        Args:
+            upserts: Map of skill_id -> skill for added or changed skills
+            removed: Skill identifiers to delete
+            meta: Top-level registry values (see META_KEYS)
+            fingerprint: Fingerprint of the registry JSON file after the change
+        """
+        conn = self.connect()
+        entries = {skill_id: SearchIndex.analyze(skill) for skill_id, skill in upserts.items()}
+
+        with conn:
+            terms = self._unindex(conn, list(removed) + list(upserts))
+            conn.executemany("DELETE FROM skills WHERE id = ?", [(skill_id,) for skill_id in removed])
+
+            next_position = conn.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM skills").fetchone()[0]
+            for skill_id, skill in upserts.items():
+                row = self._skill_row(skill_id, next_position, skill, skill_hash(skill), entries[skill_id])
+                cursor = conn.execute(
+                    "UPDATE skills SET category = ?, source_type = ?, hash = ?, data = ?,"
+                    " name_length = ?, description_length = ?, tags_length = ? WHERE id = ?",
+                    row[2:] + (skill_id,)
+                )
+                if cursor.rowcount == 0:
+                    conn.execute(
+                        "INSERT INTO skills (id, position, category, source_type, hash, data,"
+                        " name_length, description_length, tags_length)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        row
+                    )
+                    next_position += 1
+
+            terms |= self._index(conn, entries)
+            self._update_vocabulary(conn, terms)
+            self._write_meta(conn, meta, fingerprint)
+
+    @staticmethod
+    def _skill_row(
+        skill_id: str,
+        position: int,
+        skill: Dict[str, Any],
+        digest: str,
+        entry: Dict[str, Any]
+    ) -> Tuple:
+        """Build a skills table row (see SearchIndex.analyze for `entry`)"""
+        metadata = skill.get('metadata', {}) or {}
+        source = skill.get('source', {}) or {}
+        return (
+            skill_id,
+            position,
+            metadata.get('category'),
+            source.get('type'),
+            digest,
+            json.dumps(skill, ensure_ascii=False),
+        ) + tuple(entry['lengths'])
+
+    @staticmethod
+    def _unindex(conn, skill_ids: List[str]) -> Set[str]:
+        """
+        Drop skills' postings and facet values, returning the terms they used
+
+        The rows to delete are found by re-analyzing the stored skills, so
+        the postings table needs no index by skill.
+        """
+        terms = set()
+        for skill_id in skill_ids:
+            row = conn.execute("SELECT data FROM skills WHERE id = ?", (skill_id,)).fetchone()
+            if row is None:
+                continue
+            entry = SearchIndex.analyze(json.loads(row[0]))
+            conn.executemany(
+                "DELETE FROM postings WHERE term = ? AND skill_id = ?",
+                [(term, skill_id) for term in entry['terms']]
+            )
+            conn.execute("DELETE FROM facets WHERE skill_id = ?", (skill_id,))
+            terms.update(entry['terms'])
+        return terms
+
+    @staticmethod
+    def _index(conn, entries: Dict[str, Dict[str, Any]]) -> Set[str]:
+        """Add skills' postings and facet values, returning the terms they use"""
+        # Inserting in key order appends to the table's B-tree instead of
+        # splitting pages all over it, which matters for a full rebuild
+        postings = sorted(
+            (term, skill_id) + tuple(counts)
+            for skill_id, entry in entries.items()
+            for term, counts in entry['terms'].items()
+        )
+        conn.executemany(
+            "INSERT INTO postings (term, skill_id, name_count, description_count, tags_count)"
+            " VALUES (?, ?, ?, ?, ?)",
+            postings
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO facets (facet, value, skill_id) VALUES (?, ?, ?)",
+            (
+                (facet, value, skill_id)
+                for skill_id, entry in entries.items()
+                for facet, value in entry['facets']
+            )
+        )
+        return {term for entry in entries.values() for term in entry['terms']}
+
+    @staticmethod
+    def _update_vocabulary(conn, terms: Set[str]) -> None:
+        """Add terms that gained their first posting, drop those that lost their last"""
+        added = []
+        dropped = []
+        for term in terms:
+            used = conn.execute("SELECT 1 FROM postings WHERE term = ? LIMIT 1", (term,)).fetchone() is not None
+            known = conn.execute("SELECT 1 FROM terms WHERE term = ?", (term,)).fetchone() is not None
+            if used and not known:
+                added.append(term)
+            elif known and not used:
+                dropped.append(term)
+
+        conn.executemany("DELETE FROM terms WHERE term = ?", [(term,) for term in dropped])
+        conn.executemany(
+            "DELETE FROM ngrams WHERE gram = ? AND term = ?",
+            [(gram, term) for term in dropped for gram in SearchIndex.term_ngrams(term)]
+        )
+        conn.executemany("INSERT INTO terms (term, length) VALUES (?, ?)", [(term, len(term)) for term in added])
+        conn.executemany(
+            "INSERT INTO ngrams (gram, term) VALUES (?, ?)",
+            [(gram, term) for term in added for gram in SearchIndex.term_ngrams(term)]
+        )
+
+    def _write_meta(self, conn, meta: Dict[str, Any], fingerprint: Any) -> None:
+        """Store the top-level registry values, facet counts and source fingerprint"""
+        facet_counts = {facet: {} for facet in SearchIndex.FACETS}
+        for facet, value, count in conn.execute("SELECT facet, value, COUNT(*) FROM facets GROUP BY facet, value"):
+            facet_counts.setdefault(facet, {})[value] = count
+
+        values = {key: meta.get(key) for key in self.META_KEYS}
+        values['facet_counts'] = {facet: sort_facet_values(counts) for facet, counts in facet_counts.items()}
+        values['source_fingerprint'] = list(fingerprint)
+        conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value, ensure_ascii=False)) for key, value in values.items()]
+        )
+
+    def get(self, skill_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a single skill
+
+        Args:
+            skill_id: Skill identifier
+
+        Returns:
+            Skill dictionary or None if not found
+        """
+        row = self.connect().execute("SELECT data FROM skills WHERE id = ?", (skill_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_many(self, skill_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several skills by id
+
+        Args:
+            skill_ids: Skill identifiers
+
+        Returns:
+            Map of skill_id -> skill dictionary for the ids that exist
+        """
+        return {
+            skill_id: json.loads(data)
+            for skill_id, data in self.select_in("SELECT id, data FROM skills WHERE id IN ({})", skill_ids)
+        }
+
+    def select_in(self, sql: str, values: Iterable[Any]) -> Iterator[Tuple]:
+        """
+        Run a query with an IN list in chunks
+
+        Args:
+            sql: Query with a '{}' where the placeholders go
+            values: Values for the IN list
+
+        Yields:
+            Result rows
+        """
+        conn = self.connect()
+        values = list(values)
+        for start in range(0, len(values), self.CHUNK_SIZE):
+            chunk = values[start:start + self.CHUNK_SIZE]
+            yield from conn.execute(sql.format(', '.join('?' * len(chunk))), chunk)
+
+    def count(self) -> int:
+        """Get the number of skills"""
+        return self.connect().execute("SELECT COUNT(*) FROM skills").fetchone()[0]
+
+    def iter_skills(
+        self,
+        category: str = None,
+        source_type: str = None,
+        offset: int = 0,
+        limit: int = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Stream skills in registry order
+
+        Args:
+            category: Optional category filter
+            source_type: Optional source type filter
+            offset: Number of matching skills to skip
+            limit: Maximum number of skills to yield
+
+        Yields:
+            Tuples of (skill_id, skill dictionary)
+        """
+        clauses = []
+        params = []
+        if category:
+            clauses.append("category = ?")
+            params.append(category)
+        if source_type:
+            clauses.append("source_type = ?")
+            params.append(source_type)
+
+        sql = "SELECT id, data FROM skills"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY position"
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([-1 if limit is None else limit, offset])
+
+        for skill_id, data in self.connect().execute(sql, params):
+            yield skill_id, json.loads(data)
+
+    def search_index(self) -> 'StoredSearchIndex':
+        """Get a search index that reads from this store's index tables"""
+        return StoredSearchIndex(self)
+
+
+class StoredSearchIndex(SearchIndex):
+    """SearchIndex answered from the registry store's tables instead of memory"""
+
+    def __init__(self, store: RegistryStore):
+        """
+        Initialize the index
+
+        Args:
+            store: Registry store holding the index tables
+        """
+        super().__init__()
+        self.store = store
+        self._doc_count: Optional[int] = None
+
+    def doc_count(self) -> int:
+        if self._doc_count is None:
+            self._doc_count = self.store.count()
+        return self._doc_count
+
+    def average_lengths(self) -> List[float]:
+        if self._average_lengths is None:
+            row = self.store.connect().execute(
+                "SELECT AVG(name_length), AVG(description_length), AVG(tags_length) FROM skills"
+            ).fetchone()
+            self._average_lengths = [max(average or 0.0, 1.0) for average in row]
+        return self._average_lengths
+
+    def term_postings(self, terms: Iterable[str]) -> Dict[str, Dict[str, Tuple[List[int], List[int]]]]:
+        result = {term: {} for term in terms}
+        rows = self.store.select_in(
+            "SELECT p.term, p.skill_id, p.name_count, p.description_count, p.tags_count,"
+            " s.name_length, s.description_length, s.tags_length"
+            " FROM postings p JOIN skills s ON s.id = p.skill_id WHERE p.term IN ({})",
+            result
+        )
+        for row in rows:
+            result[row[0]][row[1]] = (list(row[2:5]), list(row[5:8]))
+        return result
+
+    def prefix_terms(self, token: str) -> List[str]:
+        terms = []
+        for (term,) in self.store.connect().execute("SELECT term FROM terms WHERE term >= ? ORDER BY term", (token,)):
+            if not term.startswith(token):
+                break
+            terms.append(term)
+        return terms
+
+    def substring_candidates(self, token: str) -> Iterable[str]:
+        if len(token) < self.NGRAM_SIZE:
+            rows = self.store.connect().execute("SELECT term FROM terms WHERE instr(term, ?) > 0", (token,))
+            return [row[0] for row in rows]
+        grams = self.term_ngrams(token)
+        return self._terms_sharing(grams, len(grams))
+
+    def fuzzy_candidates(self, token: str, limit: int) -> Iterable[str]:
+        grams = self.term_ngrams(token)
+        required = len(grams) - limit * self.NGRAM_SIZE
+        if required > 0:
+            return self._terms_sharing(grams, required)
+
+        rows = self.store.connect().execute(
+            "SELECT term FROM terms WHERE length BETWEEN ? AND ?",
+            (len(token) - limit, len(token) + limit)
+        )
+        return [row[0] for row in rows]
+
+    def _terms_sharing(self, grams: Set[str], required: int) -> List[str]:
+        """Get the terms that have at least `required` of the given n-grams"""
+        grams = sorted(grams)
+        placeholders = ', '.join('?' * len(grams))
+        rows = self.store.connect().execute(
+            f"SELECT term FROM ngrams WHERE gram IN ({placeholders}) GROUP BY term HAVING COUNT(*) >= ?",
+            grams + [required]
+        )
+        return [row[0] for row in rows]
+
+    def facet_ids(self, facet: str, value: str) -> Set[str]:
+        rows = self.store.connect().execute(
+            "SELECT skill_id FROM facets WHERE facet = ? AND value = ?", (facet, value)
+        )
+        return {row[0] for row in rows}
+
+    def facet_counts(self, ids: Optional[Set[str]] = None) -> Dict[str, Dict[str, int]]:
+        if ids is None:
+            stored = self.store.get_meta('facet_counts', {})
+            return {facet: stored.get(facet, {}) for facet in self.FACETS}
+
+        counts = {facet: {} for facet in self.FACETS}
+        for facet, value in self.store.select_in("SELECT facet, value FROM facets WHERE skill_id IN ({})", ids):
+            values = counts.setdefault(facet, {})
+            values[value] = values.get(value, 0) + 1
+        return {facet: sort_facet_values(counts[facet]) for facet in self.FACETS}
+
+    def ordered_ids(self, ids: Optional[Set[str]] = None) -> List[str]:
+        if ids is None:
+            rows = self.store.connect().execute("SELECT id FROM skills ORDER BY position")
+            return [row[0] for row in rows]
+
+        positions = dict(self.store.select_in("SELECT id, position FROM skills WHERE id IN ({})", ids))
+        return sorted(positions, key=positions.get)
@@ -4,17 +4,131 @@ Remote Registry Fetcher Module
 This module handles fetching the skills registry from remote GitHub repositories.
 """
 
+import base64
 import json
+import posixpath
+import re
 import requests
 import hashlib
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+from .fileio import atomic_write_json, file_fingerprint
+from .json_stream import load_json_object
+from .locking import LockManager
+from .search_index import skill_hash
+
+
+# "format" of a sharded source's manifest
+SHARD_FORMAT = "sharded-v1"
+
+
+def diff_registries(old: Optional[Dict[str, Any]], new: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    Compare the skills of two registries by content hash
+
+    Args:
+        old: Previous registry data (None means empty)
+        new: New registry data
+
+    Returns:
+        Dictionary with 'added', 'changed' and 'removed' skill IDs
+    """
+    old_skills = (old or {}).get('skills', {})
+    new_skills = new.get('skills', {})
+
+    return {
+        'added': [skill_id for skill_id in new_skills if skill_id not in old_skills],
+        'changed': [
+            skill_id for skill_id, skill in new_skills.items()
+            if skill_id in old_skills and skill_hash(old_skills[skill_id]) != skill_hash(skill)
+        ],
+        'removed': [skill_id for skill_id in old_skills if skill_id not in new_skills],
+    }
+
+
+
+def write_sharded_registry(data: Dict[str, Any], manifest_path: Path, by: str = "category") -> Dict[str, Any]:
+    """
+    Publish a registry in the sharded layout
+
+    Skills are split into shard files under shards/ next to the manifest,
+    one per category ("category") or per first character of the skill ID
+    ("prefix"). The manifest carries the registry's other top-level fields
+    and each shard's path and SHA-256, so clients only refetch shards whose
+    hash changed.
+
+    Args:
+        data: Registry data
+        manifest_path: Where to write the manifest
+        by: "category" or "prefix"
+
+    Returns:
+        The manifest that was written
+    """
+    if by not in ("category", "prefix"):
+        raise ValueError(f"Unknown shard key: {by}")
+
+    manifest_path = Path(manifest_path)
+    shard_dir = manifest_path.parent / "shards"
+
+    groups = {}
+    for skill_id, skill in data.get('skills', {}).items():
+        if by == "category":
+            key = (skill.get('metadata') or {}).get('category') or "uncategorized"
+        else:
+            key = skill_id[:1].lower() if skill_id[:1].isalnum() else "_"
+        groups.setdefault(re.sub(r'[^A-Za-z0-9._-]', '_', key), {})[skill_id] = skill
+
+    shards = {}
+    for name in sorted(groups):
+        shard_path = shard_dir / f"{name}.json"
+        atomic_write_json(shard_path, {"skills": groups[name]})
+        with open(shard_path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        shards[name] = {
+            "path": f"shards/{name}.json",
+            "sha256": digest,
+            "count": len(groups[name]),
+        }
+
+    # Drop shards left over from a previous layout
+    if shard_dir.is_dir():
+        for path in shard_dir.glob("*.json"):
+            if path.stem not in shards:
+                path.unlink()
+
+    manifest = {key: value for key, value in data.items() if key != 'skills'}
+    manifest['format'] = SHARD_FORMAT
+    manifest['shards'] = shards
+    atomic_write_json(manifest_path, manifest)
+    return manifest
 
 
 class RemoteRegistryFetcher:
     """Fetches skills registry from remote GitHub repositories"""
 
+    # Seconds to wait for a source that doesn't set its own "timeout"
+    DEFAULT_TIMEOUT = 10
+
+    # Lock held for a whole sync, so concurrent CLIs don't all refetch
+    SYNC_LOCK_NAME = "remote-sync"
+
+    # Minutes between background attempts when a sync left no cache behind
+    RETRY_MINUTES = 5
+
+    # Bytes read at a time when streaming a registry file
+    STREAM_CHUNK_SIZE = 65536
+
+    # Changed shards of a sharded source fetched at the same time
+    SHARD_WORKERS = 4
+
     def __init__(self, config_path: str = None):
         """
         Initialize the remote registry fetcher
@@ -28,6 +142,7 @@ class RemoteRegistryFetcher:
 
         self.config_path = Path(config_path)
         self.cache_path = self.config_path.parent / "remote-registry-cache.json"
+        self.source_cache_dir = self.config_path.parent / "remote-cache"
         self.config = self.load_config()
 
     def load_config(self) -> Dict[str, Any]:
@@ -50,27 +165,69 @@ class RemoteRegistryFetcher:
                 "cache": {
                     "enabled": True,
                     "ttl_hours": 24,
-                    "last_check": None,
-                    "etag": None
+                    "last_check": None
                 },
                 "auto_sync": {
                     "enabled": True,
+                    "background": True,
                     "on_search": True,
                     "on_list_all": True
                 }
             }
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(default_config, f, indent=2, ensure_ascii=False)
+            atomic_write_json(self.config_path, default_config)
             return default_config
 
         with open(self.config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            config = json.load(f)
+
+        # Validators now live in each source's cache file
+        config.get('cache', {}).pop('etag', None)
+        return config
+
+    def source_cache_path(self, source_name: str) -> Path:
+        """
+        Get the cache file of one source
+
+        Args:
+            source_name: Source name from the config
+
+        Returns:
+            Path of data/remote-cache/<source>.json
+        """
+        safe_name = re.sub(r'[^A-Za-z0-9._-]', '_', source_name)
+        return self.source_cache_dir / f"{safe_name}.json"
+
+    def load_source_cache(self, source_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Load what a source served last time, with its validators
+
+        Args:
+            source_name: Source name from the config
+
+        Returns:
+            Dictionary with 'etag', 'last_modified', 'sha', 'fetched_at' and
+            'registry', or None if the source was never fetched
+        """
+        try:
+            with open(self.source_cache_path(source_name), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save_source_cache(self, source_name: str, cache: Dict[str, Any]) -> None:
+        """
+        Save a source's registry and validators
+
+        Args:
+            source_name: Source name from the config
+            cache: Dictionary as returned by load_source_cache()
+        """
+        atomic_write_json(self.source_cache_path(source_name), cache)
 
     def save_config(self) -> None:
         """Save configuration to file"""
-        with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, indent=2, ensure_ascii=False)
+        # Read by other processes (e.g. github_bases()) while a background refresh writes it
+        atomic_write_json(self.config_path, self.config)
 
     def should_refresh(self) -> bool:
         """
@@ -82,8 +239,8 @@ class RemoteRegistryFetcher:
         if not self.config['cache']['enabled']:
             return False
 
-        # Check if cache exists
-        if not self.cache_path.exists():
+        # Check if cache exists, and holds what the sources last served
+        if not self.cache_path.exists() or self._merge_pending():
             return True
 
         # Check TTL
@@ -109,60 +266,458 @@ class RemoteRegistryFetcher:
         Returns:
             Registry data or None if fetch failed
         """
-        repo_url = source['url']
-        branch = source.get('branch', 'main')
-        skills_path = source['skills_path']
+        return self._fetch_source(source)['data']
+
+    def _fetch_source(
+        self,
+        source: Dict[str, Any],
+        deadline: float = None,
+        cancelled: threading.Event = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch one source and record how it went
 
-        # Convert GitHub URL to API URL
-        # https://github.com/zongwu233/skills-registry
-        # -> https://api.github.com/repos/zongwu233/skills-registry/contents/skills/skills-registry.json
+        The file is streamed from the raw endpoint, or read through the
+        contents API when the source sets "endpoint": "contents". The request
+        is conditional on the source's own ETag and Last-Modified validators.
+        A 304, or a 200 whose content SHA matches the cached one, is reported
+        as 'not_modified' and answered from the source's cache file. New
+        content is written to the cache file.
+
+        For a source with "layout": "sharded", skills_path names a shard
+        manifest instead, and only the shards whose hash changed are fetched.
+        A "mirror" source reads the registry served by serve_registry.py.
+
+        Args:
+            source: Source configuration dictionary
+            deadline: time.monotonic() value after which the fetch gives up;
+                request timeouts are capped at the time left
+            cancelled: Set by the caller once it has reported the source as
+                timed out; the cache file is then left untouched
+
+        Returns:
+            Result dictionary with 'name', 'priority', 'status' ('ok',
+            'not_modified' or 'error'), 'data', 'latency_ms' and 'error'
+            (plus 'shards' with fetched/total counts for sharded sources)
+        """
+        name = source.get('name', source.get('url', ''))
+        result = {
+            "name": name,
+            "priority": source.get('priority', 999),
+            "status": "error",
+            "data": None,
+            "latency_ms": 0,
+            "error": None,
+        }
+        start = time.monotonic()
+
+        try:
+            source_type = source.get('type', 'github')
+            if source_type not in ('github', 'mirror'):
+                raise ValueError(f"Unsupported source type: {source_type}")
+
+            cache = self.load_source_cache(name)
+            headers = {}
+            if cache and cache.get('registry') is not None:
+                if cache.get('etag'):
+                    headers['If-None-Match'] = cache['etag']
+                if cache.get('last_modified'):
+                    headers['If-Modified-Since'] = cache['last_modified']
+
+            timeout = self._time_left(deadline, source.get('timeout', self.DEFAULT_TIMEOUT))
+            sharded = source_type == 'github' and source.get('layout') == 'sharded'
+            if source_type == 'mirror':
+                url = f"{source['url'].rstrip('/')}/registry.json"
+                response, sha, data = self._stream_json(url, headers, timeout, deadline=deadline)
+            elif sharded:
+                response, sha, data = self._get_raw(
+                    source, source['skills_path'], headers, timeout, nested=(), deadline=deadline
+                )
+            elif source.get('endpoint', 'raw') == 'contents':
+                response, sha, data = self._get_contents(source, headers, timeout)
+            else:
+                response, sha, data = self._get_raw(source, source['skills_path'], headers, timeout, deadline=deadline)
+
+            if response.status_code == 304 and headers:
+                result['status'] = "not_modified"
+                result['data'] = cache['registry']
+            else:
+                validators = {
+                    "etag": response.headers.get('ETag'),
+                    "last_modified": response.headers.get('Last-Modified'),
+                    "sha": sha,
+                    "fetched_at": datetime.now().isoformat(),
+                }
+                if sharded and cache and cache.get('shards'):
+                    validators['shards'] = cache['shards']
+
+                if cache and cache.get('registry') is not None and sha and sha == cache.get('sha'):
+                    # New validators, same file: nothing to merge
+                    result['status'] = "not_modified"
+                    result['data'] = cache['registry']
+                elif sharded:
+                    result['data'], validators['shards'], result['shards'] = self._load_shards(
+                        source, data, cache, timeout, deadline
+                    )
+                    result['status'] = "ok"
+                else:
+                    result['status'] = "ok"
+                    result['data'] = data
+
+                validators['registry'] = result['data']
+                # fetch_all() already reported this source as timed out; keep
+                # the old cache so the next sync fetches it again
+                if cancelled is None or not cancelled.is_set():
+                    self.save_source_cache(name, validators)
+
+        except Exception as e:
+            result['error'] = str(e)
+
+        result['latency_ms'] = int((time.monotonic() - start) * 1000)
+        return result
+
+    @staticmethod
+    def _time_left(deadline: Optional[float], timeout: float) -> float:
+        """Cap a request timeout at the time left before a deadline"""
+        if deadline is None:
+            return timeout
+        left = deadline - time.monotonic()
+        if left <= 0:
+            raise TimeoutError("deadline exceeded")
+        return min(timeout, left)
+
+    @staticmethod
+    def _parse_repo_url(repo_url: str):
+        """Split https://github.com/<owner>/<repo> into (owner, repo)"""
         repo_parts = repo_url.replace('https://github.com/', '').split('/')
         if len(repo_parts) < 2:
-            print(f"❌ Invalid GitHub URL: {repo_url}")
-            return None
+            raise ValueError(f"Invalid GitHub URL: {repo_url}")
+        return repo_parts[0], repo_parts[1]
+
+    def _get_raw(
+        self,
+        source: Dict[str, Any],
+        path: str,
+        headers: Dict[str, str],
+        timeout: float,
+        nested: tuple = ('skills',),
+        deadline: float = None
+    ):
+        """
+        Stream a file of a source from the raw endpoint
 
-        owner, repo = repo_parts[0], repo_parts[1]
-        api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{skills_path}?ref={branch}"
+        The body is parsed while it downloads, one skill entry at a time,
+        so memory use doesn't grow with a copy of the file's text and there
+        is no size cap.
 
-        headers = {}
-        etag = self.config['cache'].get('etag')
-        if etag:
-            headers['If-None-Match'] = etag
+        Args:
+            source: Source configuration dictionary
+            path: Path of the file in the source repository
+            headers: Conditional request headers
+            timeout: Connect/read timeout in seconds
+            nested: Top-level keys parsed entry by entry
+            deadline: time.monotonic() value after which the download is abandoned
 
-        try:
-            response = requests.get(api_url, headers=headers, timeout=10)
+        Returns:
+            (response, content sha, parsed data); the data is None on a 304
+        """
+        owner, repo = self._parse_repo_url(source['url'])
+        branch = source.get('branch', 'main')
 
-            if response.status_code == 304:
-                # Not modified
-                print("ℹ️  Remote registry not modified (304)")
-                return None
+        # https://github.com/zongwu233/skills-registry
+        # -> https://raw.githubusercontent.com/zongwu233/skills-registry/main/skills/skills-registry.json
+        raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}"
+        return self._stream_json(raw_url, headers, timeout, nested, deadline)
+
+    def _stream_json(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        timeout: float,
+        nested: tuple = ('skills',),
+        deadline: float = None
+    ):
+        """
+        GET a JSON object, parsing it while it downloads
 
+        Args:
+            url: URL to fetch
+            headers: Conditional request headers
+            timeout: Connect/read timeout in seconds
+            nested: Top-level keys parsed entry by entry
+            deadline: time.monotonic() value after which the download is
+                abandoned; the read timeout alone only bounds each socket read
+
+        Returns:
+            (response, content sha, parsed data); the data is None on a 304
+        """
+        with requests.get(url, headers=headers, timeout=timeout, stream=True) as response:
+            if response.status_code == 304 and headers:
+                return response, None, None
             if response.status_code != 200:
-                print(f"❌ Failed to fetch from {repo_url}: {response.status_code}")
-                return None
+                raise ValueError(f"HTTP {response.status_code}")
+
+            digest = hashlib.sha256()
+
+            read1 = getattr(response.raw, 'read1', None)
+            if deadline is not None and read1 is not None:
+                # One socket read per chunk, so a server trickling bytes
+                # can't keep a single chunk's read going past the deadline
+                pieces = iter(lambda: read1(self.STREAM_CHUNK_SIZE, decode_content=True), b'')
+            else:
+                pieces = response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE)
+
+            def chunks():
+                for chunk in pieces:
+                    if deadline is not None and time.monotonic() > deadline:
+                        raise TimeoutError("deadline exceeded")
+                    digest.update(chunk)
+                    yield chunk
+
+            data = load_json_object(chunks(), nested=nested)
+
+        return response, f"sha256:{digest.hexdigest()}", data
+
+    def _load_shards(
+        self,
+        source: Dict[str, Any],
+        manifest: Dict[str, Any],
+        cache: Optional[Dict[str, Any]],
+        timeout: float,
+        deadline: float = None
+    ):
+        """
+        Assemble a sharded source's registry, fetching only changed shards
 
-            data = response.json()
+        Shards whose hash matches the one recorded in the source's cache
+        are taken from the cached registry; the others are fetched
+        concurrently and checked against the manifest's hash.
 
-            # Decode base64 content
-            import base64
-            content = base64.b64decode(data['content']).decode('utf-8')
-            registry_data = json.loads(content)
+        Args:
+            source: Source configuration dictionary
+            manifest: Parsed shard manifest (see build_registry_shards.py)
+            cache: The source's cache, as returned by load_source_cache()
+            timeout: Per-request timeout in seconds
+            deadline: time.monotonic() value after which fetching is abandoned
 
-            # Update ETag
-            new_etag = response.headers.get('ETag')
-            if new_etag:
-                self.config['cache']['etag'] = new_etag
+        Returns:
+            (registry data, shard index for the cache, {'fetched': n, 'total': n})
+        """
+        if manifest.get('format') != SHARD_FORMAT:
+            raise ValueError(f"Unsupported manifest format: {manifest.get('format')}")
+
+        cached_skills = ((cache or {}).get('registry') or {}).get('skills', {})
+        cached_shards = (cache or {}).get('shards') or {}
+        base = posixpath.dirname(source['skills_path'])
+
+        shards = manifest.get('shards', {})
+        index = {}
+        skills_by_shard = {}
+        changed = []
+
+        for name, shard in shards.items():
+            known = cached_shards.get(name)
+            if known and known.get('sha256') == shard.get('sha256') \
+                    and all(skill_id in cached_skills for skill_id in known.get('skills', [])):
+                index[name] = known
+                skills_by_shard[name] = {skill_id: cached_skills[skill_id] for skill_id in known['skills']}
+            else:
+                changed.append(name)
+
+        def fetch_shard(name):
+            path = posixpath.normpath(posixpath.join(base, shards[name]['path']))
+            _, sha, data = self._get_raw(
+                source, path, {}, self._time_left(deadline, timeout), deadline=deadline
+            )
+            if sha != f"sha256:{shards[name].get('sha256')}":
+                raise ValueError(f"Shard '{name}' does not match the manifest")
+            return data.get('skills', {})
+
+        if changed:
+            with ThreadPoolExecutor(max_workers=min(self.SHARD_WORKERS, len(changed))) as executor:
+                for name, shard_skills in zip(changed, executor.map(fetch_shard, changed)):
+                    skills_by_shard[name] = shard_skills
+                    index[name] = {"sha256": shards[name].get('sha256'), "skills": list(shard_skills)}
+
+        data = {key: value for key, value in manifest.items() if key not in ('format', 'shards')}
+        data['skills'] = {}
+        for name in shards:
+            data['skills'].update(skills_by_shard[name])
+
+        return data, index, {"fetched": len(changed), "total": len(shards)}
+
+    def _get_contents(self, source: Dict[str, Any], headers: Dict[str, str], timeout: float):
+        """
+        Fetch a source's registry file through the contents API
 
-            return registry_data
+        Args:
+            source: Source configuration dictionary
+            headers: Conditional request headers
+            timeout: Request timeout in seconds
 
-        except Exception as e:
-            print(f"❌ Error fetching from {repo_url}: {e}")
+        Returns:
+            (response, git blob sha, registry data); the data is None on a 304
+        """
+        owner, repo = self._parse_repo_url(source['url'])
+        branch = source.get('branch', 'main')
+
+        # https://github.com/zongwu233/skills-registry
+        # -> https://api.github.com/repos/zongwu233/skills-registry/contents/skills/skills-registry.json
+        api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{source['skills_path']}?ref={branch}"
+
+        response = requests.get(api_url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and headers:
+            return response, None, None
+        if response.status_code != 200:
+            raise ValueError(f"HTTP {response.status_code}")
+
+        data = response.json()
+        content = base64.b64decode(data['content']).decode('utf-8')
+        return response, data.get('sha'), json.loads(content)
+
+    def github_bases(self) -> Dict[str, str]:
+        """
+        Get GitHubClient base URLs that go through a mirror
+
+        The mirror is the enabled "mirror" source with the highest priority,
+        unless it sets "github": false.
+
+        Returns:
+            Dictionary with 'api_base' and 'raw_base' for GitHubClient(),
+            or an empty dictionary to talk to GitHub directly
+        """
+        mirrors = [
+            s for s in self.config.get('sources', [])
+            if s.get('type') == 'mirror' and s.get('enabled', True) and s.get('github', True)
+        ]
+        if not mirrors:
+            return {}
+
+        mirrors.sort(key=lambda x: (x.get('priority', 999), x.get('name', '')))
+        base = mirrors[0]['url'].rstrip('/')
+        return {"api_base": f"{base}/github/api", "raw_base": f"{base}/github/raw"}
+
+    def fetch_all(self) -> List[Dict[str, Any]]:
+        """
+        Fetch every enabled source concurrently
+
+        Each source is bounded by its own timeout ("timeout" in the source
+        config, in seconds). A source still running when its time is up is
+        reported as 'timeout' and not waited for, so a slow source never
+        delays the others. Its requests are bounded by the same deadline, so
+        the worker gives up shortly after, and it doesn't write its cache
+        file.
+
+        Returns:
+            Results from _fetch_source(), in priority order
+        """
+        sources = [s for s in self.config.get('sources', []) if s.get('enabled', True)]
+        sources.sort(key=lambda x: (x.get('priority', 999), x.get('name', '')))
+        if not sources:
+            return []
+
+        start = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=len(sources))
+        results = []
+        try:
+            futures = []
+            for source in sources:
+                deadline = start + source.get('timeout', self.DEFAULT_TIMEOUT)
+                cancelled = threading.Event()
+                future = executor.submit(self._fetch_source, source, deadline, cancelled)
+                futures.append((future, deadline, cancelled))
+
+            for source, (future, deadline, cancelled) in zip(sources, futures):
+                timeout = source.get('timeout', self.DEFAULT_TIMEOUT)
+                try:
+                    results.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+                except FutureTimeout:
+                    cancelled.set()
+                    results.append({
+                        "name": source.get('name', source.get('url', '')),
+                        "priority": source.get('priority', 999),
+                        "status": "timeout",
+                        "data": None,
+                        "latency_ms": int(timeout * 1000),
+                        "error": f"no response within {timeout}s",
+                    })
+        finally:
+            executor.shutdown(wait=False)
+
+        return results
+
+    def merge_sources(self, results: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Merge the registries returned by several sources
+
+        Sources are applied in priority order (ties broken by name), and the
+        first source to define a skill ID, category or source entry wins, so
+        the result doesn't depend on which response arrived first.
+
+        Args:
+            results: Results from fetch_all(); only those with data are used
+
+        Returns:
+            Merged registry data, or None if no source returned data
+        """
+        ordered = sorted(
+            (r for r in results if r.get('data')),
+            key=lambda r: (r.get('priority', 999), r.get('name', ''))
+        )
+        if not ordered:
             return None
 
+        merged = {key: value for key, value in ordered[0]['data'].items()}
+        skills = {}
+        categories = {}
+        source_entries = []
+        seen_sources = set()
+
+        for result in ordered:
+            data = result['data']
+            for skill_id, skill in data.get('skills', {}).items():
+                skills.setdefault(skill_id, skill)
+            for category_id, category in (data.get('categories') or {}).items():
+                categories.setdefault(category_id, dict(category))
+            for entry in data.get('sources') or []:
+                key = entry.get('name') or entry.get('url')
+                if key not in seen_sources:
+                    seen_sources.add(key)
+                    source_entries.append(entry)
+
+        # Category counts describe the merged set, not any single source
+        for category in categories.values():
+            if 'count' in category:
+                category['count'] = 0
+        for skill in skills.values():
+            category_id = (skill.get('metadata') or {}).get('category')
+            if category_id in categories and 'count' in categories[category_id]:
+                categories[category_id]['count'] += 1
+
+        merged['skills'] = skills
+        merged['categories'] = categories
+        merged['sources'] = source_entries
+        merged['stats'] = dict(merged.get('stats') or {})
+        merged['stats'].update({
+            'total_skills': len(skills),
+            'total_sources': len(source_entries),
+            'total_categories': len(categories),
+        })
+
+        return merged
+
     def fetch(self, force: bool = False) -> Optional[Dict[str, Any]]:
         """
         Fetch the latest registry from remote sources
 
+        All enabled sources are fetched at the same time and merged by
+        priority. Unchanged sources contribute their cached registry, so a
+        sync where no source changed costs one 304 per source.
+
+        The merged registry is returned, not written: callers persist it to
+        cache_path once they've used it (see sync()), so a failure between
+        fetching and applying doesn't hide the update from the next sync.
+
         Args:
             force: Force refresh even if cache is valid
 
@@ -174,29 +729,196 @@ class RemoteRegistryFetcher:
 
         print("🔄 Checking for remote registry updates...")
 
-        # Get enabled sources sorted by priority
-        sources = [s for s in self.config.get('sources', []) if s.get('enabled', True)]
-        sources.sort(key=lambda x: x.get('priority', 999))
+        results = self.fetch_all()
+        self._record_results(results)
+
+        for result in results:
+            if result['status'] == "ok":
+                detail = f"{len(result['data'].get('skills', {}))} skills"
+                if result.get('shards'):
+                    detail += f", {result['shards']['fetched']}/{result['shards']['total']} shards fetched"
+            elif result['status'] == "not_modified":
+                detail = "not modified (304)"
+            else:
+                detail = f"{result['status']}: {result['error']}"
+            print(f"📡 {result['name']}: {detail} ({result['latency_ms']} ms)")
+
+        fetched = [r for r in results if r['status'] == "ok"]
+        if not fetched and self._merge_pending():
+            # Sources answered 304, but what they served last time was never applied
+            fetched = [r for r in results if r['status'] == "not_modified"]
+        if not fetched:
+            self.config['cache']['last_check'] = datetime.now().isoformat()
+            self.save_config()
+            print("⚠️  No updates available from remote sources")
+            return None
 
-        for source in sources:
-            print(f"📡 Fetching from {source['name']} ({source['url']})...")
+        # Sources that failed this time still contribute their last good copy
+        for result in results:
+            if result['data'] is None:
+                cache = self.load_source_cache(result['name'])
+                if cache:
+                    result['data'] = cache.get('registry')
 
-            registry_data = self.fetch_from_github(source)
-            if registry_data:
-                # Update cache
-                self.config['cache']['last_check'] = datetime.now().isoformat()
-                self.save_config()
+        registry_data = self.merge_sources(results)
 
-                # Save to cache file
-                with open(self.cache_path, 'w', encoding='utf-8') as f:
-                    json.dump(registry_data, f, indent=2, ensure_ascii=False)
+        # Update cache
+        self.config['cache']['last_check'] = datetime.now().isoformat()
+        self.save_config()
 
-                print(f"✅ Registry updated from {source['name']}")
-                print(f"   Total skills: {len(registry_data.get('skills', {}))}")
-                return registry_data
+        names = ", ".join(r['name'] for r in fetched)
+        print(f"✅ Registry updated from {names}")
+        print(f"   Total skills: {len(registry_data.get('skills', {}))}")
+        return registry_data
+
+    def _merge_pending(self) -> bool:
+        """
+        Check whether a source cache is newer than the merged remote cache
 
-        print("⚠️  No updates available from remote sources")
-        return None
+        That happens when a fetch stored new source data but the merged
+        registry was never persisted, e.g. because applying it failed.
+
+        Returns:
+            True if the merged registry needs to be rebuilt from the source caches
+        """
+        merged_mtime = file_fingerprint(self.cache_path)[0]
+        for source in self.config.get('sources', []):
+            if not source.get('enabled', True):
+                continue
+            path = self.source_cache_path(source.get('name', source.get('url', '')))
+            if file_fingerprint(path)[0] > merged_mtime:
+                return True
+        return False
+
+    def persist(self, registry_data: Dict[str, Any]) -> None:
+        """
+        Save a merged registry from fetch() as the remote cache
+
+        Args:
+            registry_data: Registry data returned by fetch()
+        """
+        atomic_write_json(self.cache_path, registry_data)
+
+    def _record_results(self, results: List[Dict[str, Any]]) -> None:
+        """Keep the latency and outcome of each source's last fetch in the config"""
+        status = self.config['cache'].setdefault('sources', {})
+        checked_at = datetime.now().isoformat()
+        for result in results:
+            status[result['name']] = {
+                "status": result['status'],
+                "latency_ms": result['latency_ms'],
+                "checked_at": checked_at,
+                "error": result['error'],
+            }
+
+    def _sync_lock(self):
+        """Get the (unacquired) lock that serializes syncs"""
+        return LockManager(self.config_path.parent / "locks").registry_lock(self.SYNC_LOCK_NAME)
+
+    def sync(self, registry, force: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the remote sources and merge them into the local registry
+
+        The new remote registry is diffed against the previous one, and only
+        the added, changed and removed skills are applied to the local
+        registry. Skills removed upstream are only dropped locally if the
+        local copy is the one the remote used to serve, so local-only and
+        locally edited skills are kept.
+
+        Only one process syncs at a time; if another one is already
+        syncing, this returns immediately instead of fetching again.
+
+        Args:
+            registry: SkillsRegistry to update
+            force: Force refresh even if cache is valid
+
+        Returns:
+            Change record from SkillsRegistry.apply_changes() (empty if
+            there was nothing new), or None if another process is already
+            syncing
+        """
+        lock = self._sync_lock()
+        if not lock.acquire(blocking=False):
+            return None
+
+        try:
+            # A sync that finished while we were starting has already reset the TTL
+            self.config = self.load_config()
+
+            previous = self.get_cache()
+            remote_data = self.fetch(force=force)
+            if not remote_data:
+                return {"added": [], "changed": [], "removed": []}
+
+            diff = diff_registries(previous, remote_data)
+            remote_skills = remote_data.get('skills', {})
+            upserts = {skill_id: remote_skills[skill_id] for skill_id in diff['added'] + diff['changed']}
+
+            removed = []
+            for skill_id in diff['removed']:
+                local_skill = registry.get_skill(skill_id)
+                if local_skill is not None and skill_hash(local_skill) == skill_hash(previous['skills'][skill_id]):
+                    removed.append(skill_id)
+
+            meta = {key: value for key, value in remote_data.items() if key != 'skills'}
+            meta['stats'] = dict(meta.get('stats') or {})
+            meta['stats'].update({
+                'last_sync': datetime.now().isoformat(),
+                'remote_skills': len(remote_skills),
+            })
+
+            changes = registry.apply_changes(upserts, removed, meta)
+
+            # Only now is the remote copy the baseline for the next diff
+            self.persist(remote_data)
+            return changes
+        finally:
+            lock.release()
+
+    def refresh_in_background(self) -> bool:
+        """
+        Start a detached sync if the cache is stale (stale-while-revalidate)
+
+        The caller keeps answering from the local registry; the detached
+        update_registry.py process refreshes it for later calls.
+
+        Returns:
+            True if a refresher was started
+        """
+        if not self.should_refresh():
+            return False
+
+        # A failed sync (e.g. offline) leaves no cache; don't retry on every call
+        last_check = self.config['cache'].get('last_check')
+        try:
+            if last_check and datetime.now() - datetime.fromisoformat(last_check) < timedelta(minutes=self.RETRY_MINUTES):
+                return False
+        except ValueError:
+            pass
+
+        # Don't start a second refresher while one is running
+        lock = self._sync_lock()
+        if not lock.acquire(blocking=False):
+            return False
+        lock.release()
+
+        script = Path(__file__).parent.parent / "update_registry.py"
+        kwargs = {
+            "stdin": subprocess.DEVNULL,
+            "stdout": subprocess.DEVNULL,
+            "stderr": subprocess.DEVNULL,
+            "close_fds": True,
+        }
+        if sys.platform == 'win32':
+            kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            kwargs["start_new_session"] = True
+
+        try:
+            subprocess.Popen([sys.executable, str(script), "--config", str(self.config_path)], **kwargs)
+        except OSError:
+            return False
+        return True
 
     def get_cache(self) -> Optional[Dict[str, Any]]:
         """
@@ -0,0 +1,537 @@
+"""
+Search Index Module
+
+This module implements an inverted index over the skills registry, so
+searches resolve through posting lists instead of rescanning every skill.
+The index is persisted as tables of the SQLite registry store (see
+registry_store.StoredSearchIndex); SearchIndex itself builds the same
+structures in memory for Python builds without SQLite.
+"""
+
+import bisect
+import hashlib
+import heapq
+import json
+import math
+import re
+from typing import Dict, Iterable, List, Optional, Any, Set, Tuple
+
+
+TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens
+    """
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Compute the edit distance between two strings, giving up past a limit
+
+    Insertions, deletions, substitutions and transpositions of adjacent
+    characters each count as one edit.
+
+    Args:
+        a: First string
+        b: Second string
+        limit: Largest distance of interest
+
+    Returns:
+        The distance, or limit + 1 if it exceeds the limit
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous2 is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+
+def skill_hash(skill: Dict[str, Any]) -> str:
+    """
+    Compute a stable content hash for a skill entry
+
+    Args:
+        skill: Skill dictionary
+
+    Returns:
+        Hex digest of the skill's canonical JSON form
+    """
+    canonical = json.dumps(skill, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+def sort_facet_values(values: Dict[str, int]) -> Dict[str, int]:
+    """
+    Order facet value counts for display
+
+    Args:
+        values: Map of facet value -> count
+
+    Returns:
+        The same counts, most frequent value first (ties by value)
+    """
+    return dict(sorted(values.items(), key=lambda item: (-item[1], item[0])))
+
+
+class SearchIndex:
+    """
+    Token/n-gram inverted index over skills, ranked with BM25F
+
+    Queries only reach the index data through the lookup methods (doc_count()
+    to ordered_ids()), which StoredSearchIndex answers from SQLite; this
+    class keeps the data in memory.
+    """
+
+    # Facets skills can be filtered and counted by
+    FACETS = ('category', 'source', 'tag', 'author')
+
+    # Indexed fields, in the order their term frequencies are stored
+    FIELDS = ('name', 'description', 'tags')
+
+    # Relative weight of a term occurrence per field
+    FIELD_WEIGHTS = {'name': 3.0, 'tags': 2.0, 'description': 1.0}
+
+    # BM25 length normalization per field (0 = none, 1 = full)
+    FIELD_B = {'name': 0.3, 'tags': 0.5, 'description': 0.75}
+
+    # BM25 term frequency saturation
+    K1 = 1.2
+
+    # Score multiplier by how a query token matched an indexed term
+    # ('fuzzy' is divided by the number of edits)
+    MATCH_WEIGHTS = {'exact': 1.0, 'prefix': 0.6, 'substring': 0.3, 'fuzzy': 0.5}
+
+    # Size of the character n-grams used for substring and fuzzy lookups
+    NGRAM_SIZE = 3
+
+    # Query tokens shorter than this are never matched fuzzily
+    FUZZY_MIN_LENGTH = 4
+
+    def __init__(self):
+        """Initialize an empty in-memory index"""
+        # skill_id -> {"lengths", "position"}
+        self.docs: Dict[str, Dict[str, Any]] = {}
+        # term -> {skill_id: [term frequency per field in FIELDS order]}
+        self.postings: Dict[str, Dict[str, List[int]]] = {}
+        # n-gram -> set of terms containing it
+        self.ngrams: Dict[str, Set[str]] = {}
+        # facet name -> value -> set of skill ids
+        self.facets: Dict[str, Dict[str, Set[str]]] = {facet: {} for facet in self.FACETS}
+        self._vocabulary: Optional[List[str]] = None
+        self._average_lengths: Optional[List[float]] = None
+        self._order: Optional[List[str]] = None
+
+    @classmethod
+    def analyze(cls, skill: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract what the index records about a skill
+
+        Args:
+            skill: Skill dictionary
+
+        Returns:
+            Dictionary with 'terms' (term -> frequency per field in FIELDS
+            order), 'lengths' (token count per field) and 'facets' (list of
+            (facet, value) pairs)
+        """
+        metadata = skill.get('metadata', {}) or {}
+        fields = {
+            'name': tokenize(skill.get('name', '')),
+            'description': tokenize(skill.get('description', '')),
+            'tags': [token for tag in metadata.get('tags', []) or [] for token in tokenize(tag)],
+        }
+
+        frequencies: Dict[str, List[int]] = {}
+        for field_index, field in enumerate(cls.FIELDS):
+            for token in fields[field]:
+                counts = frequencies.setdefault(token, [0] * len(cls.FIELDS))
+                counts[field_index] += 1
+
+        facets = [
+            ('category', metadata.get('category')),
+            ('source', (skill.get('source', {}) or {}).get('type')),
+            ('author', metadata.get('author')),
+        ]
+        tags = {str(tag).strip().lower() for tag in metadata.get('tags', []) or [] if str(tag).strip()}
+        facets.extend(('tag', tag) for tag in sorted(tags))
+
+        return {
+            'terms': frequencies,
+            'lengths': [len(fields[field]) for field in cls.FIELDS],
+            'facets': [(facet, value) for facet, value in facets if value is not None],
+        }
+
+    @classmethod
+    def term_ngrams(cls, term: str) -> Set[str]:
+        """Get the character n-grams of a term"""
+        size = cls.NGRAM_SIZE
+        return {term[i:i + size] for i in range(len(term) - size + 1)}
+
+    def build(self, skills: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Index skills in registry order
+
+        Args:
+            skills: Map of skill_id -> skill dictionary
+        """
+        for position, (skill_id, skill) in enumerate(skills.items()):
+            entry = self.analyze(skill)
+            for term, counts in entry['terms'].items():
+                if term not in self.postings:
+                    self.postings[term] = {}
+                    for gram in self.term_ngrams(term):
+                        self.ngrams.setdefault(gram, set()).add(term)
+                self.postings[term][skill_id] = counts
+            for facet, value in entry['facets']:
+                self.facets.setdefault(facet, {}).setdefault(value, set()).add(skill_id)
+            self.docs[skill_id] = {'lengths': entry['lengths'], 'position': position}
+
+        self._vocabulary = None
+        self._average_lengths = None
+        self._order = None
+
+    # Lookups
+
+    def doc_count(self) -> int:
+        """Get the number of indexed skills"""
+        return len(self.docs)
+
+    def average_lengths(self) -> List[float]:
+        """Get the average token count of each field over all skills"""
+        if self._average_lengths is None:
+            totals = [0] * len(self.FIELDS)
+            for doc in self.docs.values():
+                for field_index, length in enumerate(doc.get('lengths', [])):
+                    totals[field_index] += length
+            count = max(len(self.docs), 1)
+            self._average_lengths = [max(total / count, 1.0) for total in totals]
+        return self._average_lengths
+
+    def term_postings(self, terms: Iterable[str]) -> Dict[str, Dict[str, Tuple[List[int], List[int]]]]:
+        """
+        Get the posting lists of indexed terms
+
+        Args:
+            terms: Indexed terms
+
+        Returns:
+            Map of term -> skill_id -> (frequency per field, skill's field lengths)
+        """
+        result = {}
+        for term in terms:
+            posting = self.postings.get(term, {})
+            result[term] = {
+                skill_id: (counts, self.docs.get(skill_id, {}).get('lengths') or [0] * len(self.FIELDS))
+                for skill_id, counts in posting.items()
+            }
+        return result
+
+    def _get_vocabulary(self) -> List[str]:
+        """Get the sorted vocabulary"""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        return self._vocabulary
+
+    def prefix_terms(self, token: str) -> List[str]:
+        """Get the indexed terms starting with a token (the token itself included)"""
+        vocabulary = self._get_vocabulary()
+        terms = []
+        for term in vocabulary[bisect.bisect_left(vocabulary, token):]:
+            if not term.startswith(token):
+                break
+            terms.append(term)
+        return terms
+
+    def substring_candidates(self, token: str) -> Iterable[str]:
+        """
+        Get the indexed terms that may contain a token
+
+        Tokens of at least NGRAM_SIZE characters are narrowed to the terms
+        holding all of their n-grams; shorter ones get the whole vocabulary.
+        """
+        if len(token) < self.NGRAM_SIZE:
+            return self._get_vocabulary()
+
+        candidates: Optional[Set[str]] = None
+        for gram in sorted(self.term_ngrams(token), key=lambda g: len(self.ngrams.get(g, ()))):
+            terms = self.ngrams.get(gram)
+            if not terms:
+                return set()
+            candidates = set(terms) if candidates is None else candidates & terms
+            if not candidates:
+                break
+        return candidates or set()
+
+    def fuzzy_candidates(self, token: str, limit: int) -> Iterable[str]:
+        """
+        Get the indexed terms that may be within `limit` edits of a token
+
+        Each edit changes at most NGRAM_SIZE of a term's n-grams, so a term
+        within `limit` edits shares at least len(grams) - limit * NGRAM_SIZE
+        of them with the token. When that bound is useless, every term of
+        a close enough length is a candidate.
+        """
+        grams = self.term_ngrams(token)
+        required = len(grams) - limit * self.NGRAM_SIZE
+
+        if required > 0:
+            shared: Dict[str, int] = {}
+            for gram in grams:
+                for term in self.ngrams.get(gram, ()):
+                    shared[term] = shared.get(term, 0) + 1
+            return [term for term, count in shared.items() if count >= required]
+
+        return [term for term in self._get_vocabulary() if abs(len(term) - len(token)) <= limit]
+
+    def facet_ids(self, facet: str, value: str) -> Set[str]:
+        """Get the ids of the skills with a facet value"""
+        return self.facets.get(facet, {}).get(value, set())
+
+    def facet_counts(self, ids: Optional[Set[str]] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Count skills per facet value
+
+        Args:
+            ids: Skills to count (default: all)
+
+        Returns:
+            Map of facet -> value -> count, most frequent value first
+        """
+        counts = {}
+        for facet in self.FACETS:
+            values = {}
+            for value, value_ids in self.facets.get(facet, {}).items():
+                if ids is None:
+                    count = len(value_ids)
+                elif len(value_ids) < len(ids):
+                    count = sum(1 for skill_id in value_ids if skill_id in ids)
+                else:
+                    count = sum(1 for skill_id in ids if skill_id in value_ids)
+                if count:
+                    values[value] = count
+            counts[facet] = sort_facet_values(values)
+        return counts
+
+    def ordered_ids(self, ids: Optional[Set[str]] = None) -> List[str]:
+        """
+        List skill ids in registry order
+
+        Args:
+            ids: Skills to include (default: all)
+
+        Returns:
+            Skill ids in registry order
+        """
+        if self._order is None:
+            self._order = sorted(self.docs, key=lambda skill_id: self.docs[skill_id].get('position', 0))
+        if ids is None:
+            return list(self._order)
+        return [skill_id for skill_id in self._order if skill_id in ids]
+
+    # Queries
+
+    def _fuzzy_terms(self, token: str) -> Dict[str, int]:
+        """
+        Find indexed terms within a small edit distance of a query token
+
+        Args:
+            token: Query token
+
+        Returns:
+            Map of matched term -> number of edits
+        """
+        if len(token) < self.FUZZY_MIN_LENGTH:
+            return {}
+
+        limit = 1 if len(token) < 8 else 2
+        matches = {}
+        for term in self.fuzzy_candidates(token, limit):
+            if term == token or abs(len(term) - len(token)) > limit:
+                continue
+            distance = edit_distance(token, term, limit)
+            if distance <= limit:
+                matches[term] = distance
+        return matches
+
+    def _match_terms(self, token: str) -> Dict[str, float]:
+        """
+        Find indexed terms matching a query token
+
+        Tokens with no exact or prefix match are looked up fuzzily, so a
+        typo still finds the intended term.
+
+        Args:
+            token: Query token
+
+        Returns:
+            Map of matched term -> match weight
+        """
+        matches: Dict[str, float] = {}
+
+        for term in self.prefix_terms(token):
+            matches[term] = self.MATCH_WEIGHTS['exact'] if term == token else self.MATCH_WEIGHTS['prefix']
+
+        if not matches:
+            for term, distance in self._fuzzy_terms(token).items():
+                matches[term] = self.MATCH_WEIGHTS['fuzzy'] / distance
+
+        for term in self.substring_candidates(token):
+            if term not in matches and token in term:
+                matches[term] = self.MATCH_WEIGHTS['substring']
+
+        return matches
+
+    def _term_scores(self, terms: Iterable[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Compute the BM25F score of terms for every skill containing them
+
+        Field frequencies are weighted and length-normalized per field,
+        summed, then saturated once, so repeating a word across fields
+        doesn't count as independent evidence.
+
+        Args:
+            terms: Indexed terms
+
+        Returns:
+            Map of term -> skill_id -> score
+        """
+        total = self.doc_count()
+        averages = self.average_lengths()
+        weights = [self.FIELD_WEIGHTS[field] for field in self.FIELDS]
+        b_values = [self.FIELD_B[field] for field in self.FIELDS]
+
+        scores = {}
+        for term, posting in self.term_postings(terms).items():
+            idf = math.log(1.0 + (total - len(posting) + 0.5) / (len(posting) + 0.5))
+            term_scores = {}
+            for skill_id, (counts, lengths) in posting.items():
+                frequency = 0.0
+                for field_index, count in enumerate(counts):
+                    if count:
+                        b_value = b_values[field_index]
+                        norm = 1.0 - b_value + b_value * lengths[field_index] / averages[field_index]
+                        frequency += weights[field_index] * count / norm
+                term_scores[skill_id] = idf * frequency / (self.K1 + frequency)
+            scores[term] = term_scores
+        return scores
+
+    def filter_ids(
+        self,
+        category: str = None,
+        source_type: str = None,
+        tag: str = None,
+        author: str = None
+    ) -> Optional[Set[str]]:
+        """
+        Resolve facet filters to a set of skill ids
+
+        Args:
+            category: Optional category filter
+            source_type: Optional source type filter
+            tag: Optional tag filter (case-insensitive)
+            author: Optional author filter
+
+        Returns:
+            Set of matching skill ids, or None if no filter was given
+        """
+        filters = (
+            ('category', category),
+            ('source', source_type),
+            ('tag', tag.strip().lower() if tag else None),
+            ('author', author),
+        )
+
+        allowed: Optional[Set[str]] = None
+        for facet, value in filters:
+            if not value:
+                continue
+            ids = self.facet_ids(facet, value)
+            allowed = set(ids) if allowed is None else allowed & ids
+        return allowed
+
+    def search(
+        self,
+        query: str,
+        category: str = None,
+        source_type: str = None,
+        limit: int = None,
+        tag: str = None,
+        author: str = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Search the index
+
+        Query tokens match skill names, descriptions and tags as whole
+        terms, prefixes, substrings or, failing those, within one or two
+        typos. Skills matching more of the query's tokens rank first; within
+        that, by BM25F score.
+
+        Args:
+            query: Search query string
+            category: Optional category filter
+            source_type: Optional source type filter
+            limit: Return only the best `limit` results
+            tag: Optional tag filter
+            author: Optional author filter
+
+        Returns:
+            List of (skill_id, score) tuples, best match first
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+
+        allowed = self.filter_ids(category, source_type, tag, author)
+        if allowed is not None and not allowed:
+            return []
+
+        # Score each token separately, keeping each skill's best match per token
+        totals: Dict[str, float] = {}
+        coverage: Dict[str, int] = {}
+        for token in tokens:
+            matches = self._match_terms(token)
+            scores: Dict[str, float] = {}
+            for term, term_scores in self._term_scores(matches).items():
+                match_weight = matches[term]
+                for skill_id, score in term_scores.items():
+                    if allowed is not None and skill_id not in allowed:
+                        continue
+                    score *= match_weight
+                    if score > scores.get(skill_id, 0.0):
+                        scores[skill_id] = score
+
+            for skill_id, score in scores.items():
+                totals[skill_id] = totals.get(skill_id, 0.0) + score
+                coverage[skill_id] = coverage.get(skill_id, 0) + 1
+
+        def rank(item):
+            return (-coverage[item[0]], -item[1], item[0])
+
+        if limit is not None:
+            # Partial selection: only the top `limit` results are ordered
+            return heapq.nsmallest(limit, totals.items(), key=rank)
+        return sorted(totals.items(), key=rank)
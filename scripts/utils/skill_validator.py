@@ -4,11 +4,16 @@ Skill Validation Module
 This module handles validation of skill directories and SKILL.md files.
 """
 
+import hashlib
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Tuple, List, Any
+from typing import Dict, Iterable, Iterator, Tuple, List, Any, Optional
 import yaml
 
+from .frontmatter import has_content, load_frontmatter, parse_frontmatter, read_frontmatter_text
+
 
 class SkillValidationError:
     """Represents a validation error"""
@@ -30,8 +35,73 @@ class SkillValidationError:
         return f"[{self.severity.upper()}] {self.field}: {self.message}"
 
 
+def scan_skill_directory(skill_path: Path) -> Dict[str, Any]:
+    """
+    Walk a skill directory once and describe its contents
+
+    Uses os.scandir, so file sizes and mtimes come from the directory
+    entries rather than a separate stat() per file. Symlinked directories
+    are not followed.
+
+    Args:
+        skill_path: Skill directory
+
+    Returns:
+        Manifest with 'files' (relative POSIX path -> {'size', 'extension',
+        'mtime'}, mtime in nanoseconds), 'dirs' (set of relative directory
+        paths) and 'total_size'
+    """
+    files = {}
+    dirs = set()
+    total_size = 0
+
+    pending = [(str(skill_path), '')]
+    while pending:
+        dir_path, prefix = pending.pop()
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                rel_path = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.add(rel_path)
+                    pending.append((entry.path, rel_path + '/'))
+                elif entry.is_file():
+                    stat = entry.stat()
+                    files[rel_path] = {
+                        'size': stat.st_size,
+                        'extension': os.path.splitext(entry.name)[1].lstrip('.'),
+                        'mtime': stat.st_mtime_ns,
+                    }
+                    total_size += stat.st_size
+
+    return {'files': files, 'dirs': dirs, 'total_size': total_size}
+
+
+def manifest_fingerprint(manifest: Dict[str, Any]) -> str:
+    """
+    Hash the paths, sizes and mtimes of a directory manifest
+
+    Any file being added, removed, resized or touched changes the
+    fingerprint; file contents are not read.
+
+    Args:
+        manifest: Manifest from scan_skill_directory()
+
+    Returns:
+        Hex SHA-256 fingerprint
+    """
+    digest = hashlib.sha256()
+    for rel_path, info in sorted(manifest['files'].items()):
+        digest.update(f"{rel_path}\0{info['size']}\0{info['mtime']}\n".encode('utf-8', 'surrogateescape'))
+    return digest.hexdigest()
+
+
 class SkillValidator:
-    """Validates skill directories and SKILL.md files"""
+    """
+    Validates skill directories and SKILL.md files
+
+    Results are returned rather than kept on the instance, so one validator
+    can be shared between threads.
+    """
 
     # Required fields in SKILL.md frontmatter
     REQUIRED_FIELDS = ['name', 'description']
@@ -39,10 +109,8 @@ class SkillValidator:
     # Maximum allowed skill size (10MB)
     MAX_SKILL_SIZE_BYTES = 10 * 1024 * 1024
 
-    def __init__(self):
-        """Initialize the validator"""
-        self.errors: List[SkillValidationError] = []
-        self.warnings: List[SkillValidationError] = []
+    # Bump when the checks change, so cached results are discarded
+    RULES_VERSION = 2
 
     def validate_skill_directory(self, skill_path: str) -> Tuple[bool, List[SkillValidationError]]:
         """
@@ -54,39 +122,89 @@ class SkillValidator:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        self.errors = []
-        self.warnings = []
-
         path = Path(skill_path)
 
         # Check if path exists
         if not path.exists():
-            self.errors.append(SkillValidationError(
+            return False, [SkillValidationError(
                 "path",
                 f"Skill directory does not exist: {skill_path}"
-            ))
-            return False, self.errors
+            )]
 
         # Check if it's a directory
         if not path.is_dir():
-            self.errors.append(SkillValidationError(
+            return False, [SkillValidationError(
                 "path",
                 f"Path is not a directory: {skill_path}"
-            ))
-            return False, self.errors
+            )]
 
         # Check for path traversal attempts
         if '..' in str(path):
-            self.errors.append(SkillValidationError(
+            return False, [SkillValidationError(
                 "path",
                 f"Path contains path traversal characters: {skill_path}"
-            ))
-            return False, self.errors
+            )]
+
+        # One walk of the tree feeds every check below
+        manifest = scan_skill_directory(path)
+        return self._validate_manifest(path, manifest)
+
+    def validate_cached(
+        self,
+        skill_path: str,
+        cached: Optional[Dict[str, Any]] = None
+    ) -> Tuple[bool, List[SkillValidationError], Dict[str, Any]]:
+        """
+        Validate a skill directory, reusing an earlier result if nothing changed
+
+        The directory is fingerprinted from its file paths, sizes and mtimes
+        (see manifest_fingerprint()). If that matches the cached entry, the
+        cached verdict is returned without reading any file.
+
+        Args:
+            skill_path: Path to the skill directory
+            cached: Cache entry returned by an earlier call, if any
+
+        Returns:
+            Tuple of (is_valid, list_of_errors, cache_entry). cache_entry is
+            `cached` itself on a hit, otherwise a new entry to store.
+        """
+        path = Path(skill_path)
+        if not path.is_dir() or '..' in str(path):
+            is_valid, errors = self.validate_skill_directory(skill_path)
+            return is_valid, errors, {}
+
+        manifest = scan_skill_directory(path)
+        fingerprint = f"v{self.RULES_VERSION}:{manifest_fingerprint(manifest)}"
+
+        if cached and cached.get('fingerprint') == fingerprint:
+            errors = [
+                SkillValidationError(error['field'], error['message'], error['severity'])
+                for error in cached.get('errors', [])
+            ]
+            return cached.get('is_valid', False), errors, cached
+
+        is_valid, errors = self._validate_manifest(path, manifest)
+        entry = {
+            'fingerprint': fingerprint,
+            'is_valid': is_valid,
+            'errors': [
+                {'field': error.field, 'message': error.message, 'severity': error.severity}
+                for error in errors
+            ],
+        }
+        return is_valid, errors, entry
+
+    def _validate_manifest(self, path: Path, manifest: Dict[str, Any]) -> Tuple[bool, List[SkillValidationError]]:
+        """Run the checks on a scanned skill directory"""
+        skill_path = str(path)
+        errors: List[SkillValidationError] = []
+        warnings: List[SkillValidationError] = []
 
         # Check total size
-        total_size = sum(f.stat().st_size for f in path.rglob('*') if f.is_file())
+        total_size = manifest['total_size']
         if total_size > self.MAX_SKILL_SIZE_BYTES:
-            self.warnings.append(SkillValidationError(
+            warnings.append(SkillValidationError(
                 "size",
                 f"Skill size ({total_size / 1024 / 1024:.2f}MB) exceeds recommended limit ({self.MAX_SKILL_SIZE_BYTES / 1024 / 1024}MB)",
                 "warning"
@@ -94,62 +212,69 @@ class SkillValidator:
 
         # Check for SKILL.md
         skill_md_path = path / "SKILL.md"
-        if not skill_md_path.exists():
-            self.errors.append(SkillValidationError(
+        if "SKILL.md" not in manifest['files']:
+            errors.append(SkillValidationError(
                 "SKILL.md",
                 f"Required file SKILL.md not found in {skill_path}"
             ))
-            return False, self.errors
+            return False, errors
 
         # Validate SKILL.md
-        self._validate_skill_md(skill_md_path)
+        self._validate_skill_md(skill_md_path, errors, warnings)
 
         # Check for optional directories
-        self._validate_optional_directories(path)
+        self._validate_optional_directories(manifest, warnings)
 
-        return len(self.errors) == 0, self.errors + self.warnings
+        return len(errors) == 0, errors + warnings
 
-    def _validate_skill_md(self, skill_md_path: Path) -> None:
+    def _validate_skill_md(
+        self,
+        skill_md_path: Path,
+        errors: List[SkillValidationError],
+        warnings: List[SkillValidationError]
+    ) -> None:
         """
         Validate SKILL.md file
 
         Args:
             skill_md_path: Path to SKILL.md file
+            errors: List that errors are appended to
+            warnings: List that warnings are appended to
         """
         try:
             with open(skill_md_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Check if file is empty
-            if not content.strip():
-                self.errors.append(SkillValidationError(
-                    "SKILL.md",
-                    "SKILL.md file is empty"
-                ))
-                return
-
-            # Extract YAML frontmatter
-            frontmatter = self._extract_frontmatter(content)
-
-            if frontmatter is None:
-                self.errors.append(SkillValidationError(
-                    "SKILL.md",
-                    "No YAML frontmatter found. SKILL.md must start with ---"
-                ))
-                return
+                # Read up to the closing ---; the body is only checked for being non-empty
+                frontmatter = read_frontmatter_text(f)
+                body_has_content = frontmatter is not None and has_content(f)
+
+                if frontmatter is None:
+                    f.seek(0)
+                    # Check if file is empty
+                    if not has_content(f):
+                        errors.append(SkillValidationError(
+                            "SKILL.md",
+                            "SKILL.md file is empty"
+                        ))
+                        return
+
+                    errors.append(SkillValidationError(
+                        "SKILL.md",
+                        "No YAML frontmatter found. SKILL.md must start with ---"
+                    ))
+                    return
 
             # Parse YAML
             try:
-                metadata = yaml.safe_load(frontmatter)
+                metadata = parse_frontmatter(frontmatter)
             except yaml.YAMLError as e:
-                self.errors.append(SkillValidationError(
+                errors.append(SkillValidationError(
                     "SKILL.md",
                     f"Invalid YAML in frontmatter: {str(e)}"
                 ))
                 return
 
             if not isinstance(metadata, dict):
-                self.errors.append(SkillValidationError(
+                errors.append(SkillValidationError(
                     "SKILL.md",
                     "YAML frontmatter must be a dictionary/object"
                 ))
@@ -158,12 +283,12 @@ class SkillValidator:
             # Check required fields
             for field in self.REQUIRED_FIELDS:
                 if field not in metadata:
-                    self.errors.append(SkillValidationError(
+                    errors.append(SkillValidationError(
                         f"frontmatter.{field}",
                         f"Required field '{field}' is missing"
                     ))
                 elif not metadata[field] or not str(metadata[field]).strip():
-                    self.errors.append(SkillValidationError(
+                    errors.append(SkillValidationError(
                         f"frontmatter.{field}",
                         f"Required field '{field}' is empty"
                     ))
@@ -172,54 +297,33 @@ class SkillValidator:
             if 'name' in metadata:
                 name = metadata['name']
                 if not re.match(r'^[a-z0-9-]+$', name):
-                    self.warnings.append(SkillValidationError(
+                    warnings.append(SkillValidationError(
                         "frontmatter.name",
                         "Skill name should contain only lowercase letters, numbers, and hyphens",
                         "warning"
                     ))
 
             # Check content after frontmatter
-            content_after_frontmatter = content.split('---', 2)[-1].strip()
-            if not content_after_frontmatter:
-                self.warnings.append(SkillValidationError(
+            if not body_has_content:
+                warnings.append(SkillValidationError(
                     "SKILL.md",
                     "SKILL.md has no content after frontmatter",
                     "warning"
                 ))
 
         except Exception as e:
-            self.errors.append(SkillValidationError(
+            errors.append(SkillValidationError(
                 "SKILL.md",
                 f"Error reading SKILL.md: {str(e)}"
             ))
 
-    def _extract_frontmatter(self, content: str) -> str:
-        """
-        Extract YAML frontmatter from markdown content
-
-        Args:
-            content: Markdown file content
-
-        Returns:
-            YAML frontmatter string or None if not found
-        """
-        # Check if content starts with ---
-        if not content.startswith('---'):
-            return None
-
-        # Find the closing ---
-        parts = content.split('---', 2)
-        if len(parts) < 3:
-            return None
-
-        return parts[1].strip()
-
-    def _validate_optional_directories(self, skill_path: Path) -> None:
+    def _validate_optional_directories(self, manifest: Dict[str, Any], warnings: List[SkillValidationError]) -> None:
         """
         Validate optional skill directories
 
         Args:
-            skill_path: Path to skill directory
+            manifest: Skill directory manifest from scan_skill_directory()
+            warnings: List that warnings are appended to
         """
         optional_dirs = {
             'scripts': ['py', 'sh', 'bash'],
@@ -228,28 +332,27 @@ class SkillValidator:
         }
 
         for dir_name, allowed_extensions in optional_dirs.items():
-            dir_path = skill_path / dir_name
-            if dir_path.exists():
-                # Check if it's a directory
-                if not dir_path.is_dir():
-                    self.warnings.append(SkillValidationError(
-                        dir_name,
-                        f"{dir_name} exists but is not a directory",
-                        "warning"
-                    ))
-                    continue
-
-                # Check file extensions if specified
-                if allowed_extensions:
-                    for file_path in dir_path.rglob('*'):
-                        if file_path.is_file():
-                            ext = file_path.suffix.lstrip('.')
-                            if ext and ext not in allowed_extensions:
-                                self.warnings.append(SkillValidationError(
-                                    f"{dir_name}/files",
-                                    f"File {file_path.name} has unexpected extension .{ext}",
-                                    "warning"
-                                ))
+            if dir_name in manifest['files']:
+                warnings.append(SkillValidationError(
+                    dir_name,
+                    f"{dir_name} exists but is not a directory",
+                    "warning"
+                ))
+                continue
+
+            # Check file extensions if specified
+            if dir_name in manifest['dirs'] and allowed_extensions:
+                prefix = dir_name + '/'
+                for rel_path, info in sorted(manifest['files'].items()):
+                    if not rel_path.startswith(prefix):
+                        continue
+                    ext = info['extension']
+                    if ext and ext not in allowed_extensions:
+                        warnings.append(SkillValidationError(
+                            f"{dir_name}/files",
+                            f"File {rel_path.rsplit('/', 1)[-1]} has unexpected extension .{ext}",
+                            "warning"
+                        ))
 
     def parse_skill_md(self, skill_path: str) -> Dict[str, Any]:
         """
@@ -261,24 +364,7 @@ class SkillValidator:
         Returns:
             Dictionary containing parsed metadata
         """
-        skill_md_path = Path(skill_path) / "SKILL.md"
-
-        if not skill_md_path.exists():
-            return {}
-
-        try:
-            with open(skill_md_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            frontmatter = self._extract_frontmatter(content)
-            if frontmatter is None:
-                return {}
-
-            metadata = yaml.safe_load(frontmatter)
-            return metadata if isinstance(metadata, dict) else {}
-
-        except Exception:
-            return {}
+        return load_frontmatter(Path(skill_path) / "SKILL.md")
 
     def format_errors(self, errors: List[SkillValidationError]) -> str:
         """
@@ -300,6 +386,52 @@ class SkillValidator:
         return '\n'.join(lines)
 
 
+def _validate_one(skill_path: str, cached: Optional[Dict[str, Any]]) -> Tuple[bool, List[SkillValidationError], Dict[str, Any]]:
+    """Pool task for validate_all(); module-level so it can run in a worker process"""
+    return SkillValidator().validate_cached(skill_path, cached)
+
+
+def validate_all(
+    skill_paths: Iterable[str],
+    workers: int = None,
+    cache: Dict[str, Dict[str, Any]] = None,
+    processes: bool = False
+) -> Iterator[Tuple[str, bool, List[SkillValidationError], Dict[str, Any]]]:
+    """
+    Validate many skill directories concurrently
+
+    Results are yielded as each skill finishes, not in input order.
+
+    Args:
+        skill_paths: Skill directories to validate
+        workers: Pool size (default: one per CPU)
+        cache: Optional map of skill path -> cache entry from an earlier run
+            (see SkillValidator.validate_cached())
+        processes: Validate in worker processes rather than threads, so
+            YAML parsing of many skills uses every core
+
+    Yields:
+        Tuples of (skill_path, is_valid, list_of_errors, cache_entry)
+    """
+    skill_paths = list(skill_paths)
+    cache = cache or {}
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(skill_paths) <= 1:
+        for skill_path in skill_paths:
+            yield (skill_path,) + _validate_one(skill_path, cache.get(skill_path))
+        return
+
+    pool_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with pool_class(max_workers=min(workers, len(skill_paths))) as executor:
+        futures = {
+            executor.submit(_validate_one, skill_path, cache.get(skill_path)): skill_path
+            for skill_path in skill_paths
+        }
+        for future in as_completed(futures):
+            yield (futures[future],) + future.result()
+
+
 def validate_skill_directory(skill_path: str) -> Tuple[bool, str]:
     """
     Convenience function to validate a skill directory
@@ -0,0 +1,275 @@
+"""
+Streaming ZIP Extraction Module
+
+This module extracts part of a ZIP archive while it is being downloaded,
+by walking the local file headers in order. Only members under the wanted
+path are decompressed and written; everything else is skipped, so memory
+and disk use are bounded by the extracted files, not by the archive.
+"""
+
+import struct
+import zipfile
+import zlib
+from pathlib import Path, PurePosixPath
+from typing import Iterable, Iterator, Optional
+
+
+LOCAL_HEADER_SIGNATURE = 0x04034b50
+CENTRAL_HEADER_SIGNATURE = 0x02014b50
+END_OF_CENTRAL_DIR_SIGNATURE = 0x06054b50
+DATA_DESCRIPTOR_SIGNATURE = 0x08074b50
+
+LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')
+
+FLAG_ENCRYPTED = 0x01
+FLAG_DATA_DESCRIPTOR = 0x08
+
+METHOD_STORED = 0
+METHOD_DEFLATED = 8
+
+
+class ZipStreamError(Exception):
+    """Raised when an archive can't be extracted in streaming mode"""
+
+
+class _ChunkReader:
+    """Exact-size reads over an iterator of byte chunks"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._buffer = b''
+
+    def _fill(self) -> bool:
+        """Pull the next non-empty chunk into the buffer"""
+        for chunk in self._chunks:
+            if chunk:
+                self._buffer += chunk
+                return True
+        return False
+
+    def read_exact(self, size: int) -> bytes:
+        """Read exactly size bytes"""
+        while len(self._buffer) < size:
+            if not self._fill():
+                raise ZipStreamError("Unexpected end of archive")
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def read_some(self, limit: int) -> bytes:
+        """Read between 1 and limit bytes"""
+        if not self._buffer and not self._fill():
+            raise ZipStreamError("Unexpected end of archive")
+        data, self._buffer = self._buffer[:limit], self._buffer[limit:]
+        return data
+
+    def unread(self, data: bytes) -> None:
+        """Push bytes back to the front of the stream"""
+        self._buffer = data + self._buffer
+
+
+def _safe_relative_path(name: str) -> Optional[PurePosixPath]:
+    """Reject absolute paths and '..' components in member names"""
+    path = PurePosixPath(name)
+    if path.is_absolute() or any(part in ('..', '') for part in path.parts):
+        return None
+    return path
+
+
+def _zip64_sizes(extra: bytes, compressed_size: int, size: int):
+    """Read real sizes from a ZIP64 extra field when the header holds placeholders"""
+    offset = 0
+    while offset + 4 <= len(extra):
+        header_id, length = struct.unpack_from('<HH', extra, offset)
+        if header_id == 0x0001:
+            values = extra[offset + 4:offset + 4 + length]
+            position = 0
+            if size == 0xFFFFFFFF:
+                size = struct.unpack_from('<Q', values, position)[0]
+                position += 8
+            if compressed_size == 0xFFFFFFFF:
+                compressed_size = struct.unpack_from('<Q', values, position)[0]
+            return compressed_size, size, True
+        offset += 4 + length
+    return compressed_size, size, False
+
+
+def extract_zip_stream(
+    chunks: Iterable[bytes],
+    member_path: str,
+    dest_dir: str,
+    strip_root: bool = True,
+    chunk_size: int = 65536
+) -> int:
+    """
+    Extract the members under one directory of a streamed ZIP archive
+
+    Args:
+        chunks: Iterable of archive bytes (e.g. response.iter_content())
+        member_path: Directory inside the archive to extract, e.g. "skills/pdf"
+        dest_dir: Directory the member's contents are written to
+        strip_root: Treat the archive's single top-level directory (as in
+            GitHub zipballs, "{owner}-{repo}-{sha}/") as the root
+        chunk_size: Bytes processed per step
+
+    Returns:
+        Number of files written
+
+    Raises:
+        ZipStreamError: If the archive uses a layout that can't be streamed
+    """
+    reader = _ChunkReader(chunks)
+    dest_path = Path(dest_dir)
+    member_path = member_path.strip('/')
+    prefix = None if strip_root else f"{member_path}/"
+    written = 0
+
+    while True:
+        signature = struct.unpack('<I', reader.read_exact(4))[0]
+        if signature in (CENTRAL_HEADER_SIGNATURE, END_OF_CENTRAL_DIR_SIGNATURE):
+            break
+        if signature != LOCAL_HEADER_SIGNATURE:
+            raise ZipStreamError(f"Unexpected record signature 0x{signature:08x}")
+
+        (_, _, flags, method, _, _, crc, compressed_size, size,
+         name_length, extra_length) = LOCAL_HEADER.unpack(
+            struct.pack('<I', signature) + reader.read_exact(LOCAL_HEADER.size - 4)
+        )
+        name = reader.read_exact(name_length).decode('utf-8' if flags & 0x800 else 'cp437')
+        extra = reader.read_exact(extra_length)
+        compressed_size, size, is_zip64 = _zip64_sizes(extra, compressed_size, size)
+
+        if flags & FLAG_ENCRYPTED:
+            raise ZipStreamError(f"Encrypted member not supported: {name}")
+        if method not in (METHOD_STORED, METHOD_DEFLATED):
+            raise ZipStreamError(f"Unsupported compression method {method}: {name}")
+
+        has_descriptor = bool(flags & FLAG_DATA_DESCRIPTOR)
+        if has_descriptor and method == METHOD_STORED:
+            raise ZipStreamError(f"Stored member with deferred size can't be streamed: {name}")
+
+        if prefix is None:
+            # The first entry names the archive's top-level directory
+            root = name.split('/', 1)[0]
+            prefix = f"{root}/{member_path}/"
+
+        target = None
+        if name.startswith(prefix) and len(name) > len(prefix):
+            relative = _safe_relative_path(name[len(prefix):].rstrip('/'))
+            if relative is None:
+                raise ZipStreamError(f"Unsafe member path: {name}")
+            target = dest_path.joinpath(*relative.parts)
+
+        is_dir = name.endswith('/')
+        output = None
+        if target is not None:
+            if is_dir:
+                target.mkdir(parents=True, exist_ok=True)
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                output = open(target, 'wb')
+
+        try:
+            actual_crc = 0
+            if method == METHOD_DEFLATED:
+                decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                remaining = None if has_descriptor else compressed_size
+                while not decompressor.eof:
+                    if remaining == 0:
+                        raise ZipStreamError(f"Truncated member: {name}")
+                    data = reader.read_some(chunk_size if remaining is None else min(chunk_size, remaining))
+                    if remaining is not None:
+                        remaining -= len(data)
+                    if output is None and not has_descriptor:
+                        # Skipped member with a known size: no need to inflate it
+                        if remaining == 0:
+                            break
+                        continue
+                    plain = decompressor.decompress(data)
+                    if output is not None:
+                        output.write(plain)
+                        actual_crc = zlib.crc32(plain, actual_crc)
+                if decompressor.unused_data:
+                    reader.unread(decompressor.unused_data)
+            else:
+                remaining = compressed_size
+                while remaining:
+                    data = reader.read_some(min(chunk_size, remaining))
+                    remaining -= len(data)
+                    if output is not None:
+                        output.write(data)
+                        actual_crc = zlib.crc32(data, actual_crc)
+        finally:
+            if output is not None:
+                output.close()
+
+        if has_descriptor:
+            head = reader.read_exact(4)
+            if struct.unpack('<I', head)[0] != DATA_DESCRIPTOR_SIGNATURE:
+                reader.unread(head)
+            descriptor = reader.read_exact(20 if is_zip64 else 12)
+            crc = struct.unpack_from('<I', descriptor)[0]
+
+        if output is not None:
+            if actual_crc != crc:
+                target.unlink()
+                raise ZipStreamError(f"CRC mismatch for {name}")
+            written += 1
+
+    return written
+
+
+def extract_zip_file(
+    zip_path: str,
+    member_path: str,
+    dest_dir: str,
+    strip_root: bool = True
+) -> int:
+    """
+    Extract the members under one directory of a ZIP file on disk
+
+    Used when an archive can't be streamed. Members are copied straight to
+    their final location.
+
+    Args:
+        zip_path: Path to the ZIP file, or a seekable file object
+        member_path: Directory inside the archive to extract
+        dest_dir: Directory the member's contents are written to
+        strip_root: Treat the archive's single top-level directory as the root
+
+    Returns:
+        Number of files written
+    """
+    dest_path = Path(dest_dir)
+    member_path = member_path.strip('/')
+    written = 0
+
+    with zipfile.ZipFile(zip_path, 'r') as archive:
+        names = archive.namelist()
+        if not names:
+            return 0
+
+        root = names[0].split('/', 1)[0] + '/' if strip_root else ''
+        prefix = f"{root}{member_path}/"
+
+        for info in archive.infolist():
+            if not info.filename.startswith(prefix) or len(info.filename) <= len(prefix):
+                continue
+            relative = _safe_relative_path(info.filename[len(prefix):].rstrip('/'))
+            if relative is None:
+                raise ZipStreamError(f"Unsafe member path: {info.filename}")
+            target = dest_path.joinpath(*relative.parts)
+
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with archive.open(info) as source, open(target, 'wb') as output:
+                while True:
+                    data = source.read(65536)
+                    if not data:
+                        break
+                    output.write(data)
+            written += 1
+
+    return written
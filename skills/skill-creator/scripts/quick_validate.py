@@ -9,6 +9,20 @@ import re
 import yaml
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as Loader
+except ImportError:
+    from yaml import SafeLoader as Loader
+
+def read_frontmatter(f):
+    """Read frontmatter lines up to the closing --- without reading the body (None if unclosed)"""
+    lines = []
+    for line in f:
+        if line.rstrip() == '---':
+            return ''.join(lines)
+        lines.append(line)
+    return None
+
 def validate_skill(skill_path):
     """Basic validation of a skill"""
     skill_path = Path(skill_path)
@@ -19,20 +33,18 @@ def validate_skill(skill_path):
         return False, "SKILL.md not found"
 
     # Read and validate frontmatter
-    content = skill_md.read_text()
-    if not content.startswith('---'):
-        return False, "No YAML frontmatter found"
+    with open(skill_md, 'r', encoding='utf-8') as f:
+        if f.readline().rstrip() != '---':
+            return False, "No YAML frontmatter found"
 
-    # Extract frontmatter
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if not match:
+        # Extract frontmatter
+        frontmatter_text = read_frontmatter(f)
+    if frontmatter_text is None:
         return False, "Invalid frontmatter format"
 
-    frontmatter_text = match.group(1)
-
     # Parse YAML frontmatter
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
+        frontmatter = yaml.load(frontmatter_text, Loader=Loader)
         if not isinstance(frontmatter, dict):
             return False, "Frontmatter must be a YAML dictionary"
     except yaml.YAMLError as e: